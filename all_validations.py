@@ -1,324 +1,348 @@
+import functools
 import re
-#EMAIL VALIDATION.
-# Validation function
-def validate_email(email):
-    # Check for exactly one @ symbol
-    if email.count('@') != 1:
-        return "Invalid: Missing or multiple @ symbols"
-
-    username, domain_part = email.split('@')
-
-    # Username: letters, digits, dot, dash, underscore
-    if not re.fullmatch(r'[\w\.-]+', username):
-        return "Invalid: Username contains illegal characters or spaces"
-
-    # Domain must contain at least one dot
-    if '.' not in domain_part:
-        return "Invalid: Domain missing '.'"
-
-    # Split domain into parts
-    domain_parts = domain_part.split('.')
-    for part in domain_parts[:-1]:
-        if not re.fullmatch(r'[\w-]+', part):
-            return f"Invalid: Domain name part '{part}' contains illegal characters"
-
-    # Top-level domain check
-    if not re.fullmatch(r'[a-zA-Z]{2,}', domain_parts[-1]):
-        return f"Invalid: Top-level domain '{domain_parts[-1]}' is invalid"
-
-    return "Valid email"
-file_path = r"api_response.txt"
-try:
-    with open(file_path, 'r') as file:
-        text = file.read()
-except FileNotFoundError:
-    print(f"Error: File not found at {file_path}")
-    exit()
-
-# Step 1: Extract standard emails (with @)
-emails_with_at = re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-
-# Step 2: Extract "email-like" strings without @ but containing a dot
-emails_without_at = re.findall(r'\b[\w\.-]+\.[\w\.-]+\b', text)
-
-# Step 2a: Remove purely numeric strings (e.g., 123.456)
-emails_without_at = [
-    e for e in emails_without_at 
-    # Remove purely numeric strings
-    if not re.fullmatch(r'[\d\.]+', e)
-    # Keep only if there's at least one letter before the first dot
-    and re.search(r'[a-zA-Z]', e.split('.')[0])
-]
-
-# Step 3: Combine both lists, remove duplicates
-all_email_candidates = list(set(emails_with_at + emails_without_at))
-
-# Step 4: Validate each candidate
-print("\nEmail Validation Results:")
-for email in all_email_candidates:
-    result = validate_email(email)
-    print(f"{email}: {result}")
-
-
-
-#TIME VALIDATION
-# Validation function 
-def validate_time(candidate):
+import sys
+import time
+
+from extractors.emails import (
+    validate_email, email_with_at_pattern, email_without_at_pattern, is_email_like
+)
+from extractors.times import (
+    compiled_time_scanner, groups_message, validate_time, time_candidate_pattern, time_source
+)
+from extractors.credit_cards import validate_credit_card, cc_pattern
+from extractors.currencies import validate_currency
+from extractors.phones import validate_phone, phone_pattern, is_credit_card_like
+from extractors.cli import read_input
+from currency_table import DEFAULT_TABLE, trie_pattern
+from dedup import ExactDedup, unique
+
+# The per-type validators and candidate patterns live in the extractors package;
+# this module combines them into one scan over the text.
+
+##SINGLE-PASS EXTRACTION ENGINE
+# Every extractor pattern is wrapped in its own lookahead group, so one scan over the
+# text tests all of them at each position instead of running six separate findall passes.
+# The conditional after the lookaheads only keeps the groups when at least one extractor starts there.
+def entity_patterns(table=DEFAULT_TABLE):
+    """(name, pattern) for every extractor, with currency markers from table."""
+    return [
+        ('email_at', email_with_at_pattern),
+        ('email_no_at', email_without_at_pattern),
+        ('time', time_candidate_pattern),
+        ('credit_card', cc_pattern),
+        ('currency', table.candidate_pattern),
+        ('phone', phone_pattern),
+    ]
+
+ENTITY_PATTERNS = entity_patterns()
+ENTITY_NAMES = [name for name, _ in ENTITY_PATTERNS]
+
+# Text where no extractor can start is consumed possessively before the lookaheads run:
+# characters outside [\w.\-+(] and the currency symbols, and letter-only words that are
+# not followed by [\w.@-] (or the symbol of a marker like 'R$') and can't be a currency
+# code in front of an amount. On prose-heavy responses this skips most positions.
+# Words are only tried from their first letter and taken possessively: whether a word
+# can be skipped depends only on where it ends, so retrying it from each later letter
+# (after a word that couldn't be skipped, e.g. a long local part before '@') would
+# only repeat the same failing scan.
+def build_skip_pattern(table=DEFAULT_TABLE):
+    symbols = ''.join(re.escape(ch) for ch in table.symbol_chars)
+    followers = ''.join(re.escape(ch) for ch in table.word_followers)
+    # Lookbehind needs a fixed width, so codes are grouped by length
+    by_length = {}
+    for marker in table.word_markers:
+        by_length.setdefault(len(marker), []).append(marker)
+    not_a_code = ''.join(f'(?<!{table.group(trie_pattern(markers))})' for markers in by_length.values())
+    return (r'(?:[^\w.\-+(' + symbols + r']+'
+            + r'|(?<![^\W\d_])[^\W\d_]++(?![\w.@' + followers + r'-])(?:(?!\s*\d)|' + not_a_code + '))*+')
+
+# The possessive quantifiers (++ and *+) need Python 3.11 or later
+skip_pattern = build_skip_pattern()
+
+def build_combined_source(table=DEFAULT_TABLE, time_groups=False):
     """
-    candidate: string matched like '14:30', '2:30 PM', '12:59am', '00:00'
-    Returns a descriptive validation string.
+    Source of the single-pass pattern; compile it to scan() with another currency table.
+    time_groups: also capture the parts of each time (see scan()'s times)
     """
-    # Normalize whitespace and uppercase AM/PM
-    s = candidate.strip()
-    # Extract optional AM/PM (case-insensitive)
-    m = re.fullmatch(r'(\d{1,2}):(\d{2})(?:\s*([AaPp][Mm]))?', s)
-    if not m:
-        return "Invalid: Doesn't match H:MM or H:MM AM/PM pattern"
-
-    hour_str, minute_str, ampm = m.group(1), m.group(2), m.group(3)
-
-    # Convert to ints, but guard against non-numeric (shouldn't happen from regex)
-    try:
-        hour = int(hour_str)
-        minute = int(minute_str)
-    except ValueError:
-        return "Invalid: Non-numeric hour or minute"
-
-    # Validate minute range universally
-    if not (0 <= minute <= 59):
-        return "Invalid: Minute out of range (0-59)"
-
-    # If AM/PM present -> treat as 12-hour format
-    if ampm:
-        # Accept 1..12 for hours in 12-hour format (0 not allowed)
-        if not (1 <= hour <= 12):
-            return "Invalid: Hour out of range for 12-hour format (1-12)"
-        return f"Valid 12-hour time (normalized: {hour:02d}:{minute:02d} {ampm.upper()})"
-    else:
-        # No AM/PM -> treat as 24-hour format
-        if not (0 <= hour <= 23):
-            return "Invalid: Hour out of range for 24-hour format (0-23)"
-        return f"Valid 24-hour time (normalized: {hour:02d}:{minute:02d})"
-
-# Read interleaved API response
-file_path = r"api_response.txt"
-try:
-    with open(file_path, 'r', encoding='utf-8') as f:
-        text = f.read()
-except FileNotFoundError:
-    print(f"Error: File not found at {file_path}")
-    raise SystemExit(1)
-
-# Candidate extraction:
-# Match patterns like '2:30 PM', '14:30', '00:00', '2:30PM' (optional space), case-insensitive AM/PM
-time_candidate_pattern = r'\b\d{1,2}:\d{2}(?:\s*[AaPp][Mm])?\b'
-
-candidates = re.findall(time_candidate_pattern, text)
-# Deduplicate while preserving order
-seen = set()
-candidates_unique = []
-for c in candidates:
-    cc = c.strip()
-    if cc not in seen:
-        seen.add(cc)
-        candidates_unique.append(cc)
-
-# Validate and print
-print("\nTime Validation Results:")
-for cand in candidates_unique:
-    result = validate_time(cand)
-    print(f"{cand}: {result}")
-
-
-
-##CREDIT CARD VALIDATION
-# Issuer detection function
-def detect_issuer(clean_card):
-    # Visa: starts with 4, usually 13 or 16 digits
-    if clean_card.startswith('4') and len(clean_card) in (13, 16):
-        return 'Visa'
-    # American Express: starts with 34 or 37, 15 digits
-    if clean_card[:2] in ('34', '37') and len(clean_card) == 15:
-        return 'American Express'
-    # MasterCard: 51-55 OR 2221-2720, usually 16 digits
-    start2 = int(clean_card[:2]) if len(clean_card) >= 2 and clean_card[:2].isdigit() else -1
-    start4 = int(clean_card[:4]) if len(clean_card) >= 4 and clean_card[:4].isdigit() else -1
-    if (51 <= start2 <= 55 or 2221 <= start4 <= 2720) and len(clean_card) == 16:
-        return 'MasterCard'
-    # Discover: 6011, 65, 644-649 (typical 16 digits)
-    if (clean_card.startswith('6011') or clean_card.startswith('65') or
-        (len(clean_card) >= 3 and 644 <= int(clean_card[:3]) <= 649)) and len(clean_card) == 16:
-        return 'Discover'
-    # Fallback: unknown issuer but plausible length
-    return None
-
-def is_repeated_sequence(s):
-    return all(ch == s[0] for ch in s)
-
-# Validation function (no Luhn)
-def validate_credit_card(card):
-    # Remove spaces and dashes
-    clean_card = re.sub(r'[\s-]', '', card)
-
-    # Ensure only digits remain
-    if not clean_card.isdigit():
-        return "Invalid: Contains nondigit characters"
-
-    # Check digit length
-    if not (13 <= len(clean_card) <= 16):
-        return "Invalid: Must be 13–16 digits long"
-
-    # Reject obvious repeated digit sequences like '0000...'
-    if is_repeated_sequence(clean_card):
-        return "Invalid: Repeated digit sequence (unlikely to be real card)"
-
-    # Check issuer heuristics
-    issuer = detect_issuer(clean_card)
-    if issuer:
-        return f"Valid credit card number (Issuer: {issuer})"
-
-    # If format is OK but issuer unknown, still plausible
-    return "Valid credit card number (Issuer: Unknown but plausible)"
-
-# Read interleaved API response
-file_path = r"api_response.txt"
-try:
-    with open(file_path, 'r') as file:
-        text = file.read()
-except FileNotFoundError:
-    print(f"Error: File not found at {file_path}")
-    exit()
-
-# Regex to capture common card formats (groups of 4 separated by space/dash OR continuous digits)
-cc_pattern = r'(?:\d{4}[-\s]?){3}\d{4}|\d{13,16}'
-
-# Extract candidates
-cc_candidates = re.findall(cc_pattern, text)
-
-# Clean up 
-cc_candidates = list(dict.fromkeys([c.strip() for c in cc_candidates]))  # preserves order
-
-# Validate each candidate
-print("\nCredit Card Validation Results):")
-for card in cc_candidates:
-    result = validate_credit_card(card)
-    print(f"{card}: {result}")
-
-
-
-##CURRENCY VALIDATION
-def validate_currency(candidate):
+    patterns = entity_patterns(table)
+    if time_groups:
+        patterns = [(name, time_source() if name == 'time' else pattern) for name, pattern in patterns]
+    names = [name for name, _ in patterns]
+    return (
+        build_skip_pattern(table)
+        + '(?:' + ''.join(f'(?:(?=(?P<{name}>{pattern}))|)' for name, pattern in patterns)
+        + ''.join(f'(?({name})|' for name in names) + '(?!)' + ')' * len(names)
+        + r'|)(?:(?s:.)|\Z)'
+    )
+
+combined_source = build_combined_source()
+
+# Compiled on first use: compiling the combined regex is most of this module's
+# import time, and importing a validator from here shouldn't pay for it.
+# The time_groups version is only for scans that validate the times they find: the
+# extra groups cost every scan a few percent.
+@functools.cache
+def compiled_combined_pattern(time_groups=False):
+    return re.compile(build_combined_source(time_groups=True) if time_groups else combined_source)
+
+def __getattr__(name):
+    if name == 'combined_pattern':
+        return compiled_combined_pattern()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@functools.cache
+def time_group_slice(pattern):
+    """Where a time_groups pattern's groups() holds the time's own groups."""
+    first = pattern.groupindex['year'] - 1
+    return slice(first, first + compiled_time_scanner().groups)
+
+def scan(text, pos=0, stop=None, resume=None, pattern=None, times=None):
     """
-    Validates currency amounts with mandatory currency markers:
-    Examples: $1234.56, £1,234.56, 12.50 RWF, Ksh 1200
-    Returns detailed messages for invalid entries.
+    Yields (name, start, end, candidate) for every extractor match, in text order.
+    Each extractor only matches again once the scan is past its previous match, which
+    reproduces what re.findall would return for that pattern on its own.
+    stop: ignore matches starting at or after this offset (lookahead may still read past it)
+    resume: dict of name -> offset the extractor may match from, updated in place
+    pattern: compiled combined pattern (a bytes version scans bytes-like text)
+    times: dict of time candidate -> the groups() extractors.times.groups_time() takes,
+    filled in place as each new time is yielded, so times are validated without
+    parsing them again; needs a pattern built with time_groups (the default one is)
     """
-    s = candidate.strip()
-
-    # Must have a currency marker: symbol or code
-    marker_pattern = r'^\s*(?:\$|£|€|RWF|UGX|USD|EUR|GBP|KSH|KES)'
-    marker_pattern_end = r'(?:RWF|UGX|USD|EUR|GBP|KSH|KES)\s*$'
-
-    if not re.search(marker_pattern, s, flags=re.IGNORECASE) and not re.search(marker_pattern_end, s, flags=re.IGNORECASE):
-        return "Invalid: Missing currency marker"
-
-    # Remove known symbols/codes for numeric validation
-    numeric_part = re.sub(r'(?:\$|£|€|RWF|UGX|USD|EUR|GBP|KSH|KES)', '', s, flags=re.IGNORECASE).strip()
-
-    # Split integer and decimal if exists
-    if '.' in numeric_part:
-        int_part, dec_part = numeric_part.split('.', 1)
-        if len(dec_part) != 2 or not dec_part.isdigit():
-            return "Invalid: Decimal part must have exactly 2 digits"
-    else:
-        int_part = numeric_part
-        dec_part = None
-
-    # Remove commas for numeric check
-    int_clean = int_part.replace(',', '')
-    if not int_clean.isdigit():
-        return "Invalid: Contains non-digit characters in integer part"
-
-    # Check commas placement (thousands separators)
-    groups = int_part.split(',')
-    if len(groups) > 1:
-        if len(groups[0]) > 3 or any(len(g) != 3 for g in groups[1:]):
-            return "Invalid: Incorrect comma placement in thousands"
-
-    return "Valid currency amount"
-
-
-# Read file
-file_path = r"api_response.txt"
-try:
-    with open(file_path, 'r', encoding='utf-8') as f:
-        text = f.read()
-except FileNotFoundError:
-    print(f"Error: File not found at {file_path}")
-    raise SystemExit(1)
-
-# Regex to capture numbers with mandatory currency markers
-currency_pattern = r'(?:\$|£|€|RWF|UGX|USD|EUR|GBP|KSH|KES)\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?|' \
-                   r'\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*(?:RWF|UGX|USD|EUR|GBP|KSH|KES)'
-
-candidates = re.findall(currency_pattern, text, flags=re.IGNORECASE)
-# Deduplicate and remove empty matches
-candidates_unique = list(dict.fromkeys([c.strip() for c in candidates if c.strip()]))
-
-# Validate each candidate
-print("\nCurrency Validation Results:")
-for cand in candidates_unique:
-    result = validate_currency(cand)
-    print(f"{cand}: {result}")
-
-
-##PHONE NUMBER VALIDATION
-def validate_phone(number):
-    # Remove non-digit characters
-    digits = re.sub(r'\D', '', number)
-
-    # Strip country code if more than 10 digits
-    if len(digits) > 10:
-        digits = digits[-10:]
-
-    if len(digits) != 10:
-        return "Invalid: Must have exactly 10 digits (excluding country code)"
-
-    # Area code parentheses check
-    if '(' in number or ')' in number:
-        if not re.fullmatch(r'\(\d{3}\)[\s.-]?\d{3}[\s.-]?\d{4}', number):
-            return "Invalid: Area code parentheses incorrect"
-
-    return "Valid phone number"
-
-
-# Read file
-file_path = r"api_response.txt"
-try:
-    with open(file_path, 'r') as file:
-        text = file.read()
-except FileNotFoundError:
-    print(f"Error: File not found at {file_path}")
-    exit()
-
-# Stricter regex: only match full 10-digit numbers with optional separators and optional country code
-phone_pattern = r'\b(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}\b'
-
-# Extract candidates
-phone_candidates = [m.group(0) for m in re.finditer(phone_pattern, text)]
-
-# Remove duplicates
-phone_candidates = list(dict.fromkeys(phone_candidates))
-
-# Filter out credit card-like numbers (16 digits)
-def is_credit_card_like(number):
-    digits_only = re.sub(r'\D', '', number)
-    return len(digits_only) == 16
-
-phone_candidates = [p for p in phone_candidates if not is_credit_card_like(p)]
-
-# Validate each candidate
-print("\nPhone Number Validation Results:")
-for number in phone_candidates:
-    result = validate_phone(number)
-    print(f"{number}: {result}")
+    if pattern is None:
+        pattern = compiled_combined_pattern(times is not None)
+    if resume is None:
+        resume = {}
+    for m in pattern.finditer(text, pos):
+        if stop is not None and m.end() > stop:
+            break
+        if m.lastindex is None:
+            continue
+        for name in ENTITY_NAMES:
+            end = m.end(name)
+            if end == -1:
+                continue
+            start = m.start(name)
+            if start >= resume.get(name, 0):
+                resume[name] = end
+                candidate = text[start:end]
+                if times is not None and name == 'time' and candidate not in times:
+                    times[candidate] = m.groups()[time_group_slice(pattern)]
+                yield name, start, end, candidate
+
+##OPEN RUNS
+# The email and amount patterns repeat over runs of word characters, '.', '@', ',',
+# '-' and the no-break spaces amounts are grouped with, with no length limit, so one
+# match can be longer than any fixed overlap (a base64 blob with an '@' in it, a long
+# digit string). Scanners that cut the text call run_start() to never cut into such a
+# run: streaming.py and redact.py carry an unfinished run over to the next chunk
+# whatever its length, and batch.py starts a range's warm-up at the start of the run it falls in.
+# Amounts grouped with plain spaces ("1 000 000 EUR") still rely on the overlap.
+run_re = re.compile(r'[\w.@,\u00a0\u202f-]*')
+# Bytes: \w is ASCII-only there, so every non-ASCII byte counts as part of a run
+run_bytes_re = re.compile(rb'[\w.@,\x80-\xff-]*')
+RUN_WINDOW = 4096
+
+def run_start(text, pos, run=run_re):
+    """Start of the run of run characters that ends at pos (pos when there is none)."""
+    while pos > 0:
+        low = max(pos - RUN_WINDOW, 0)
+        # Match backwards from pos over a reversed window: linear in the run length
+        length = run.match(text[low:pos][::-1]).end()
+        if length < pos - low:
+            return pos - length
+        pos = low
+    return 0
+
+def collect_matches(text, scorer=None, times=None):
+    """
+    Extractor name -> list of raw scan() matches, in text order.
+    scorer: optional context_scoring.ContextScorer; matches it scores below its threshold are dropped
+    times: see scan()
+    """
+    found = {name: [] for name in ENTITY_NAMES}
+    matches = scan(text, times=times)
+    if scorer is None:
+        for name, start, end, candidate in matches:
+            found[name].append(candidate)
+        return found
+    keeps = scorer.keeper(text)
+    kept = {name: set() for name in ENTITY_NAMES}
+    for name, start, end, candidate in matches:
+        # Once a candidate is kept the later occurrences can only repeat it: not scored again
+        if candidate in kept[name] or keeps(name, start, end, candidate):
+            kept[name].add(candidate)
+            found[name].append(candidate)
+    return found
+
+def filter_candidates(found, make_dedup=None):
+    """
+    Applies the per-type filters to collect_matches() output and deduplicates (first-seen order).
+    make_dedup: zero-argument callable returning a dedup object (dedup.py) for each type;
+    None deduplicates exactly
+    """
+    emails_without_at = [e for e in found['email_no_at'] if is_email_like(e)]
+    if make_dedup is None:
+        # The default path stays plain dict.fromkeys: it runs on every call, however small
+        phones = list(dict.fromkeys(found['phone']))
+        return {
+            'email': list(dict.fromkeys(found['email_at'] + emails_without_at)),
+            'time': list(dict.fromkeys(c.strip() for c in found['time'])),
+            'credit_card': list(dict.fromkeys(c.strip() for c in found['credit_card'])),
+            'currency': list(dict.fromkeys(c.strip() for c in found['currency'] if c.strip())),
+            'phone': [p for p in phones if not is_credit_card_like(p)],
+        }
+    seen = new_seen(make_dedup)
+    phones = unique(found['phone'], seen['phone'])
+    return {
+        'email': unique(found['email_at'] + emails_without_at, seen['email']),
+        'time': unique((c.strip() for c in found['time']), seen['time']),
+        'credit_card': unique((c.strip() for c in found['credit_card']), seen['credit_card']),
+        'currency': unique((c.strip() for c in found['currency'] if c.strip()), seen['currency']),
+        'phone': [p for p in phones if not is_credit_card_like(p)],
+    }
+
+def extract_all(text, stats=None, make_dedup=None, scorer=None, times=None):
+    """
+    Runs every extractor over text in a single scan.
+    Returns a dict of entity type -> deduplicated candidate list (first-seen order).
+    stats: optional instrumentation.Stats that records stage times and counts
+    make_dedup: see filter_candidates()
+    scorer: see collect_matches()
+    times: see scan()
+    """
+    if stats is None:
+        return filter_candidates(collect_matches(text, scorer, times), make_dedup)
+
+    with stats.stage('scan'):
+        found = collect_matches(text, scorer, times)
+    with stats.stage('dedup'):
+        candidates = filter_candidates(found, make_dedup)
+    stats.add_text(text)
+    stats.add_matches(found)
+    stats.add_candidates(candidates)
+    return candidates
+
+VALIDATORS = {
+    'email': validate_email,
+    'time': validate_time,
+    'credit_card': validate_credit_card,
+    'currency': validate_currency,
+    'phone': validate_phone,
+}
+
+def new_seen(make_dedup=None):
+    """Entity type -> empty dedup object (ExactDedup unless make_dedup is given)."""
+    make_dedup = make_dedup or ExactDedup
+    return {kind: make_dedup() for kind in VALIDATORS}
+
+def unique_candidates(matches, seen=None, scorer=None, text=None):
+    """
+    Takes (name, start, end, candidate) tuples from scan() and yields
+    (entity type, start, end, candidate) for the first occurrence of each candidate,
+    after the same filters extract_all() applies.
+    seen: dict of entity type -> dedup object (see new_seen()), updated in place
+    (lets a caller deduplicate across several calls, or bound memory with a hashed
+    or Bloom dedup)
+    scorer: optional context_scoring.ContextScorer; occurrences it scores below its
+    threshold are dropped. text is what the match offsets point into (a str, or the
+    mapped bytes for mmap_scan.py). Only occurrences that pass the filters and are not
+    already seen are scored.
+    """
+    if seen is None:
+        seen = new_seen()
+    keeps = None if scorer is None else scorer.keeper(text)
+    for name, start, end, candidate in matches:
+        if name == 'email_at':
+            kind = 'email'
+        elif name == 'email_no_at':
+            if not is_email_like(candidate):
+                continue
+            kind = 'email'
+        elif name == 'phone':
+            if is_credit_card_like(candidate):
+                continue
+            kind = 'phone'
+        else:
+            kind = name
+            candidate = candidate.strip()
+            if not candidate:
+                continue
+
+        dedup = seen[kind]
+        if keeps is not None and (candidate in dedup or not keeps(name, start, end, candidate)):
+            continue
+        if dedup.first_seen(candidate):
+            yield kind, start, end, candidate
+
+def byte_offsets(text, matches):
+    """
+    Takes (name, start, end, candidate) tuples with character offsets into text, in
+    text order, and yields them with start/end as UTF-8 byte offsets.
+    """
+    if text.isascii():
+        yield from matches
+        return
+    # Matches come in text order, so byte offsets are counted incrementally
+    pos = byte_pos = 0
+    for name, start, end, candidate in matches:
+        byte_pos += len(text[pos:start].encode('utf-8'))
+        pos = start
+        yield name, byte_pos, byte_pos + len(text[start:end].encode('utf-8')), candidate
+
+def validate_candidates(kind, values, times):
+    """(candidate, result) pairs; times (see scan()) are validated from their captured groups."""
+    if kind == 'time':
+        return [(c, groups_message(times[c])) for c in values]
+    validate = VALIDATORS[kind]
+    return [(c, validate(c)) for c in values]
+
+def validate_all(text, stats=None, make_dedup=None, scorer=None):
+    """Returns a dict of entity type -> list of (candidate, result) pairs."""
+    times = {}
+    candidates = extract_all(text, stats, make_dedup, scorer, times)
+    if stats is None:
+        # validate_candidates() inlined: this is most of the fixed cost of a call
+        return {
+            kind: [(c, groups_message(times[c])) for c in values] if kind == 'time'
+            else [(c, VALIDATORS[kind](c)) for c in values]
+            for kind, values in candidates.items()
+        }
+
+    results = {}
+    with stats.stage('validate'):
+        for kind, values in candidates.items():
+            start = time.perf_counter()
+            results[kind] = validate_candidates(kind, values, times)
+            stats.add_results(kind, results[kind], time.perf_counter() - start)
+    return results
+
+SECTION_TITLES = {
+    'email': "\nEmail Validation Results:",
+    'time': "\nTime Validation Results:",
+    'credit_card': "\nCredit Card Validation Results):",
+    'currency': "\nCurrency Validation Results:",
+    'phone': "\nPhone Number Validation Results:",
+}
+
+
+def write_sections(results, out=None):
+    """
+    Writes validate_all() results as this script prints them, one write per section
+    rather than a print() per candidate (see sinks.py for large outputs).
+    """
+    out = out or sys.stdout
+    for kind, pairs in results.items():
+        lines = [SECTION_TITLES[kind]] + [f"{candidate}: {result}" for candidate, result in pairs]
+        out.write('\n'.join(lines) + '\n')
+
+def main(argv=None):
+    # Read interleaved API response once for all extractors
+    text = read_input(argv)
+    if text is None:
+        return 1
+    write_sections(validate_all(text))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,238 @@
+import argparse
+import asyncio
+import codecs
+import statistics
+import time
+
+from all_validations import new_seen, unique_candidates, VALIDATORS
+from streaming import ChunkScanner, DEFAULT_OVERLAP
+
+##ASYNC EXTRACTION SERVICE
+# Runs the extractors on response bodies while they are still arriving.
+# Callers submit() an async byte stream (an asyncio.StreamReader, or any async iterator
+# of bytes) and get a future for its records. Submissions wait in a bounded queue: once
+# queue_size responses are waiting, submit() blocks, which pushes back on the producer.
+# `concurrency` worker tasks each take one response at a time, decode it incrementally,
+# and hand every batch_size bytes to an executor for scanning and validation, so the
+# event loop never runs the regexes itself.
+#
+# Each batch goes through streaming.ChunkScanner with the response's dedup state, so the
+# records are the same as streaming.stream_results() on the whole body.
+DEFAULT_READ_SIZE = 16 * 1024
+DEFAULT_BATCH_SIZE = 64 * 1024
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_CONCURRENCY = 8
+
+async def iter_chunks(source, read_size=DEFAULT_READ_SIZE):
+    """Yields bytes from a StreamReader-like object (has read()) or an async iterator."""
+    if hasattr(source, 'read'):
+        while True:
+            data = await source.read(read_size)
+            if not data:
+                return
+            yield data
+    else:
+        async for data in source:
+            yield data
+
+def extract_batch(state, text, final):
+    """
+    Executor job: scans one batch of a response's decoded text.
+    state is (ChunkScanner, seen) for the response. It is returned along with the
+    records so the job also works in a process pool, where changes to it are not
+    visible to the caller.
+    Records are (kind, candidate, result, start, end), start/end being character offsets.
+    """
+    scanner, seen = state
+    matches = scanner.feed(text)
+    if final:
+        matches += scanner.close()
+    records = [
+        (kind, candidate, VALIDATORS[kind](candidate), start, end)
+        for kind, start, end, candidate in unique_candidates(matches, seen)
+    ]
+    return state, records
+
+class ExtractionService:
+    """
+    executor: concurrent.futures executor for the scan jobs (None = the loop's default
+    thread pool; a ProcessPoolExecutor uses several cores)
+    make_dedup: dedup object factory (dedup.py) for each response's dedup state
+    Use as `async with ExtractionService() as service:`; leaving the block waits for
+    every submitted response.
+    """
+    def __init__(self, executor=None, concurrency=DEFAULT_CONCURRENCY, queue_size=DEFAULT_QUEUE_SIZE,
+                 batch_size=DEFAULT_BATCH_SIZE, overlap=DEFAULT_OVERLAP, make_dedup=None):
+        self.executor = executor
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.overlap = overlap
+        self.make_dedup = make_dedup
+        self.queue = None
+        self.workers = []
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def start(self):
+        self.queue = asyncio.Queue(self.queue_size)
+        self.workers = [asyncio.create_task(self.worker()) for _ in range(self.concurrency)]
+
+    async def close(self):
+        await self.queue.join()
+        for task in self.workers:
+            task.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    async def submit(self, source):
+        """
+        Queues a response body, waiting while the queue is full.
+        Returns a future that resolves to the response's records.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((source, future))
+        return future
+
+    async def extract(self, source):
+        """Submits a response body and waits for its records."""
+        return await (await self.submit(source))
+
+    async def worker(self):
+        while True:
+            source, future = await self.queue.get()
+            try:
+                records = await self.process(source)
+            except Exception as exc:
+                if not future.cancelled():
+                    future.set_exception(exc)
+            else:
+                if not future.cancelled():
+                    future.set_result(records)
+            finally:
+                self.queue.task_done()
+
+    async def process(self, source):
+        loop = asyncio.get_running_loop()
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        state = (ChunkScanner(self.overlap), new_seen(self.make_dedup))
+        records = []
+        pending = []
+        pending_size = 0
+        async for data in iter_chunks(source):
+            pending.append(data)
+            pending_size += len(data)
+            if pending_size >= self.batch_size:
+                # A character split across reads stays in the decoder until the next batch
+                text = decoder.decode(b''.join(pending))
+                pending = []
+                pending_size = 0
+                state, batch = await loop.run_in_executor(self.executor, extract_batch, state, text, False)
+                records += batch
+        text = decoder.decode(b''.join(pending), final=True)
+        state, batch = await loop.run_in_executor(self.executor, extract_batch, state, text, True)
+        records += batch
+        return records
+
+##REPLAY PRODUCER
+# Local stand-in for live traffic: replays a file as response bodies arriving
+# at a fixed byte rate, with new responses starting at a fixed arrival rate.
+
+async def replay(data, byte_rate=None, read_size=DEFAULT_READ_SIZE):
+    """
+    Yields data in read_size pieces, paced to byte_rate bytes per second
+    (None = as fast as the consumer reads).
+    """
+    start = time.perf_counter()
+    for offset in range(0, len(data), read_size):
+        delay = start + offset / byte_rate - time.perf_counter() if byte_rate else 0
+        await asyncio.sleep(max(delay, 0))
+        yield data[offset:offset + read_size]
+
+async def run_load(service, data, responses, arrival_rate=None, byte_rate=None):
+    """
+    Starts `responses` replays of data, arrival_rate per second (None = all at once),
+    through the service. Returns (latencies, records): per-response seconds from arrival
+    to records ready, and the records of every response in arrival order.
+    """
+    async def one_response():
+        arrived = time.perf_counter()
+        records = await service.extract(replay(data, byte_rate))
+        return time.perf_counter() - arrived, records
+
+    tasks = []
+    start = time.perf_counter()
+    for i in range(responses):
+        if arrival_rate:
+            await asyncio.sleep(max(start + i / arrival_rate - time.perf_counter(), 0))
+        tasks.append(asyncio.create_task(one_response()))
+    done = await asyncio.gather(*tasks)
+    return [latency for latency, _ in done], [records for _, records in done]
+
+def latency_summary(latencies):
+    """Returns p50, p99 and max of the latencies, in milliseconds."""
+    if len(latencies) < 2:
+        # quantiles() needs two points; one latency is every percentile
+        p50 = p99 = latencies[0]
+    else:
+        cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+        p50, p99 = cuts[49], cuts[98]
+    return {'p50': p50 * 1000, 'p99': p99 * 1000, 'max': max(latencies) * 1000}
+
+def response_count(text):
+    """responses value: a positive integer, for the command line."""
+    try:
+        responses = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number: {text!r}")
+    if responses < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {responses}")
+    return responses
+
+def rate(text):
+    """A per-second rate for the command line: a number, 0 for no limit."""
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number: {text!r}")
+    if not value >= 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more: {text}")
+    return value
+
+def main(argv=None):
+    # Usage: python async_service.py [path] [responses] [arrivals per second] [bytes per second]
+    parser = argparse.ArgumentParser(description="Replay a response file as concurrent traffic and report latency.")
+    parser.add_argument('path', nargs='?', default='api_response.txt', help="response body to replay")
+    parser.add_argument('responses', nargs='?', type=response_count, default=200,
+                        help="number of responses (default: 200)")
+    parser.add_argument('arrival_rate', nargs='?', type=rate, default=100,
+                        help="responses arriving per second, 0 for all at once (default: 100)")
+    parser.add_argument('byte_rate', nargs='?', type=rate, default=1024 * 1024,
+                        help="bytes per second each response arrives at, 0 for no limit (default: 1 MiB)")
+    args = parser.parse_args(argv)
+    try:
+        with open(args.path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        print(f"Error: File not found at {args.path}")
+        return 1
+
+    async def serve():
+        async with ExtractionService() as service:
+            return await run_load(service, data, args.responses, args.arrival_rate or None, args.byte_rate or None)
+
+    latencies, records = asyncio.run(serve())
+    summary = latency_summary(latencies)
+    print(f"{args.responses} responses of {len(data):,} bytes, {args.arrival_rate:g}/s arriving at {args.byte_rate:,.0f} B/s")
+    print(f"{len(records[0])} records per response; latency p50 {summary['p50']:.1f} ms, "
+          f"p99 {summary['p99']:.1f} ms, max {summary['max']:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,157 @@
+import argparse
+import glob
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from all_validations import new_seen, run_bytes_re, run_start, scan, unique_candidates, VALIDATORS
+from context_scoring import ContextScorer
+from mmap_scan import combined_bytes_pattern
+from validation_cache import ValidationCache, DEFAULT_CAPACITY
+
+##BATCH EXTRACTION
+# Runs the memory-mapped scanner over many files on a process pool.
+# Files larger than split_size are cut into byte ranges so a single huge file can
+# also use several workers. Each worker starts scanning `overlap` bytes before its
+# range, moved back to the start of the run of word characters that point falls in
+# (all_validations.run_start), so the extractors are in the same state they would be
+# in a whole-file scan. It reads past the end of its range through the mapping, and
+# only reports matches that start inside its range. Results are merged back in (file, range) order, so the
+# output is the same for any worker count.
+DEFAULT_SPLIT_SIZE = 64 * 1024 * 1024
+DEFAULT_OVERLAP = 4096
+
+# Per-process cache so values repeated across files are validated once per worker
+validation_cache = None
+# Per-process dedup factory (dedup.py) and context scorer for the ranges a worker scans
+make_range_dedup = None
+range_scorer = None
+
+def init_worker(cache_size, make_dedup=None, scorer=None):
+    global validation_cache, make_range_dedup, range_scorer
+    validation_cache = ValidationCache(cache_size, hash_cards=True) if cache_size else None
+    make_range_dedup = make_dedup
+    range_scorer = scorer
+
+def validate(kind, candidate):
+    if validation_cache is None:
+        return VALIDATORS[kind](candidate)
+    return validation_cache.validate(kind, candidate)
+
+def collect_files(inputs):
+    """
+    Expands directories (recursively), glob patterns and plain file paths into
+    a sorted, duplicate-free list of files.
+    """
+    paths = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, dirs, files in os.walk(item):
+                paths.update(os.path.join(root, name) for name in files)
+        elif glob.has_magic(item):
+            paths.update(p for p in glob.glob(item, recursive=True) if os.path.isfile(p))
+        else:
+            paths.add(item)
+    return sorted(paths)
+
+def plan_tasks(paths, split_size=DEFAULT_SPLIT_SIZE, overlap=DEFAULT_OVERLAP):
+    """Returns (path, start, end, overlap) byte ranges covering every file."""
+    tasks = []
+    for path in paths:
+        size = os.path.getsize(path)
+        start = 0
+        while True:
+            end = min(start + split_size, size)
+            tasks.append((path, start, end, overlap))
+            if end >= size:
+                break
+            start = end
+    return tasks
+
+def scan_range(task):
+    """
+    Worker: returns (kind, candidate, result, start, end) for the first occurrence of
+    each candidate that starts inside the byte range.
+    """
+    path, range_start, range_end, overlap = task
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            warmup = run_start(mm, max(range_start - overlap, 0), run_bytes_re)
+            matches = (
+                (name, start, end, candidate.decode('utf-8'))
+                for name, start, end, candidate in scan(mm, warmup, range_end, pattern=combined_bytes_pattern)
+                if start >= range_start
+            )
+            candidates = unique_candidates(matches, new_seen(make_range_dedup), range_scorer, mm)
+            return [(kind, candidate, validate(kind, candidate), start, end) for kind, start, end, candidate in candidates]
+
+def run_batch(inputs, workers=None, split_size=DEFAULT_SPLIT_SIZE, overlap=DEFAULT_OVERLAP,
+              cache_size=DEFAULT_CAPACITY, make_dedup=None, scorer=None):
+    """
+    Extracts and validates every file matched by inputs (directories, globs or paths).
+    workers: process count (None = os.cpu_count(), 1 = run in this process)
+    cache_size: validation cache entries per worker (0 disables the cache)
+    make_dedup: dedup object factory (dedup.py) to bound memory on high-cardinality
+    files, used by the workers and the merge; must pickle (dedup_factory() does)
+    scorer: optional context_scoring.ContextScorer, applied in the workers on the
+    mapped bytes (see all_validations.unique_candidates())
+    Returns a dict of file path -> list of (kind, candidate, result, start, end),
+    deduplicated per file and in file order.
+    """
+    tasks = plan_tasks(collect_files(inputs), split_size, overlap)
+    if workers == 1:
+        init_worker(cache_size, make_dedup, scorer)
+        range_results = map(scan_range, tasks)
+        return merge_results(tasks, range_results, make_dedup)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(cache_size, make_dedup, scorer)) as executor:
+        range_results = executor.map(scan_range, tasks, chunksize=max(1, len(tasks) // 256))
+        return merge_results(tasks, range_results, make_dedup)
+
+def merge_results(tasks, range_results, make_dedup=None):
+    # Ranges of a file arrive in order, so the first range holding a candidate
+    # also holds its first occurrence in the file. A file's ranges are also next to
+    # each other, so only the current file's dedup state is kept.
+    results = {}
+    current = None
+    for (path, *_), records in zip(tasks, range_results):
+        if path != current:
+            current, seen = path, new_seen(make_dedup)
+            file_results = results.setdefault(path, [])
+        for record in records:
+            if seen[record[0]].first_seen(record[1]):
+                file_results.append(record)
+    return results
+
+
+def worker_count(text):
+    """--workers value: a positive integer, for the command line."""
+    try:
+        workers = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number: {text!r}")
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {workers}")
+    return workers
+
+def main(argv=None):
+    # Usage: python batch.py [--workers N] [--min-score N] <dir|glob|file> ...
+    parser = argparse.ArgumentParser(description="Extract and validate many files on a process pool.")
+    parser.add_argument('inputs', nargs='*', default=['api_response.txt'], help="directories, globs or files")
+    parser.add_argument('--workers', type=worker_count, help="worker processes (default: one per CPU; 1 runs in this process)")
+    parser.add_argument('--min-score', type=int, metavar='N',
+                        help="drop candidates whose context score is below N (context_scoring.py)")
+    args = parser.parse_args(argv)
+
+    scorer = None if args.min_score is None else ContextScorer(threshold=args.min_score)
+    for path, records in run_batch(args.inputs, args.workers, scorer=scorer).items():
+        print(f"\n{path}:")
+        for kind, candidate, result, start, end in records:
+            print(f"[{kind}] {start}-{end} {candidate}: {result}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
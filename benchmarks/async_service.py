@@ -0,0 +1,90 @@
+"""
+Benchmark: per-response latency of the asyncio extraction service under load.
+
+First checks that the service returns exactly streaming.stream_results() for a
+response body, whatever the read and batch sizes, both from an async iterator and
+from an asyncio.StreamReader. Then replays 256KB synthetic bodies through the
+service, each arriving at 4 MB/s, at increasing arrival rates. It reports p50/p99
+latency from a response's first byte to its records being ready, and the offered
+load. Runs once with the default thread pool and once with a process pool.
+
+Run from the repository root:
+    python -m benchmarks.async_service
+"""
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import streaming
+from async_service import ExtractionService, replay, run_load, latency_summary
+from benchmarks.single_pass import build_input
+
+BODY_MB = 0.25
+BYTE_RATE = 4 * 1024 * 1024
+RESPONSES = 200
+ARRIVAL_RATES = [10, 20, 30]
+BATCH_SIZES = [1, 7, 4096, 64 * 1024]
+
+
+async def from_stream_reader(data, read_size):
+    reader = asyncio.StreamReader()
+    for offset in range(0, len(data), read_size):
+        reader.feed_data(data[offset:offset + read_size])
+    reader.feed_eof()
+    return reader
+
+
+async def check_equivalence(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    expected = [(kind, candidate, result) for kind, candidate, result in streaming.stream_results(path)]
+    for batch_size in BATCH_SIZES:
+        read_size = max(batch_size // 3, 1)
+        async with ExtractionService(batch_size=batch_size) as service:
+            from_iterator = await service.extract(replay(data, read_size=read_size))
+            from_reader = await service.extract(await from_stream_reader(data, read_size))
+        for records in (from_iterator, from_reader):
+            got = [(kind, candidate, result) for kind, candidate, result, start, end in records]
+            assert got == expected, f"records differ at batch_size={batch_size}"
+
+
+async def load(data, arrival_rate, executor):
+    async with ExtractionService(executor=executor) as service:
+        latencies, records = await run_load(service, data, RESPONSES, arrival_rate, BYTE_RATE)
+    assert all(r == records[0] for r in records)
+    return latency_summary(latencies)
+
+
+def main():
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        sample_lines = f.read().splitlines()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'body.txt')
+        build_input(path, 'prose', BODY_MB, sample_lines)
+        asyncio.run(check_equivalence('api_response.txt'))
+        asyncio.run(check_equivalence(path))
+        with open(path, 'rb') as f:
+            data = f.read()
+
+    arrival_time = len(data) / BYTE_RATE * 1000
+    print(f"{RESPONSES} responses of {len(data) // 1024}KB, each arriving over {arrival_time:.0f} ms, "
+          f"{os.cpu_count()} CPUs")
+    print(f"{'executor':>9} {'arrivals/s':>11} {'offered':>10} {'p50':>9} {'p99':>9} {'wall':>7}")
+    for label in ('threads', 'processes'):
+        for arrival_rate in ARRIVAL_RATES:
+            executor = ProcessPoolExecutor() if label == 'processes' else None
+            start = time.perf_counter()
+            summary = asyncio.run(load(data, arrival_rate, executor))
+            elapsed = time.perf_counter() - start
+            if executor:
+                executor.shutdown()
+            offered = arrival_rate * len(data) / (1024 * 1024)
+            print(f"{label:>9} {arrival_rate:>11} {offered:>6.1f}MB/s {summary['p50']:>7.1f}ms "
+                  f"{summary['p99']:>7.1f}ms {elapsed:>6.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: process-pool batch extraction with 1/2/4/8 workers.
+
+Builds a directory of synthetic response files plus one large file that gets split
+into byte ranges, checks that every worker count produces exactly the output of an
+unsplit single-process mmap scan, and reports wall time and speedup per worker count.
+Also checks that a run with a hashed dedup (dedup.py) in the workers and the merge
+gives the same output.
+
+Run from the repository root:
+    python -m benchmarks.batch
+"""
+import os
+import tempfile
+import time
+
+import batch
+import mmap_scan
+from dedup import dedup_factory
+from benchmarks.single_pass import build_input
+
+WORKER_COUNTS = [1, 2, 4, 8]
+FILE_COUNT = 200
+FILE_SIZE_MB = 0.05
+LARGE_FILE_MB = 16
+SPLIT_SIZE = 1024 * 1024
+
+
+def reference(paths):
+    return {path: list(mmap_scan.mmap_results(path)) for path in paths}
+
+
+def main():
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        sample_lines = f.read().splitlines()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(FILE_COUNT):
+            build_input(os.path.join(tmp, f'response_{i:05d}.txt'), 'prose', FILE_SIZE_MB,
+                        sample_lines[i % len(sample_lines):] + sample_lines)
+        build_input(os.path.join(tmp, 'large.txt'), 'prose', LARGE_FILE_MB, sample_lines)
+
+        expected = reference(batch.collect_files([tmp]))
+        hashed = batch.run_batch([tmp], workers=2, split_size=SPLIT_SIZE, make_dedup=dedup_factory('hashed'))
+        assert hashed == expected, "output differs with a hashed dedup"
+        print(f"{FILE_COUNT} x {FILE_SIZE_MB}MB files + 1 x {LARGE_FILE_MB}MB file "
+              f"(split every {SPLIT_SIZE // 1024}KB), {os.cpu_count()} CPUs")
+        print(f"{'workers':>8} {'time':>8} {'speedup':>8}")
+        baseline = None
+        for workers in WORKER_COUNTS:
+            start = time.perf_counter()
+            results = batch.run_batch([tmp], workers=workers, split_size=SPLIT_SIZE)
+            elapsed = time.perf_counter() - start
+            assert results == expected, f"output differs with {workers} workers"
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>7.2f}s {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Benchmark: vectorized NumPy card checks vs the per-card Python loop.
+
+Times validate_cards_batch(cards, luhn=True) against the per-card
+validate_credit_card(card, luhn=True) loop at 10k, 100k and 1M cards; the check that
+both give the same messages is in tests/test_card_batch.py. "arrays" times only card_checks(); "messages" also builds
+the message strings.
+
+Run from the repository root:
+    python -m benchmarks.card_batch
+"""
+import time
+
+import all_validations as av
+import card_batch
+from tests.inputs import make_cards
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'cards':>10} {'loop':>8} {'arrays':>8} {'speedup':>8} {'messages':>9} {'speedup':>8}")
+    for n in SIZES:
+        cards = make_cards(n)
+        loop_time = timed(lambda: [av.validate_credit_card(c, luhn=True) for c in cards])
+        array_time = timed(card_batch.card_checks, cards)
+        message_time = timed(card_batch.validate_cards_batch, cards, True)
+        print(f"{n:>10,} {loop_time:>7.2f}s {array_time:>7.2f}s {loop_time / array_time:>7.1f}x "
+              f"{message_time:>8.2f}s {loop_time / message_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Benchmark: precision, recall and throughput of context scoring (context_scoring.py).
+
+Builds a labeled synthetic corpus: lines of words and noise (ids, hashes, versions,
+hostnames, URLs) with planted entities from benchmarks.corpus, a share of them after
+a context phrase ("call", "card:", "price", "meeting at", ...), plus decoys that the
+extractors match but that are not entities (order ids, build numbers, digit runs).
+
+A scanned match counts as a true entity when it overlaps a planted entity of its
+type; for emails it must be the whole planted email (the domain matched on its own
+is a fragment, not a second email). Every occurrence is counted, before dedup.
+Reported: precision and recall of the matches that reach validation, without
+scoring and at several thresholds, per entity type at the default threshold, and
+the time of validate_all() and extract_results() (records, through
+unique_candidates()) with and without scoring, next to the scoring alone.
+
+Before that, checks that scoring through unique_candidates() (which skips repeats
+of candidates already kept) keeps the same candidates as scoring every occurrence
+and then deduplicating, and that the streaming, mmap and batch paths agree with it
+on ASCII text (on bytes the windows count bytes).
+
+Run from the repository root:
+    python -m benchmarks.context_scoring
+"""
+import os
+import random
+import tempfile
+import time
+
+import all_validations as av
+import batch
+import mmap_scan
+import streaming
+from benchmarks.corpus import gen_card, gen_currency, gen_email, gen_noise, gen_phone, gen_time, gen_words
+from context_scoring import THRESHOLD, ContextScorer
+from results import extract_results
+
+CORPUS_LINES = 40_000
+CONTEXT_RATE = 0.6
+DECOY_RATE = 0.3
+THRESHOLDS = [0, 1, 2, 3]
+REPEATS = 3
+
+GENERATORS = {
+    'email': gen_email,
+    'phone': gen_phone,
+    'credit_card': gen_card,
+    'currency': gen_currency,
+    'time': gen_time,
+}
+
+CONTEXT_PHRASES = {
+    'email': ['email', 'contact', 'reply to', 'mail'],
+    'phone': ['call', 'phone:', 'tel', 'mobile', 'dial'],
+    'credit_card': ['card', 'paid with card', 'visa', 'credit card:'],
+    'currency': ['price', 'total', 'paid', 'refund of', 'balance'],
+    'time': ['at', 'meeting at', 'scheduled for', 'until'],
+}
+
+
+def gen_decoy(rng):
+    """Text the extractors match that is not an entity."""
+    digits = lambda n: ''.join(rng.choice('0123456789') for _ in range(n))
+    return rng.choice([
+        f"order id {digits(10)}",
+        f"ref {digits(4)} {digits(4)} {digits(4)} {digits(4)}",
+        f"tracking {digits(16)}",
+        f"build {rng.randint(1, 20)}.{rng.randint(0, 40)}.{rng.randint(0, 99)}",
+        f"version {rng.randint(1, 9)}.{rng.randint(10, 59)}",
+        f"{digits(6)} {digits(4)}-{digits(3)}-{digits(4)} {digits(8)}",
+        f"host {rng.choice(['db1', 'cache', 'edge'])}.{rng.choice(['internal', 'prod', 'corp'])}.net",
+        f"https://{rng.choice(['cdn', 'api'])}.example.org/v{rng.randint(1, 3)}/x",
+    ])
+
+
+def labeled_corpus(lines, seed=0):
+    """Returns (text, spans) with spans a list of (start, end, entity type) of planted entities."""
+    rng = random.Random(seed)
+    parts = []
+    spans = []
+    offset = 0
+
+    def add(piece, kind=None):
+        nonlocal offset
+        if kind:
+            spans.append((offset, offset + len(piece), kind))
+        parts.append(piece + ' ')
+        offset += len(piece) + 1
+
+    for _ in range(lines):
+        for _ in range(rng.randint(1, 3)):
+            add(rng.choice([gen_words(rng, rng.randint(2, 6)), gen_noise(rng)]))
+            if rng.random() < DECOY_RATE:
+                add(gen_decoy(rng))
+            if rng.random() < 0.5:
+                kind = rng.choice(list(GENERATORS))
+                if rng.random() < CONTEXT_RATE:
+                    add(rng.choice(CONTEXT_PHRASES[kind]))
+                add(GENERATORS[kind](rng), kind)
+        parts[-1] = parts[-1][:-1] + '\n'
+    return ''.join(parts), spans
+
+
+class KeepAll:
+    """Dedup object that treats every occurrence as new, to count occurrences."""
+    def first_seen(self, candidate):
+        return True
+
+
+def label(matches, spans):
+    """(entity type, is planted entity) for each filtered match, before dedup."""
+    starts = [s for s, _, _ in spans]
+    seen = {kind: KeepAll() for kind in av.VALIDATORS}
+    labels = []
+    i = 0
+    for kind, start, end, candidate in av.unique_candidates(matches, seen):
+        # spans are sorted and don't overlap: step to the last one starting before end
+        while i + 1 < len(starts) and starts[i + 1] < end:
+            i += 1
+        truth = False
+        for s, e, k in spans[max(i - 1, 0):i + 1]:
+            if k == kind and s < end and start < e:
+                truth = kind != 'email' or (s, e) == (start, end)
+        labels.append((kind, truth))
+    return labels
+
+
+def precision_recall(kept, labels):
+    positives = sum(truth for _, truth in labels)
+    true_kept = sum(truth for _, truth in kept)
+    return true_kept / max(len(kept), 1), true_kept / max(positives, 1)
+
+
+def check(text):
+    """Scoring gives the same candidates on every path."""
+    for threshold in THRESHOLDS:
+        scorer = ContextScorer(threshold=threshold)
+        expected = list(av.unique_candidates(scorer.keep(text, av.scan(text))))
+        assert list(av.unique_candidates(av.scan(text), scorer=scorer, text=text)) == expected, threshold
+        found = {name: [] for name in av.ENTITY_NAMES}
+        for name, start, end, candidate in scorer.keep(text, av.scan(text)):
+            found[name].append(candidate)
+        assert av.extract_all(text, scorer=scorer) == av.filter_candidates(found), threshold
+
+    ascii_text = ''.join(line for line in text.splitlines(True) if line.isascii())
+    scorer = ContextScorer()
+    expected = [(kind, candidate) for kind, _, _, candidate
+                in av.unique_candidates(av.scan(ascii_text), scorer=scorer, text=ascii_text)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'corpus.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(ascii_text)
+        streamed = streaming.stream_results(path, chunk_size=4096, overlap=256, scorer=scorer)
+        assert [(kind, candidate) for kind, candidate, _ in streamed] == expected, "streaming differs"
+        mapped = list(mmap_scan.mmap_results(path, scorer=scorer))
+        assert [(kind, candidate) for kind, candidate, *_ in mapped] == expected, "mmap differs"
+        batched = batch.run_batch([path], workers=1, split_size=64 * 1024, scorer=scorer)[path]
+        assert batched == mapped, "batch differs"
+    print(f"scored candidates match on every path ({len(expected):,} kept on {len(ascii_text) / 1e6:.1f}MB ASCII)")
+
+
+def best_time(fn):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    text, spans = labeled_corpus(CORPUS_LINES)
+    check(text)
+    matches = list(av.scan(text))
+    labels = label(matches, spans)
+    print(f"{len(text) / 1e6:.1f}MB, {len(spans):,} planted entities, {len(labels):,} candidate occurrences")
+
+    print(f"\n{'threshold':>10} {'validated':>10} {'precision':>10} {'recall':>8}")
+    precision, recall = precision_recall(labels, labels)
+    print(f"{'none':>10} {len(labels):>10,} {precision:>10.3f} {recall:>8.3f}")
+    for threshold in THRESHOLDS:
+        kept = label(ContextScorer(threshold=threshold).keep(text, matches), spans)
+        precision, recall = precision_recall(kept, labels)
+        print(f"{threshold:>10} {len(kept):>10,} {precision:>10.3f} {recall:>8.3f}")
+
+    kept = label(ContextScorer().keep(text, matches), spans)
+    print(f"\nthreshold {THRESHOLD}, per entity type")
+    print(f"{'type':>12} {'candidates':>11} {'kept':>8} {'precision':>10} {'recall':>8}   (unscored precision)")
+    for kind in av.VALIDATORS:
+        all_of_kind = [l for l in labels if l[0] == kind]
+        kept_of_kind = [l for l in kept if l[0] == kind]
+        precision, recall = precision_recall(kept_of_kind, all_of_kind)
+        before, _ = precision_recall(all_of_kind, all_of_kind)
+        print(f"{kind:>12} {len(all_of_kind):>11,} {len(kept_of_kind):>8,} {precision:>10.3f} {recall:>8.3f}   ({before:.3f})")
+
+    scorer = ContextScorer()
+    scan_time, _ = best_time(lambda: sum(1 for _ in av.scan(text)))
+    score_all, _ = best_time(lambda: sum(1 for _ in scorer.keep(text, matches)))
+    score_unique, _ = best_time(lambda: sum(1 for _ in av.unique_candidates(matches, scorer=scorer, text=text)))
+    dedup_only, _ = best_time(lambda: sum(1 for _ in av.unique_candidates(matches)))
+    print(f"\nscan {scan_time:.2f}s; scoring every occurrence {score_all:.2f}s "
+          f"({score_all / len(matches) * 1e6:.1f}us per match), through unique_candidates "
+          f"{score_unique - dedup_only:.2f}s more than its dedup alone")
+
+    validations = lambda results: sum(len(pairs) for pairs in results.values())
+    print(f"\n{'path':>16} {'unscored':>9} {'scored':>8} {'speedup':>8} {'validations':>20}")
+    for name, run, count in (
+            ('validate_all', lambda s: av.validate_all(text, scorer=s), validations),
+            ('extract_results', lambda s: list(extract_results(text, scorer=s)), len)):
+        plain_time, plain = best_time(lambda: run(None))
+        scored_time, scored = best_time(lambda: run(scorer))
+        print(f"{name:>16} {plain_time:>8.2f}s {scored_time:>7.2f}s {plain_time / scored_time:>7.2f}x "
+              f"{count(plain):>9,} -> {count(scored):>7,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Seeded generator of synthetic API responses for benchmarking the extractors.
+
+Writes JSON bodies, log lines and free-text notes in the style of api_response.txt,
+with emails, phone numbers, card numbers, currency amounts and times (valid and
+invalid forms) mixed into realistic noise: ids, hashes, ISO timestamps, version
+numbers, URLs and dotted hostnames.
+
+  size        - bytes to write; accepts 1MB, 512KB, 10GB, ...
+  density     - fraction of lines that carry at least one entity (0 to 1)
+  adversarial - fraction of lines that are worst cases for the regexes: long digit
+                runs, long dotted tokens, long runs of separators between digits
+  seed        - the same seed, size, density and adversarial rate give the same bytes
+
+Lines are drawn from a pool of POOL_LINES generated lines, so multi-gigabyte corpora
+are written at disk speed rather than at the speed of the generator.
+
+Run from the repository root:
+    python -m benchmarks.corpus corpus.txt --size 1GB --density 0.2 --seed 1
+"""
+import argparse
+import random
+import string
+
+from tests.inputs import gen_time
+
+POOL_LINES = 50_000
+WRITE_LINES = 4096
+
+UNITS = {'': 1, 'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+WORDS = (
+    "the request was processed by the gateway and returned status ok for user account "
+    "session token expired retry later invoice order shipment pending delivered refund "
+    "customer support ticket opened closed escalated note lorem ipsum dolor sit amet"
+).split()
+DOMAINS = ['example.com', 'company.co.uk', 'mail.example.org', 'corp.io', 'service.net']
+CURRENCY_MARKERS = ['$', '£', '€', 'USD ', 'EUR ', 'KES ', 'Ksh ', 'RWF ', 'UGX ', '₹']
+SERVICES = ['api', 'auth', 'billing', 'search', 'payments']
+
+
+def parse_size(text):
+    """'10GB' -> 10737418240"""
+    text = text.strip().upper()
+    number = text.rstrip(string.ascii_uppercase)
+    return int(float(number) * UNITS[text[len(number):]])
+
+
+def luhn_digit(digits):
+    total = 0
+    for i, ch in enumerate(reversed(digits)):
+        d = int(ch)
+        if i % 2 == 0:
+            d *= 2
+            if d > 9:
+                d -= 9
+        total += d
+    return str((10 - total % 10) % 10)
+
+
+##ENTITY GENERATORS
+# Each returns one entity as it might appear in a response, valid or not.
+
+def gen_email(rng):
+    user = rng.choice(['user', 'first.last', 'admin', 'j_doe', 'sales-team', 'name'])
+    form = rng.random()
+    if form < 0.7:
+        return f"{user}{rng.randint(1, 999)}@{rng.choice(DOMAINS)}"
+    if form < 0.8:
+        return f"{user}@@{rng.choice(DOMAINS)}"
+    if form < 0.9:
+        return f"{user}.{rng.choice(DOMAINS)}"
+    return f"{user}@{rng.choice(['localhost', '123.45', 'x.c'])}"
+
+
+def gen_phone(rng):
+    a, b, c = rng.randint(100, 999), rng.randint(100, 999), rng.randint(1000, 9999)
+    return rng.choice([
+        f"({a}) {b}-{c}", f"{a}-{b}-{c}", f"{a}.{b}.{c}", f"+1 ({a}) {b}-{c}",
+        f"+254 {a} {b} {c}", f"{a}{b}{c}", f"{a}-{b // 10}-{c}",
+    ])
+
+
+def gen_card(rng):
+    digits = str(rng.choice([4, 5, 3, 6])) + ''.join(rng.choice(string.digits) for _ in range(14))
+    digits += luhn_digit(digits) if rng.random() < 0.7 else rng.choice(string.digits)
+    groups = [digits[i:i + 4] for i in range(0, 16, 4)]
+    return rng.choice([' ', '-', '']).join(groups)
+
+
+def gen_currency(rng):
+    marker = rng.choice(CURRENCY_MARKERS)
+    amount = rng.choice([
+        f"{rng.randint(0, 999)}.{rng.randint(0, 99):02d}",
+        f"{rng.randint(1, 99)},{rng.randint(0, 999):03d}.{rng.randint(0, 99):02d}",
+        f"{rng.randint(1, 99)}.{rng.randint(0, 999):03d},{rng.randint(0, 99):02d}",
+        f"{rng.randint(1, 9999)}",
+        f"{rng.randint(0, 99)}.{rng.randint(0, 9)}",
+    ])
+    if marker.endswith(' ') and rng.random() < 0.3:
+        return f"{amount} {marker.strip()}"
+    return marker + amount
+
+
+ENTITY_GENERATORS = [gen_email, gen_phone, gen_card, gen_currency, gen_time]
+
+
+##NOISE AND LINE TEMPLATES
+
+def gen_words(rng, n):
+    return ' '.join(rng.choice(WORDS) for _ in range(n))
+
+
+def gen_noise(rng):
+    """Tokens that look a little like entities without being any."""
+    return rng.choice([
+        f"id={rng.getrandbits(48):x}",
+        f"v{rng.randint(0, 9)}.{rng.randint(0, 20)}.{rng.randint(0, 99)}",
+        f"{rng.choice(SERVICES)}.{rng.choice(DOMAINS)}",
+        f"https://{rng.choice(DOMAINS)}/v1/{rng.choice(SERVICES)}?page={rng.randint(1, 50)}",
+        f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        f"sha={rng.getrandbits(128):032x}",
+        f"{rng.randint(1, 500)} items",
+        gen_words(rng, 3),
+    ])
+
+
+def gen_adversarial(rng):
+    """Worst cases for backtracking and for the skip prefix of the combined scan."""
+    n = rng.randint(500, 5000)
+    return rng.choice([
+        ''.join(rng.choice(string.digits) for _ in range(n)),
+        '.'.join(rng.choice(['a', 'ab', 'x1', 'node']) for _ in range(n // 3)),
+        '-'.join(rng.choice(['1', '12', '123']) for _ in range(n // 3)),
+        ' '.join(f"{rng.randint(0, 9999):04d}" for _ in range(n // 5)),
+        '$' + ','.join('1' for _ in range(n // 2)),
+        'a' * n + '@' + 'b.' * (n // 2),
+    ])
+
+
+def gen_line(rng, density):
+    entities = []
+    if rng.random() < density:
+        entities = [gen(rng) for gen in rng.sample(ENTITY_GENERATORS, rng.randint(1, 3))]
+    noise = [gen_noise(rng) for _ in range(rng.randint(1, 3))]
+    form = rng.random()
+    if form < 0.4:
+        fields = [f'"{k}": "{v}"' for k, v in zip(['ref', 'note', 'trace'], noise)]
+        fields += [f'"{g}": "{e}"' for g, e in zip(['contact', 'value', 'when'], entities)]
+        rng.shuffle(fields)
+        return '{"id": %d, %s}' % (rng.randint(1, 10 ** 6), ', '.join(fields))
+    if form < 0.7:
+        stamp = f"2024-05-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}Z"
+        level = rng.choice(['INFO', 'WARN', 'ERROR', 'DEBUG'])
+        return f"{stamp} {level} [{rng.choice(SERVICES)}] " + ' '.join(noise + entities)
+    parts = [gen_words(rng, rng.randint(2, 8))] + noise + entities
+    rng.shuffle(parts)
+    return ' '.join(parts)
+
+
+def line_pool(seed, density, adversarial):
+    rng = random.Random(seed)
+    return [
+        gen_adversarial(rng) if rng.random() < adversarial else gen_line(rng, density)
+        for _ in range(POOL_LINES)
+    ]
+
+
+def generate(path, size, density=0.2, adversarial=0.001, seed=0):
+    """Writes about `size` bytes (whole lines, UTF-8) to path. Returns the bytes written."""
+    pool = [(line + '\n').encode('utf-8') for line in line_pool(seed, density, adversarial)]
+    rng = random.Random(seed + 1)
+    written = 0
+    with open(path, 'wb') as f:
+        while written < size:
+            block = b''.join(rng.choices(pool, k=WRITE_LINES))
+            if written + len(block) > size:
+                # Finish on a whole line near the requested size
+                cut = block.find(b'\n', size - written - 1) + 1
+                block = block[:cut or len(block)]
+            f.write(block)
+            written += len(block)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic API response corpus.")
+    parser.add_argument('path')
+    parser.add_argument('--size', default='16MB', help="e.g. 1MB, 512MB, 10GB")
+    parser.add_argument('--density', type=float, default=0.2)
+    parser.add_argument('--adversarial', type=float, default=0.001)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    written = generate(args.path, parse_size(args.size), args.density, args.adversarial, args.seed)
+    print(f"wrote {written:,} bytes to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
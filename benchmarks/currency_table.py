@@ -0,0 +1,162 @@
+"""
+Benchmark: currency marker table size and trie-shaped patterns.
+
+Compares the single-pass scan with the current 10 markers against a table of
+about 200 (ISO 4217 codes plus local symbols). Each table is compiled two ways:
+  flat - one alternative per marker (USD|UGX|...), as the pattern used to be written
+  trie - currency_table.trie_pattern (U(?:GX|SD)|...)
+First checks that, for every table, scan() returns exactly what re.findall returns
+for each extractor pattern. It also checks that the one-pass marker split in
+validate_currency gives the same answers as the old two-search-plus-sub validator
+for currencies written in the old (en, 2 decimals) format.
+
+The "validate" column is slower than the old validator's: the table validator
+resolves the currency, tries its number formats and explains errors per format,
+which costs about twice as long per candidate. Marker lookup is not the
+bottleneck: markers are split with one regex call, with letters written as
+[Kk] classes instead of re.IGNORECASE.
+
+Run from the repository root:
+    python -m benchmarks.currency_table
+"""
+import os
+import random
+import re
+import tempfile
+import time
+from functools import cached_property
+
+import all_validations as av
+from currency_table import CurrencyTable, DEFAULT_MARKERS, DEFAULT_TABLE, ISO_4217_CODES, LOCAL_SYMBOLS
+from extractors.currencies import validate_currency
+from benchmarks.single_pass import build_input
+
+SIZE_MB = 4
+VALIDATIONS = 200_000
+EXTRA_LINES = [
+    "Paid KSh 1,200 and ₦500 plus R$12.00, refund 100 TZS, fee usd 3.50",
+    "Totals: ₹1,234.56 / 12 CHF / A$20 / TSh 5,000 / 7.50 fRw",
+    "all 5 items, top 3 results, call 555 0100, mop 12 floors",
+]
+
+
+class FlatTable(CurrencyTable):
+    """Same markers, written as one alternative per marker (longest first)."""
+    @cached_property
+    def prefix_pattern(self):
+        return '(?:' + '|'.join(re.escape(m) for m in sorted(self.codes, key=len, reverse=True)) + ')'
+
+    @cached_property
+    def suffix_pattern(self):
+        return '(?:' + '|'.join(re.escape(m) for m in sorted(self.word_markers, key=len, reverse=True)) + ')'
+
+
+# The validator before the marker table: two searches and a sub per candidate
+OLD_MARKERS = r'\$|£|€|RWF|UGX|USD|EUR|GBP|KSH|KES'
+OLD_CODES = r'RWF|UGX|USD|EUR|GBP|KSH|KES'
+old_start_re = re.compile(r'^\s*(?:' + OLD_MARKERS + ')', re.IGNORECASE)
+old_end_re = re.compile(r'(?:' + OLD_CODES + r')\s*$', re.IGNORECASE)
+old_marker_re = re.compile(r'(?:' + OLD_MARKERS + ')', re.IGNORECASE)
+
+
+def old_validate_currency(candidate):
+    s = candidate.strip()
+    if not old_start_re.search(s) and not old_end_re.search(s):
+        return "Invalid: Missing currency marker"
+    numeric_part = old_marker_re.sub('', s).strip()
+    if '.' in numeric_part:
+        int_part, dec_part = numeric_part.split('.', 1)
+        if len(dec_part) != 2 or not dec_part.isdigit():
+            return "Invalid: Decimal part must have exactly 2 digits"
+    else:
+        int_part = numeric_part
+    int_clean = int_part.replace(',', '')
+    if not int_clean.isdigit():
+        return "Invalid: Contains non-digit characters in integer part"
+    groups = int_part.split(',')
+    if len(groups) > 1:
+        if len(groups[0]) > 3 or any(len(g) != 3 for g in groups[1:]):
+            return "Invalid: Incorrect comma placement in thousands"
+    return "Valid currency amount"
+
+
+def tables():
+    # The large table is case-sensitive: ignoring case would turn words such as
+    # "all 5" or "top 3" into ALL and TOP amounts
+    extended = {**{code: code for code in ISO_4217_CODES}, **LOCAL_SYMBOLS, **DEFAULT_MARKERS}
+    for label, markers, ignore_case in (('10', DEFAULT_MARKERS, True), (str(len(extended)), extended, False)):
+        yield f'{label} flat', FlatTable(markers, ignore_case)
+        yield f'{label} trie', CurrencyTable(markers, ignore_case)
+
+
+def check_scan(table, text):
+    pattern = re.compile(av.build_combined_source(table))
+    found = {name: [] for name in av.ENTITY_NAMES}
+    for name, start, end, candidate in av.scan(text, pattern=pattern):
+        found[name].append(candidate)
+    for name, entity_pattern in av.entity_patterns(table):
+        assert found[name] == re.findall(entity_pattern, text), f"{name} differs"
+    return pattern
+
+
+def random_candidates(rng, n):
+    pieces = ['$', '£', '€', 'usd', 'KES', 'Ksh', 'RWF', 'eur', ' ', '.', ',', '1', '23', '456', '7,890', '.5', '.00']
+    return [''.join(rng.choice(pieces) for _ in range(rng.randint(1, 6))) for _ in range(n)]
+
+
+def currency_rules_changed(candidate):
+    """
+    True for amounts the multi-locale parser judges differently from the old validator
+    on purpose: EUR and RWF amounts follow their own locale rules, and an amount
+    starting with a group separator (",456") is no longer accepted.
+    """
+    marker, numeric_part = DEFAULT_TABLE.split_markers(candidate.strip())
+    if marker is not None and DEFAULT_TABLE.code_for(marker) in ('EUR', 'RWF'):
+        return True
+    return numeric_part.strip().startswith(',')
+
+
+def main():
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        sample_lines = f.read().splitlines() + EXTRA_LINES
+
+    rng = random.Random(0)
+    candidates = random_candidates(rng, VALIDATIONS)
+    for candidate in candidates[:20_000]:
+        if currency_rules_changed(candidate):
+            continue
+        assert validate_currency(candidate) == old_validate_currency(candidate), candidate
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = {}
+        for kind in ('prose', 'dense'):
+            path = os.path.join(tmp, f'{kind}.txt')
+            build_input(path, kind, SIZE_MB, sample_lines)
+            with open(path, 'r', encoding='utf-8') as f:
+                inputs[kind] = f.read()
+
+    print(f"scan of {SIZE_MB}MB inputs (MB/s); validation of {VALIDATIONS:,} candidates")
+    print(f"{'markers':>10} {'prose':>8} {'dense':>8} {'currency found':>15} {'validate':>9}")
+    start = time.perf_counter()
+    for candidate in candidates:
+        old_validate_currency(candidate)
+    print(f"{'10 old':>10} {'':>8} {'':>8} {'':>15} {time.perf_counter() - start:>8.2f}s")
+    for label, table in tables():
+        rates = []
+        for kind, text in inputs.items():
+            pattern = check_scan(table, text[:200_000])
+            best = float('inf')
+            for _ in range(2):
+                start = time.perf_counter()
+                currency = sum(1 for m in av.scan(text, pattern=pattern) if m[0] == 'currency')
+                best = min(best, time.perf_counter() - start)
+            rates.append(len(text) / best / 1e6)
+        start = time.perf_counter()
+        for candidate in candidates:
+            validate_currency(candidate, table)
+        elapsed = time.perf_counter() - start
+        print(f"{label:>10} {rates[0]:>8.1f} {rates[1]:>8.1f} {currency:>15,} {elapsed:>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: memory and throughput of the dedup modes (dedup.py) at 10M unique candidates.
+
+Each mode runs in a fresh child process that feeds COUNT distinct, email-like
+candidates (built on the fly, so the input itself takes no memory) to first_seen(),
+then replays the first REPLAY of them, which must all be reported as duplicates.
+Reported per mode: candidates/s, the structure's own size, growth of peak RSS, and
+how many distinct candidates were wrongly reported as duplicates (digest collisions
+for hashed, false positives for Bloom).
+
+Run from the repository root:
+    python -m benchmarks.dedup
+    python -m benchmarks.dedup --count 1000000
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from dedup import DEDUP_MODES
+
+COUNT = 10_000_000
+REPLAY = 1_000_000
+MODES = {
+    'exact': {},
+    'hashed': {},
+    'bloom 1%': {'false_positive_rate': 0.01},
+    'bloom 0.1%': {'false_positive_rate': 0.001},
+}
+
+
+def candidate(i):
+    return f"txn{i:09d}.{i * 2654435761 % 4294967296:08x}@pay{i % 97}.example.com"
+
+
+def measure(mode, count):
+    options = dict(MODES[mode])
+    cls = DEDUP_MODES[mode.split()[0]]
+    if cls is DEDUP_MODES['bloom']:
+        options['capacity'] = count
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    dedup = cls(**options)
+    first_seen = dedup.first_seen
+
+    start = time.perf_counter()
+    dropped = 0
+    for i in range(count):
+        if not first_seen(candidate(i)):
+            dropped += 1
+    elapsed = time.perf_counter() - start
+
+    missed = sum(1 for i in range(min(REPLAY, count)) if first_seen(candidate(i)))
+    assert missed == 0, f"{mode}: {missed} repeated candidates reported as new"
+    if mode == 'exact':
+        assert dropped == 0
+    return {
+        'per_s': count / elapsed,
+        'structure_mb': dedup.memory_bytes() / 1e6,
+        # ru_maxrss is in kilobytes on Linux
+        'rss_growth_mb': (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before) / 1024,
+        'dropped': dropped,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dedup mode memory and throughput.")
+    parser.add_argument('--count', type=int, default=COUNT)
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(measure(args.worker, args.count)))
+        return
+
+    print(f"{args.count:,} unique candidates, then {min(REPLAY, args.count):,} repeats")
+    print(f"{'mode':>11} {'cand/s':>10} {'structure':>10} {'peak RSS +':>11} {'wrongly dropped':>16}")
+    for mode in MODES:
+        out = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.dedup', '--worker', mode, '--count', str(args.count)],
+            check=True, capture_output=True, text=True,
+        )
+        r = json.loads(out.stdout)
+        print(f"{mode:>11} {r['per_s']:>10,.0f} {r['structure_mb']:>8.1f}MB {r['rss_growth_mb']:>9.1f}MB "
+              f"{r['dropped']:>8,} ({r['dropped'] / args.count:.3%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark: email candidate patterns on pathological tokens.
+
+The original patterns retried every position of a long dotted or hyphenated token
+and backtracked over its dots, so their time per byte grows with the token length.
+The current ones (extractors/emails.py) start once per run of [\\w.-] characters.
+
+First checks that the current patterns find the same candidates as the originals on
+api_response.txt, and on 100,000 random strings except for the two documented
+differences. Then times both on tokens of growing length and checks that the current
+patterns (alone and inside the single-pass scan) take bounded time per byte.
+
+Run from the repository root:
+    python -m benchmarks.email_backtracking
+"""
+import random
+import re
+import time
+
+import all_validations as av
+from extractors.emails import (
+    email_with_at_pattern, email_without_at_pattern, MAX_LEADING_SEPARATORS
+)
+
+OLD_WITH_AT = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+OLD_WITHOUT_AT = re.compile(r'\b[\w\.-]+\.[\w\.-]+\b')
+NEW_WITH_AT = re.compile(email_with_at_pattern)
+NEW_WITHOUT_AT = re.compile(email_without_at_pattern)
+
+SIZES = [1_000, 4_000, 16_000, 64_000]
+# The original patterns are quadratic or worse; past this they take minutes
+OLD_MAX_SIZE = 4_000
+# Allowed growth of the time per byte from the smallest to the largest token
+MAX_GROWTH = 3.0
+
+TOKENS = {
+    'hyphenated': lambda n: ('a-' * n)[:n],
+    'dotted': lambda n: ('a.' * n)[:n] + '-',
+    'dot-dash': lambda n: 'x' + ('.-' * n)[:n],
+    'word run': lambda n: 'a' * n,
+    'base64': lambda n: base64_token(n),
+    'local part': lambda n: 'a' * n + '@b',
+    # Not an email token, but the single-pass scan reads it with the currency pattern too
+    'digit group': lambda n: ('123 ' * n)[:n],
+}
+
+
+def base64_token(n):
+    rng = random.Random(n)
+    return ''.join(rng.choice('ABCDEFGHabcdefgh0123456789+/') for _ in range(n))
+
+
+def spans(pattern, text):
+    return [m.span() for m in pattern.finditer(text)]
+
+
+def leading_separators(text, start):
+    return len(re.search(r'[.-]*\Z', text[:start]).group())
+
+
+def check_differences(text):
+    """
+    New matches equal the old ones up to the first documented exception (after it,
+    the '@' pattern may pair the next '@' differently).
+    """
+    old, new = spans(OLD_WITH_AT, text), spans(NEW_WITH_AT, text)
+    # Exception: an old match starting where the previous one ended, inside the same run
+    cut = next((i for i in range(1, len(old))
+                if old[i][0] == old[i - 1][1] and text[old[i][0]] in '.-'), len(old))
+    assert new[:cut] == old[:cut] and (cut < len(old) or new == old), (text, old, new)
+
+    old, new = spans(OLD_WITHOUT_AT, text), spans(NEW_WITHOUT_AT, text)
+    # Exception: an old match after more than MAX_LEADING_SEPARATORS separators
+    assert [s for s in old if leading_separators(text, s[0]) <= MAX_LEADING_SEPARATORS] == new, (text, old, new)
+
+
+def per_byte(pattern, text):
+    start = time.perf_counter()
+    for _ in pattern.finditer(text):
+        pass
+    return (time.perf_counter() - start) / len(text) * 1e9
+
+
+def scan_per_byte(text):
+    start = time.perf_counter()
+    for _ in av.scan(text):
+        pass
+    return (time.perf_counter() - start) / len(text) * 1e9
+
+
+def main():
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        text = f.read()
+    assert OLD_WITH_AT.findall(text) == NEW_WITH_AT.findall(text)
+    assert OLD_WITHOUT_AT.findall(text) == NEW_WITHOUT_AT.findall(text)
+
+    rng = random.Random(0)
+    alphabet = ['a', 'b', '1', '_', 'é', '.', '-', '..', '--', '@', ' ', 'x.y', 'ab@c.d']
+    for _ in range(100_000):
+        check_differences(''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 16))))
+    print("api_response.txt matches unchanged; random-string differences all documented")
+
+    av.compiled_combined_pattern()
+    print("\nns per byte of a single token, surrounded by spaces")
+    print(f"{'token':>11} {'size':>7} {'old @':>9} {'new @':>7} {'old no-@':>10} {'new no-@':>9} {'scan':>7}")
+    growth = {}
+    for label, make in TOKENS.items():
+        rates = []
+        for size in SIZES:
+            token = f" {make(size)} "
+            old_at = old_no = ''
+            if size <= OLD_MAX_SIZE:
+                old_at = f"{per_byte(OLD_WITH_AT, token):.0f}"
+                old_no = f"{per_byte(OLD_WITHOUT_AT, token):.0f}"
+            new_at = per_byte(NEW_WITH_AT, token)
+            new_no = per_byte(NEW_WITHOUT_AT, token)
+            scan = scan_per_byte(token)
+            rates.append((new_at, new_no, scan))
+            print(f"{label:>11} {size:>7,} {old_at:>9} {new_at:>7.0f} {old_no:>10} {new_no:>9.0f} {scan:>7.0f}")
+        growth[label] = [last / max(first, 1e-9) for first, last in zip(rates[0], rates[-1])]
+
+    for label, ratios in growth.items():
+        # Tiny tokens are dominated by call overhead, so only growth is checked
+        assert all(r < MAX_GROWTH for r in ratios), (label, ratios)
+    print(f"\ntime per byte grows less than {MAX_GROWTH}x from {SIZES[0]:,} to {SIZES[-1]:,} bytes for every token")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Benchmark: build time, size and query latency of the entity index (entity_index.py).
+
+Writes a synthetic corpus (benchmarks.corpus) split into FILES files and indexes it.
+Reported: build time (scan and validation vs the index itself), index bytes per
+million indexed entities, time to open the index, and p50/p99 latency of point
+lookups (present and absent terms, per type), files-containing queries, and range
+queries over times and currency amounts.
+
+Before timing, every term's postings and every range query are checked against a
+plain dict of lists built from the same occurrences, so the packed arrays, the
+sorting and the memory-mapped reads are all covered.
+
+Run from the repository root:
+    python -m benchmarks.entity_index
+    python -m benchmarks.entity_index --size 256MB --files 256
+"""
+import argparse
+import datetime
+import os
+import random
+import statistics
+import tempfile
+import time
+from decimal import Decimal
+
+import entity_index as ei
+from benchmarks.corpus import generate, parse_size
+from results import CHECKS
+
+SIZE = '64MB'
+FILES = 64
+QUERIES = 2000
+
+
+def split_corpus(path, directory, files):
+    """Splits the file at path into `files` files of whole lines. Returns their paths."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    paths = []
+    start = 0
+    for i in range(files):
+        end = len(data) if i == files - 1 else data.find(b'\n', (i + 1) * len(data) // files) + 1 or len(data)
+        part = os.path.join(directory, f'part{i:04d}.txt')
+        with open(part, 'wb') as f:
+            f.write(data[start:end])
+        paths.append(part)
+        start = end
+    return paths
+
+
+def reference_postings(paths):
+    """
+    term (entity type, term) -> [(source, offset)], one raw spelling per term, and
+    each term's range key
+    """
+    postings = {}
+    spellings = {}
+    keys = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        for kind, offset, candidate in ei.occurrences(text):
+            result = CHECKS[kind](candidate)
+            if result.valid:
+                term, key = ei.normalized_term(result)
+                postings.setdefault((kind, term), []).append((path, offset))
+                spellings.setdefault((kind, term), candidate)
+                keys[kind, term] = key
+    return postings, spellings, keys
+
+
+def check(index, postings, spellings, keys):
+    assert len(index) == len(postings), "distinct term count differs"
+    for (kind, term), expected in postings.items():
+        # Looked up by a raw spelling, so normalization is covered too
+        assert index.find(kind, spellings[kind, term]) == expected, f"postings differ for {kind} {term!r}"
+        assert index.files(kind, term) == sorted({s for s, _ in expected}, key=index.sources.index)
+    assert index.find('email', 'nobody@nowhere.invalid') == []
+
+    low, high = datetime.time(9, 0), datetime.time(17, 30)
+    expected = sorted((term, s, o) for (kind, term), ps in postings.items() if kind == 'time'
+                      and 9 * 3600 <= keys[kind, term] <= 17 * 3600 + 30 * 60 for s, o in ps)
+    assert sorted(index.times_between(low, high)) == expected, "time range differs"
+    expected = sorted((term, s, o) for (kind, term), ps in postings.items() if kind == 'currency'
+                      and term.startswith('USD ') and 10 <= Decimal(term[4:]) <= 100 for s, o in ps)
+    assert sorted(index.amounts_between(10, 100, code='USD')) == expected, "amount range differs"
+    # Bounds between two cents: the keys are whole minor units
+    expected = sorted((term, s, o) for (kind, term), ps in postings.items() if kind == 'currency'
+                      and term.startswith('USD ') and Decimal('10.005') <= Decimal(term[4:]) <= Decimal('99.995')
+                      for s, o in ps)
+    assert sorted(index.amounts_between(Decimal('10.005'), '99.995', code='USD')) == expected, "amount range differs"
+
+
+def latencies(fn, args):
+    times = []
+    for a in args:
+        start = time.perf_counter()
+        fn(*a)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return statistics.median(times) * 1e6, times[int(len(times) * 0.99)] * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Entity index build time, size and query latency.")
+    parser.add_argument('--size', default=SIZE, help="corpus size, e.g. 64MB, 1GB")
+    parser.add_argument('--files', type=int, default=FILES)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = os.path.join(tmp, 'corpus.txt')
+        generate(corpus, parse_size(args.size), seed=1)
+        paths = split_corpus(corpus, tmp, args.files)
+        os.remove(corpus)
+        index_path = os.path.join(tmp, 'corpus.idx')
+
+        start = time.perf_counter()
+        builder = ei.IndexBuilder()
+        for path in paths:
+            builder.add_file(path)
+        scanned = time.perf_counter()
+        builder.write(index_path)
+        built = time.perf_counter()
+        entities = len(builder.posting_term)
+        size = os.path.getsize(index_path)
+        corpus_mb = sum(os.path.getsize(p) for p in paths) / 1e6
+        print(f"{corpus_mb:.0f}MB in {len(paths)} files: {entities:,} entities, {len(builder.terms):,} distinct")
+        print(f"build: {built - start:.2f}s ({scanned - start:.2f}s scan + validate, "
+              f"{built - scanned:.2f}s sort + write), {entities / (built - start):,.0f} entities/s")
+        # bytes per entity = MB per million entities
+        print(f"index: {size / 1e6:.1f}MB, {size / entities:.1f}MB per million entities")
+        del builder
+
+        postings, spellings, keys = reference_postings(paths)
+        start = time.perf_counter()
+        index = ei.EntityIndex(index_path)
+        opened = time.perf_counter() - start
+        with index:
+            check(index, postings, spellings, keys)
+            print(f"open: {opened * 1e3:.2f}ms; all {len(postings):,} terms and range queries match a dict of lists")
+
+            rng = random.Random(0)
+            terms = list(postings)
+            print(f"\n{'query':>28} {'p50 us':>9} {'p99 us':>9}")
+            for kind in CHECKS:
+                of_kind = [t for t in terms if t[0] == kind]
+                if not of_kind:
+                    continue
+                sample = [(kind, spellings[t]) for t in rng.choices(of_kind, k=QUERIES)]
+                p50, p99 = latencies(index.find, sample)
+                print(f"{'find ' + kind:>28} {p50:>9.1f} {p99:>9.1f}")
+            sample = [('email', f'missing{i}@example.com') for i in range(QUERIES)]
+            p50, p99 = latencies(index.find, sample)
+            print(f"{'find email (absent)':>28} {p50:>9.1f} {p99:>9.1f}")
+            sample = [(kind, spellings[kind, term]) for kind, term in rng.choices(terms, k=QUERIES)]
+            p50, p99 = latencies(index.files, sample)
+            print(f"{'files (any type)':>28} {p50:>9.1f} {p99:>9.1f}")
+
+            hour_ranges = [(datetime.time(h, 0), datetime.time(h, 59)) for h in rng.choices(range(24), k=QUERIES // 10)]
+            p50, p99 = latencies(lambda low, high: list(index.times_between(low, high)), hour_ranges)
+            print(f"{'times in one hour':>28} {p50:>9.1f} {p99:>9.1f}")
+            amount_ranges = [(a, a + 10) for a in rng.choices(range(0, 1000, 10), k=QUERIES // 10)]
+            p50, p99 = latencies(lambda low, high: list(index.amounts_between(low, high, code='USD')), amount_ranges)
+            print(f"{'USD amounts in a 10 range':>28} {p50:>9.1f} {p99:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Throughput benchmark for the regex-free card and phone validators in
+fast_validators.py against the regex ones. That both give identical messages is
+tested in tests/test_fast_validators.py.
+
+Run from the repository root:
+    python -m benchmarks.fast_validators
+"""
+import random
+import time
+
+import all_validations as av
+import fast_validators as fv
+
+BENCH_CALLS = 300_000
+
+
+def rate(validate, inputs):
+    start = time.perf_counter()
+    for value in inputs:
+        validate(value)
+    return len(inputs) / (time.perf_counter() - start)
+
+
+def main():
+    rng = random.Random(0)
+    cards = [rng.choice(['4111 1111 1111 1111', '5500-0000-0000-0004', '378282246310005',
+                         '1234 5678 9012 3456', '0000 1111 2222 3333', '6011000990139424'])
+             for _ in range(BENCH_CALLS)]
+    phones = [rng.choice(['123-456-7890', '(123) 456-7890', '+1 (123) 456-7890',
+                          '+254 712 345 678', '+44 (0)20 7946 0958', '555 123 4567'])
+              for _ in range(BENCH_CALLS)]
+
+    print(f"{'type':>12} {'regex/s':>11} {'fast/s':>11} {'gain':>6}")
+    for kind, old, new, inputs in (
+        ('credit_card', av.validate_credit_card, fv.validate_credit_card_fast, cards),
+        ('phone', av.validate_phone, fv.validate_phone_fast, phones),
+    ):
+        before = rate(old, inputs)
+        after = rate(new, inputs)
+        print(f"{kind:>12} {before:>11,.0f} {after:>11,.0f} {after / before:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: cold-start cost of importing the validators in a fresh interpreter.
+
+Each statement runs in a new `python -c` process, as in a short-lived worker, with
+bytecode caching on (one warm-up run writes the .pyc files first).
+The time of an empty interpreter is measured the same way and subtracted, so
+the numbers are what the import adds. The "eager" row forces every registry
+pattern and the combined regex to compile, which is what importing
+all_validations cost before patterns were compiled on first use.
+
+Before timing, it checks that the lazy loading holds: importing the email or card
+validator must not load the currency table or the time scanner. A failed check exits
+with an error.
+
+Run from the repository root:
+    python -m benchmarks.import_time
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 60
+
+STATEMENTS = [
+    ('import re (floor for regex validators)', "import re"),
+    ('from extractors import validate_phone', "from extractors import validate_phone"),
+    ('from extractors import validate_email', "from extractors import validate_email"),
+    ('import extractors.credit_cards', "import extractors.credit_cards"),
+    ('import all_validations', "import all_validations"),
+    ('all_validations + scan pattern', "import all_validations; all_validations.combined_pattern"),
+    ('eager (everything compiled)',
+     "import all_validations, patterns; all_validations.combined_pattern; "
+     "[getattr(patterns, n) for n in patterns.PATTERN_SOURCES]"),
+]
+
+# Statement -> modules it must not load
+LAZY_CHECKS = [
+    ("from extractors import validate_email", ['currency_table', 'extractors.times']),
+    ("from extractors import validate_credit_card", ['currency_table', 'extractors.times']),
+    ("from extractors import validate_phone", ['currency_table', 'extractors.times']),
+]
+
+
+def loaded_modules(statement):
+    """Names in sys.modules after running statement in a fresh interpreter."""
+    command = [sys.executable, '-S', '-c', statement + "; import sys; print(*sys.modules)"]
+    return set(subprocess.run(command, check=True, capture_output=True, text=True).stdout.split())
+
+
+def check_lazy_imports():
+    failures = []
+    for statement, forbidden in LAZY_CHECKS:
+        loaded = loaded_modules(statement)
+        failures += [f"{statement!r} loads {name}" for name in forbidden if name in loaded]
+    if failures:
+        sys.exit("lazy import check failed:\n  " + "\n  ".join(failures))
+    print(f"lazy import checks passed ({len(LAZY_CHECKS)} statements)")
+
+
+def cold_start(statement):
+    # -S skips site-packages setup so interpreter noise doesn't swamp the imports
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+    command = [sys.executable, '-S', '-c', statement]
+    subprocess.run(command, check=True, env=env)
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, env=env)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    check_lazy_imports()
+    baseline = cold_start('pass')
+    print(f"empty interpreter: {baseline * 1000:.1f} ms (median of {RUNS}, subtracted below)\n")
+    print(f"{'statement':<40} {'added':>9}")
+    for label, statement in STATEMENTS:
+        added = cold_start(statement) - baseline
+        print(f"{label:<40} {added * 1000:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark: incremental extraction of an append-only log. The append, partial line,
+rotation, truncation and rewrite checks are in tests/test_incremental.py.
+
+Appends APPEND_KB to logs of increasing size and times the incremental run,
+next to a full mmap scan of the same file. The incremental time should stay flat
+while the full scan grows with the file.
+
+Run from the repository root:
+    python -m benchmarks.incremental
+"""
+import os
+import tempfile
+import time
+
+import incremental
+import mmap_scan
+from benchmarks.single_pass import build_input
+
+SIZES_MB = [4, 16, 64]
+APPEND_KB = 256
+
+
+def main():
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        sample_lines = f.read().splitlines()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        appended = os.path.join(tmp, 'appended.txt')
+        build_input(appended, 'prose', APPEND_KB / 1024, sample_lines)
+        with open(appended, 'rb') as f:
+            new_bytes = f.read()
+
+        print(f"appending {APPEND_KB}KB to a log, then extracting")
+        print(f"{'log size':>9} {'incremental':>12} {'full scan':>10} {'new records':>12}")
+        for size_mb in SIZES_MB:
+            path = os.path.join(tmp, f'log_{size_mb}mb.txt')
+            build_input(path, 'prose', size_mb, sample_lines)
+            incremental.extract_appended(path)
+            with open(path, 'ab') as f:
+                f.write(new_bytes)
+
+            start = time.perf_counter()
+            records, status, first, stop = incremental.extract_appended(path)
+            incremental_time = time.perf_counter() - start
+            assert status == 'appended' and stop - first == len(new_bytes)
+
+            start = time.perf_counter()
+            list(mmap_scan.mmap_results(path))
+            full_time = time.perf_counter() - start
+            print(f"{size_mb:>7}MB {incremental_time:>11.3f}s {full_time:>9.3f}s {len(records):>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark: cost of the opt-in instrumentation in all_validations.validate_all().
+
+Compares, on a 512KB synthetic text and on 5,000 single-line calls:
+  reference - the pipeline as it was before instrumentation (copied below)
+  disabled  - validate_all(text), no Stats object
+  enabled   - validate_all(text, Stats())
+First checks that all three return the same results and that the recorded counts
+add up. Runs are interleaved and the best of REPEAT is kept.
+
+Whole-workload timings on a busy machine vary by several percent from run to run,
+more than the cost being measured, so the check is done on empty text, where a call
+costs nothing but the pipeline's fixed overhead. Reference and disabled calls are
+timed in alternating pairs and the median difference per call must stay under
+MAX_DISABLED_OVERHEAD of an average single-line call.
+
+Run from the repository root:
+    python -m benchmarks.instrumentation
+"""
+import random
+import statistics
+import time
+import timeit
+
+import all_validations as av
+from benchmarks.corpus import gen_line
+from instrumentation import Stats
+
+LARGE_BYTES = 512 * 1024
+SMALL_CALLS = 5_000
+REPEAT = 15
+EMPTY_PAIRS = 200
+EMPTY_CALLS = 500
+MAX_DISABLED_OVERHEAD = 0.01
+
+
+def reference_validate_all(text):
+    found = {name: [] for name in av.ENTITY_NAMES}
+    for name, start, end, candidate in av.scan(text):
+        found[name].append(candidate)
+    emails_without_at = [e for e in found['email_no_at'] if av.is_email_like(e)]
+    phones = list(dict.fromkeys(found['phone']))
+    candidates = {
+        'email': list(dict.fromkeys(found['email_at'] + emails_without_at)),
+        'time': list(dict.fromkeys(c.strip() for c in found['time'])),
+        'credit_card': list(dict.fromkeys(c.strip() for c in found['credit_card'])),
+        'currency': list(dict.fromkeys(c.strip() for c in found['currency'] if c.strip())),
+        'phone': [p for p in phones if not av.is_credit_card_like(p)],
+    }
+    return {
+        kind: [(c, av.VALIDATORS[kind](c)) for c in values]
+        for kind, values in candidates.items()
+    }
+
+
+def make_lines(rng):
+    lines, size = [], 0
+    while size < LARGE_BYTES:
+        lines.append(gen_line(rng, 0.2))
+        size += len(lines[-1]) + 1
+    return lines
+
+
+def check(text):
+    stats = Stats()
+    expected = reference_validate_all(text)
+    assert av.validate_all(text) == expected
+    assert av.validate_all(text, stats) == expected
+    data = stats.as_dict()
+    assert data['bytes_scanned'] == len(text.encode('utf-8'))
+    for kind, results in expected.items():
+        counts = data['entities'][kind]
+        assert counts['candidates'] == len(results) == counts['valid'] + counts['invalid'], kind
+        assert counts['valid'] == sum(1 for _, r in results if r.startswith('Valid')), kind
+    assert sum(data['matches'].values()) == sum(1 for _ in av.scan(text))
+    assert set(data['stages']) == {'scan', 'dedup', 'validate'}
+
+
+def best_times(workloads):
+    """workloads: label -> callable. Interleaves REPEAT runs of each and keeps the best."""
+    best = {label: float('inf') for label in workloads}
+    for _ in range(REPEAT):
+        for label, work in workloads.items():
+            start = time.perf_counter()
+            work()
+            best[label] = min(best[label], time.perf_counter() - start)
+    return best
+
+
+def main():
+    lines = make_lines(random.Random(0))
+    text = '\n'.join(lines)
+    small = lines[:SMALL_CALLS]
+    check(text)
+    for line in small[:2000]:
+        check(line)
+    print("instrumented and plain pipelines return the same results; counts add up")
+
+    av.compiled_combined_pattern()
+    cases = {
+        f'{len(text) / 1e6:.1f}MB text, 1 call': lambda run: run(text),
+        f'{SMALL_CALLS:,} single-line calls': lambda run: [run(line) for line in small],
+    }
+    print(f"\n{'workload':>28} {'reference':>10} {'disabled':>10} {'enabled':>10}")
+    for label, case in cases.items():
+        times = best_times({
+            'reference': lambda: case(reference_validate_all),
+            'disabled': lambda: case(av.validate_all),
+            'enabled': lambda: case(lambda t: av.validate_all(t, Stats())),
+        })
+        ref = times['reference']
+        print(f"{label:>28} {ref:>9.3f}s {times['disabled'] / ref - 1:>+10.1%} {times['enabled'] / ref - 1:>+10.1%}")
+        line_call = ref / SMALL_CALLS
+
+    extra = statistics.median(
+        (timeit.timeit(lambda: av.validate_all(''), number=EMPTY_CALLS)
+         - timeit.timeit(lambda: reference_validate_all(''), number=EMPTY_CALLS)) / EMPTY_CALLS
+        for _ in range(EMPTY_PAIRS)
+    )
+    print(f"\nextra fixed cost of the disabled pipeline: {extra * 1e6:.2f}us per call"
+          f" ({extra / line_call:+.2%} of a {line_call * 1e6:.0f}us single-line call)")
+    assert extra < MAX_DISABLED_OVERHEAD * line_call, (extra, line_call)
+    print(f"disabled instrumentation costs less than {MAX_DISABLED_OVERHEAD:.0%} of a call")
+
+
+if __name__ == "__main__":
+    main()
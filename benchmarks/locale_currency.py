@@ -0,0 +1,60 @@
+"""
+Benchmark: multi-locale currency amounts. The per-locale correctness checks are in
+tests/test_locale_currency.py.
+
+Times, on mixed-locale text (en 1,234.56 / de 1.234,56 / fr 1 234,56, zero-decimal
+RWF/UGX):
+  scan      - all_validations.scan() over the whole input (MB/s)
+  validate  - validate_currency on every currency candidate found (candidates/s)
+  parse     - parse_currency (message, code and Decimal amount) on the same candidates
+
+Run from the repository root:
+    python -m benchmarks.locale_currency
+"""
+import random
+import time
+
+import all_validations as av
+from extractors.currencies import parse_currency, validate_currency
+
+SIZE_MB = 4
+
+LINES = [
+    "Invoice total 1.234,56 € due, deposit €250,00 received",
+    "Paris: 1 234,56 € incl. TVA; Lyon: 12 345 678 EUR budget",
+    "Mumbai order ₹12,34,567.00, shipping INR 1,00,000",
+    "Kigali fee RWF 1.500 and 1,500 RWF, Kampala 1 000 000 UGX",
+    "US price $1,234.56, UK £12, Nairobi Ksh 1,200",
+    "bad: $12.3, $1,23,456.78, 12.50 RWF, see page 12 345 and 5 items",
+]
+
+
+def build_text(rng):
+    lines = []
+    size = 0
+    filler = "The response lists 3 results for 12 users across 45 regions."
+    while size < SIZE_MB * 1024 * 1024:
+        line = rng.choice(LINES) if rng.random() < 0.5 else filler
+        lines.append(line)
+        size += len(line) + 1
+    return '\n'.join(lines)
+
+
+def main():
+    text = build_text(random.Random(0))
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        candidates = [m[3] for m in av.scan(text) if m[0] == 'currency']
+        best = min(best, time.perf_counter() - start)
+    print(f"scan      {len(text) / best / 1e6:8.1f} MB/s  ({len(candidates):,} currency candidates)")
+    for label, func in (('validate', validate_currency), ('parse', parse_currency)):
+        start = time.perf_counter()
+        for candidate in candidates:
+            func(candidate)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<9} {len(candidates) / elapsed:8,.0f} candidates/s")
+
+
+if __name__ == "__main__":
+    main()
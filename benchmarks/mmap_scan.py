@@ -0,0 +1,73 @@
+"""
+Benchmark: memory-mapped bytes scanning vs open(..., encoding='utf-8').read().
+
+Checks on api_response.txt and a synthetic file with '£' and '€' amounts that the
+bytes scan finds the same candidates as the str scan, and that every reported byte
+offset slices back to its candidate. Then compares throughput of the two paths.
+
+Run from the repository root:
+    python -m benchmarks.mmap_scan
+"""
+import os
+import tempfile
+import time
+
+import all_validations as av
+import mmap_scan
+from benchmarks.single_pass import build_input
+
+SIZES_MB = [1, 8, 32]
+NON_ASCII_LINES = [
+    "Invoice total £1,234.56 or €10.00 after discount",
+    "Refund of €0.99 sent, balance £12.30 remaining",
+]
+
+
+def str_path(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(av.scan(f.read()))
+
+
+def mmap_path(path):
+    return list(mmap_scan.mmap_matches(path))
+
+
+def check(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    str_matches = str_path(path)
+    byte_matches = mmap_path(path)
+    assert [(n, c) for n, _, _, c in str_matches] == \
+           [(n, c.decode('utf-8')) for n, _, _, c in byte_matches]
+    for name, start, end, candidate in byte_matches:
+        assert raw[start:end] == candidate
+
+
+def timed(fn, path):
+    start = time.perf_counter()
+    count = len(fn(path))
+    return time.perf_counter() - start, count
+
+
+def main():
+    check('api_response.txt')
+    print("api_response.txt: bytes scan matches str scan")
+
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        sample_lines = f.read().splitlines() + NON_ASCII_LINES
+
+    print(f"\n{'size':>6} {'read+decode':>12} {'mmap':>8} {'speedup':>8} {'matches':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size_mb in SIZES_MB:
+            path = os.path.join(tmp, f'prose_{size_mb}mb.txt')
+            build_input(path, 'prose', size_mb, sample_lines)
+            check(path)
+
+            str_time, count = timed(str_path, path)
+            mmap_time, _ = timed(mmap_path, path)
+            print(f"{size_mb:>4}MB {str_time:>11.3f}s {mmap_time:>7.3f}s "
+                  f"{str_time / mmap_time:>7.2f}x {count:>8}")
+
+
+if __name__ == "__main__":
+    main()
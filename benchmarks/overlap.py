@@ -0,0 +1,46 @@
+"""
+Benchmark for span-based overlap resolution (overlap.py). The checks against a
+brute-force O(n^2) reference are in tests/test_overlap.py, on the same inputs
+(tests/inputs.py).
+
+1. api_response.txt: shows which candidates the arbitration drops.
+2. Times the resolution stage alone on growing adversarial dense-digit inputs (long
+   digit runs with mixed separators, times and currency markers packed together, and
+   unbroken chains of digit groups where card and phone matches overlap throughout);
+   time per match should stay roughly flat (O(n log n) overall).
+
+Run from the repository root:
+    python -m benchmarks.overlap
+"""
+import time
+
+import all_validations as av
+import overlap
+from tests.inputs import dense_digits, digit_chain, filtered_matches
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def main():
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        text = f.read()
+    before = av.validate_all(text)
+    after = overlap.validate_resolved(text)
+    print("api_response.txt, candidates dropped by overlap resolution:")
+    for kind in before:
+        dropped = [c for c, _ in before[kind] if c not in {c2 for c2, _ in after[kind]}]
+        print(f"  {kind}: {dropped}")
+
+    print(f"\n{'input':>7} {'chars':>10} {'matches':>9} {'kept':>8} {'resolve':>9} {'us/match':>9}")
+    for name, generate in (('mixed', dense_digits), ('chain', digit_chain)):
+        for size in SIZES:
+            matches = filtered_matches(generate(size, size))
+            start = time.perf_counter()
+            winners = list(overlap.resolve_overlaps(matches))
+            elapsed = time.perf_counter() - start
+            print(f"{name:>7} {size:>10,} {len(matches):>9,} {len(winners):>8,} {elapsed:>8.3f}s "
+                  f"{elapsed / len(matches) * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
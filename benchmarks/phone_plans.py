@@ -0,0 +1,52 @@
+"""
+Throughput benchmark for phone validation with country calling code plans
+(phone_plans.py, extractors/phones.py), against the previous validator, which kept
+the last 10 digits of any number. The correctness checks are in
+tests/test_phone_plans.py.
+
+The plan validator does more per number than the one it replaced: it finds the
+calling code, strips the trunk prefix, checks the plan's lengths and leading digits
+and formats the E.164 form, so it runs at about two thirds of the old rate.
+fast_validators.validate_phone_fast gives the same results without regexes.
+
+Run from the repository root:
+    python -m benchmarks.phone_plans
+"""
+import random
+import time
+
+from benchmarks.validators import old_validate_phone
+from extractors.phones import validate_phone
+
+CALLS = 300_000
+
+# East African, UK and NANP numbers, valid and not
+NUMBERS = [
+    '+254 712 345 678', '+254712345678', '+254 (0)712 345 678', '+254 712 345 6789',
+    '+256 772 123456', '+255 754 123 456', '+250 788 123 456', '+257 22 12 34 56',
+    '+44 20 7946 0958', '+44 (0)20 7946 0958', '+44 7700 900123', '+44 20 7946',
+    '+1 (212) 456-7890', '+1 415 555 2671', '212-456-7890', '(555)2345678',
+    '555.234.5678', '(55) 123-4567', '123-456-7890', '1 (212) 456-7890',
+    '+999 123 4567', '+0 123 456 7890',
+]
+
+
+def rate(validate, inputs):
+    start = time.perf_counter()
+    for value in inputs:
+        validate(value)
+    return len(inputs) / (time.perf_counter() - start)
+
+
+def main():
+    rng = random.Random(0)
+    numbers = [rng.choice(NUMBERS) for _ in range(CALLS)]
+    before = rate(old_validate_phone, numbers)
+    after = rate(validate_phone, numbers)
+    print(f"\n{CALLS:,} validations")
+    print(f"{'last 10 digits':>15} {before:>11,.0f}/s")
+    print(f"{'calling codes':>15} {after:>11,.0f}/s {after / before:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: throughput and memory of the redaction pass (redact.py). The chunked,
+policy and hash checks are in tests/test_redact.py.
+
+Writes a synthetic corpus (benchmarks.corpus) of --size bytes and redacts it
+file to file with each policy, each run in a fresh child process, reporting MB/s and
+peak RSS. The default policies also run on a corpus a quarter of the size: the peak
+RSS of the two should be about the same, as the pass keeps only one chunk in memory.
+
+Run from the repository root:
+    python -m benchmarks.redact
+    python -m benchmarks.redact --size 4GB
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import redact
+from benchmarks.corpus import generate, parse_size
+
+SIZE = '128MB'
+RUNS = [('default', [])] + [(policy, [policy]) for policy in redact.POLICIES]
+
+
+def measure(path, policies):
+    redactor = redact.Redactor(redact.parse_policies(policies), salt='benchmark')
+    start = time.perf_counter()
+    with redact.open_text(path, 'r') as source, open(os.devnull, 'w', encoding='utf-8', errors='surrogateescape') as target:
+        redactor.redact_file(source, target)
+    elapsed = time.perf_counter() - start
+    return {
+        'mb_per_s': os.path.getsize(path) / elapsed / 1e6,
+        # ru_maxrss is in kilobytes on Linux
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'masked': sum(redactor.counts.values()),
+    }
+
+
+def run_child(path, policies):
+    out = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.redact', '--worker', path, *[f'--policy={p}' for p in policies]],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Redaction throughput and memory.")
+    parser.add_argument('--size', default=SIZE, help="corpus size, e.g. 128MB, 4GB")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument('--policy', action='append', default=[], help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(measure(args.worker, args.policy)))
+        return
+
+    size = parse_size(args.size)
+    with tempfile.TemporaryDirectory() as tmp:
+        small, large = os.path.join(tmp, 'small.txt'), os.path.join(tmp, 'large.txt')
+        generate(small, size // 4, seed=1)
+        generate(large, size, seed=1)
+        print(f"{'size':>9} {'policy':>8} {'MB/s':>7} {'peak RSS MB':>12} {'masked':>10}")
+        for path, runs in ((small, RUNS[:1]), (large, RUNS)):
+            for name, policies in runs:
+                stats = run_child(path, policies)
+                print(f"{os.path.getsize(path) / 1024 / 1024:>7.0f}MB {name:>8} {stats['mb_per_s']:>7.1f} "
+                      f"{stats['peak_rss_mb']:>12.1f} {stats['masked']:>10,}")
+
+
+if __name__ == "__main__":
+    main()
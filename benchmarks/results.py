@@ -0,0 +1,99 @@
+"""
+Benchmark: memory and build time of 1M structured Result records vs message strings.
+
+Checks first that Result.message reproduces the validate_* output for every candidate
+in api_response.txt and for a set of edge cases. Then builds 1M results both ways and
+measures allocated memory with tracemalloc:
+  strings - (entity type, candidate, start, end, message) tuples
+  records - results.Result objects (__slots__), message rendered on demand
+Records also carry the normalized value (datetime.time, Decimal amount, ...), which
+the strings only hold inside the message text. Build times are measured in a
+separate run without tracemalloc, with the cyclic GC paused (as timeit does) and
+again with it running: unlike the tuples of strings, which the GC stops tracking,
+every record stays tracked, so holding a million of them makes the collections that
+run meanwhile longer.
+
+Run from the repository root:
+    python -m benchmarks.results
+"""
+import gc
+import random
+import time
+import tracemalloc
+
+import all_validations as av
+import results
+
+COUNT = 1_000_000
+EDGE_CASES = {
+    'email': ['a@b', 'x@y.c0m', 'bad name@x.com', 'a@b..com', 'a@b.c-d.org', 'a@@b.com'],
+    'time': ['12:00 AM', '12:00 pm', '0:30 AM', '23:59', '7:5', '13:00 PM', '9:75'],
+    'credit_card': ['4111 1111 1111 1111', '378282246310005', '12345', '4444444444444', '1234-56x8-9012-3456'],
+    'currency': ['KES 1,500', 'Ksh 1200', '12.5 RWF', '€1,00,000.00', '£0.99', 'USD 1,234,567.89'],
+    'phone': ['+254 712 345 678', '(555)1234567', '555.123.4567', '(55) 123-4567', '12345',
+              '+44 (0)20 7946 0958', '+44 20 7946', '+999 123 4567', '+1 123 (456) 7890'],
+}
+
+
+def candidates():
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        found = av.extract_all(f.read())
+    return {kind: found[kind] + EDGE_CASES[kind] for kind in found}
+
+
+def check(pool):
+    for kind, values in pool.items():
+        for value in values:
+            assert results.CHECKS[kind](value).message == av.VALIDATORS[kind](value), (kind, value)
+    for luhn in (False, True):
+        for card in pool['credit_card']:
+            assert results.check_credit_card(card, luhn=luhn).message == av.validate_credit_card(card, luhn)
+
+
+def build(make, inputs):
+    # Timed with the cyclic GC paused, as timeit does: each record is a GC-tracked
+    # object, and the collections a million of them trigger are reported apart
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        [make(kind, value, i) for i, (kind, value) in enumerate(inputs)]
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+    start = time.perf_counter()
+    [make(kind, value, i) for i, (kind, value) in enumerate(inputs)]
+    with_gc = time.perf_counter() - start
+
+    tracemalloc.start()
+    built = [make(kind, value, i) for i, (kind, value) in enumerate(inputs)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return built, elapsed, with_gc, size
+
+
+def main():
+    pool = candidates()
+    check(pool)
+    print("Result.message matches the validate_* output")
+
+    rng = random.Random(0)
+    flat = [(kind, value) for kind, values in pool.items() for value in values]
+    # Fresh string objects per input, as they would be after extraction from a large file
+    inputs = [(kind, ''.join(list(value))) for kind, value in (rng.choice(flat) for _ in range(COUNT))]
+
+    _, str_time, str_gc, str_size = build(lambda kind, value, i: (kind, value, i, i + len(value), av.VALIDATORS[kind](value)), inputs)
+    records, rec_time, rec_gc, rec_size = build(lambda kind, value, i: results.CHECKS[kind](value, i, i + len(value)), inputs)
+
+    start = time.perf_counter()
+    for record in records:
+        record.message
+    render_time = time.perf_counter() - start
+
+    print(f"\n{COUNT:,} results")
+    print(f"{'':>8} {'build':>8} {'with GC':>8} {'memory':>10} {'bytes/result':>13}")
+    print(f"{'strings':>8} {str_time:>7.2f}s {str_gc:>7.2f}s {str_size / 2**20:>8.1f}MB {str_size / COUNT:>13.0f}")
+    print(f"{'records':>8} {rec_time:>7.2f}s {rec_gc:>7.2f}s {rec_size / 2**20:>8.1f}MB {rec_size / COUNT:>13.0f}")
+    print(f"rendering every record's message afterwards: {render_time:.2f}s")
+
+if __name__ == "__main__":
+    main()
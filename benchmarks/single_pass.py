@@ -0,0 +1,136 @@
+"""
+Benchmark: single-pass extraction engine vs the original per-type passes.
+
+The original all_validations.py read api_response.txt once per entity type and ran
+six separate re.findall scans. This script reproduces that path and compares it with
+all_validations.extract_all() on two kinds of input:
+  dense  - api_response.txt repeated (almost every line holds several entities)
+  prose  - filler text with an api_response.txt line every 20 lines, closer to real
+           API bodies where most of the text can't start a match
+at sizes from 0.25MB to 16MB, then at DENSITY_SIZE_MB with an api_response.txt line
+every 1 to 100 lines.
+
+Both paths are linear in the input, so the speedup does not grow with size: it is
+set by the share of the text that can start a match. The single pass skips filler
+text in one possessive step, where the six findall scans each try every position,
+so the sparser the entities, the larger the speedup (about 10x on prose); on dense
+input every position is tried anyway and it is about 1.25x.
+
+Run from the repository root:
+    python -m benchmarks.single_pass
+"""
+import os
+import random
+import re
+import tempfile
+import time
+
+import all_validations as av
+from extractors.currencies import currency_pattern
+
+SIZES_MB = [0.25, 1, 4, 16]
+DENSITY_SIZE_MB = 4
+# One api_response.txt line every N lines (1 = dense)
+EVERY_N_LINES = [1, 2, 5, 20, 100]
+EVERY_FOR_KIND = {'dense': 1, 'prose': 20}
+FILLER_WORDS = ("the status result items name value true false null message data "
+                "response request record summary updated created account").split()
+
+
+def multipass_extract(file_path):
+    """The original all_validations.py flow: one file read and scan per entity type."""
+    def read():
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    text = read()
+    emails_with_at = re.findall(av.email_with_at_pattern, text)
+    emails_without_at = [e for e in re.findall(av.email_without_at_pattern, text) if av.is_email_like(e)]
+    emails = list(set(emails_with_at + emails_without_at))
+
+    text = read()
+    times = list(dict.fromkeys(c.strip() for c in re.findall(av.time_candidate_pattern, text)))
+
+    text = read()
+    cards = list(dict.fromkeys(c.strip() for c in re.findall(av.cc_pattern, text)))
+
+    text = read()
+    currency = re.findall(currency_pattern, text, flags=re.IGNORECASE)
+    currency = list(dict.fromkeys(c.strip() for c in currency if c.strip()))
+
+    text = read()
+    phones = list(dict.fromkeys(m.group(0) for m in re.finditer(av.phone_pattern, text)))
+    phones = [p for p in phones if not av.is_credit_card_like(p)]
+
+    return {'email': emails, 'time': times, 'credit_card': cards, 'currency': currency, 'phone': phones}
+
+
+def single_pass_extract(file_path):
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return av.extract_all(f.read())
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def build_input(path, kind, size_mb, sample_lines):
+    """
+    size_mb of filler lines with an api_response.txt line every N lines: kind is N,
+    or 'dense' (1) or 'prose' (20).
+    """
+    every = EVERY_FOR_KIND.get(kind, kind)
+    rng = random.Random(0)
+    target = int(size_mb * 1024 * 1024)
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        i = 0
+        while written < target:
+            if i % every == 0:
+                line = sample_lines[i % len(sample_lines)]
+            else:
+                line = ' '.join(rng.choice(FILLER_WORDS) for _ in range(10))
+            f.write(line + '\n')
+            written += len(line) + 1
+            i += 1
+
+
+def compare(path):
+    """(multi-pass seconds, single-pass seconds), after checking both find the same candidates."""
+    old_time, old = timed(multipass_extract, path)
+    new_time, new = timed(single_pass_extract, path)
+
+    # Same candidates per type (the old email list came from a set, so compare as sets)
+    assert set(old['email']) == set(new['email'])
+    for entity in ('time', 'credit_card', 'currency', 'phone'):
+        assert old[entity] == new[entity], entity
+    return old_time, new_time
+
+
+def main():
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        sample_lines = f.read().splitlines()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'input':>6} {'size':>8} {'multi-pass':>12} {'single-pass':>12} {'MB/s':>7} {'speedup':>8}")
+        for kind in ('prose', 'dense'):
+            for size_mb in SIZES_MB:
+                path = os.path.join(tmp, f'{kind}_{size_mb}mb.txt')
+                build_input(path, kind, size_mb, sample_lines)
+                old_time, new_time = compare(path)
+                print(f"{kind:>6} {size_mb:>6}MB {old_time:>11.3f}s {new_time:>11.3f}s "
+                      f"{size_mb / new_time:>7.1f} {old_time / new_time:>7.2f}x")
+
+        print(f"\n{DENSITY_SIZE_MB}MB, one api_response.txt line every N lines")
+        print(f"{'N':>6} {'multi-pass':>12} {'single-pass':>12} {'MB/s':>7} {'speedup':>8}")
+        for every in EVERY_N_LINES:
+            path = os.path.join(tmp, f'every_{every}.txt')
+            build_input(path, every, DENSITY_SIZE_MB, sample_lines)
+            old_time, new_time = compare(path)
+            print(f"{every:>6} {old_time:>11.3f}s {new_time:>11.3f}s "
+                  f"{DENSITY_SIZE_MB / new_time:>7.1f} {old_time / new_time:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
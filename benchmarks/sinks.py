@@ -0,0 +1,140 @@
+"""
+Benchmark: output sinks (sinks.py) vs one print() per result.
+
+First checks on api_response.txt and a 1MB synthetic corpus that TextSink writes
+exactly what `python all_validations.py` prints, that the CSV rows are those csv.writer
+writes, and that the JSONL, CSV and columnar files read back to the same records. Then writes RESULTS validated candidates with:
+  print (block)  - print(f"{candidate}: {message}") to a file, as stdout to a pipe
+  print (line)   - the same, line-buffered, as stdout to a terminal
+  text / jsonl / csv / columnar sinks
+and reports the time and output size of each.
+
+Run from the repository root:
+    python -m benchmarks.sinks
+"""
+import contextlib
+import csv
+import io
+import json
+import os
+import random
+import tempfile
+import time
+
+import all_validations as av
+from benchmarks.corpus import ENTITY_GENERATORS, generate
+from results import CHECKS
+from sinks import FIELDS, ColumnarSink, CsvSink, JsonlSink, TextSink, file_results, read_columnar
+
+RESULTS = 1_000_000
+CHECK_CORPUS_BYTES = 1024 * 1024
+KINDS = ['email', 'phone', 'credit_card', 'currency', 'time']
+
+
+def make_results(n, rng):
+    results = []
+    offset = 0
+    for i in range(n):
+        kind = KINDS[i % len(KINDS)]
+        candidate = ENTITY_GENERATORS[i % len(KINDS)](rng)
+        results.append(CHECKS[kind](candidate, offset, offset + len(candidate)))
+        offset += len(candidate) + rng.randint(1, 200)
+    return results
+
+
+def check_text(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        av.main([path])
+    written = io.StringIO()
+    with TextSink(written) as sink:
+        sink.write(path, file_results(text))
+    assert written.getvalue() == printed.getvalue(), path
+
+    records = list(file_results(text))
+    data = text.encode('utf-8')
+    for r in records:
+        assert data[r.start:r.end].decode('utf-8').strip() == r.raw.strip(), (r, data[r.start:r.end])
+    return records
+
+
+def check_structured(records, tmp):
+    # Candidates the CSV and JSON writers have to quote or escape
+    records = records + [CHECKS['email'](raw, 0, len(raw)) for raw in ('a,b@x.com', 'say "hi"@x.com', 'a\nb@x.com\r')]
+    expected = [(r.entity_type, r.start, r.end, r.raw, r.valid, r.error.name) for r in records]
+
+    out = io.StringIO()
+    with JsonlSink(out) as sink:
+        sink.write('src', records)
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [(d['type'], d['start'], d['end'], d['candidate'], d['valid'], d['error']) for d in rows] == expected
+    assert all(d['source'] == 'src' for d in rows)
+
+    out = io.StringIO()
+    with CsvSink(out) as sink:
+        sink.write('src', records)
+    expected_csv = io.StringIO()
+    csv.writer(expected_csv, lineterminator='\n').writerows(
+        [FIELDS] + [('src', r.entity_type, r.start, r.end, r.raw, int(r.valid), r.error.name, r.message) for r in records])
+    assert out.getvalue() == expected_csv.getvalue(), "CSV rows differ from csv.writer's"
+    rows = list(csv.DictReader(io.StringIO(out.getvalue(), newline='')))
+    assert [(d['type'], int(d['start']), int(d['end']), d['candidate'], d['valid'] == '1', d['error'])
+            for d in rows] == expected
+
+    path = os.path.join(tmp, 'check.cols')
+    with ColumnarSink(path) as sink:
+        sink.write('src', records)
+    header, cols = read_columnar(path)
+    assert header['rows'] == len(records) and header['sources'] == ['src']
+    assert [(header['types'][cols['type'][i]], cols['start'][i], cols['end'][i], cols['candidate'][i],
+             bool(cols['valid'][i]), records[i].error.__class__(cols['error'][i]).name)
+            for i in range(len(records))] == expected
+
+
+def print_loop(path, results, buffering):
+    with open(path, 'w', encoding='utf-8', buffering=buffering) as f:
+        for r in results:
+            print(f"{r.raw}: {r.message}", file=f)
+
+
+def sink_writer(make):
+    def run(path, results):
+        with make(path) as sink:
+            sink.write('corpus.txt', results)
+    return run
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = os.path.join(tmp, 'corpus.txt')
+        generate(corpus, CHECK_CORPUS_BYTES, seed=3)
+        check_text('api_response.txt')
+        records = check_text(corpus)
+        check_structured(records, tmp)
+        print(f"text sink output identical to all_validations.py; {len(records):,} records round-trip")
+
+        results = make_results(RESULTS, random.Random(0))
+        writers = {
+            'print (block)': lambda path, rs: print_loop(path, rs, -1),
+            'print (line)': lambda path, rs: print_loop(path, rs, 1),
+            'text': sink_writer(lambda p: TextSink(open(p, 'w', encoding='utf-8'), close_stream=True)),
+            'jsonl': sink_writer(lambda p: JsonlSink(open(p, 'w', encoding='utf-8'), close_stream=True)),
+            'csv': sink_writer(lambda p: CsvSink(open(p, 'w', encoding='utf-8', newline=''), close_stream=True)),
+            'columnar': sink_writer(ColumnarSink),
+        }
+        print(f"\nwriting {RESULTS:,} results")
+        print(f"{'writer':>14} {'seconds':>8} {'results/s':>11} {'size':>9}")
+        for label, write in writers.items():
+            path = os.path.join(tmp, 'out')
+            start = time.perf_counter()
+            write(path, results)
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(path)
+            print(f"{label:>14} {elapsed:>8.2f} {RESULTS / elapsed:>11,.0f} {size / 1e6:>7.1f}MB")
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
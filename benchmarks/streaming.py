@@ -0,0 +1,58 @@
+"""
+Benchmark: chunked streaming extraction vs reading the whole file.
+
+Measures throughput and peak Python memory (tracemalloc) on synthetic files. That
+streaming returns the same matches as a whole-file scan is tested in
+tests/test_streaming.py.
+
+Run from the repository root:
+    python -m benchmarks.streaming
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+
+import all_validations as av
+import streaming
+from benchmarks.single_pass import build_input
+
+SIZES_MB = [1, 8, 32]
+
+
+def whole_file_matches(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(av.scan(f.read()))
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = sum(1 for _ in fn(*args))
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, count
+
+
+def main():
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        sample_lines = f.read().splitlines()
+
+    print(f"{'size':>6} {'mode':>8} {'MB/s':>8} {'peak MB':>9} {'matches':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size_mb in SIZES_MB:
+            path = os.path.join(tmp, f'prose_{size_mb}mb.txt')
+            build_input(path, 'prose', size_mb, sample_lines)
+
+            for mode, fn, args in (
+                ('whole', whole_file_matches, (path,)),
+                ('stream', streaming.stream_matches, (path, 1024 * 1024, streaming.DEFAULT_OVERLAP)),
+            ):
+                elapsed, peak, count = measure(fn, *args)
+                print(f"{size_mb:>4}MB {mode:>8} {size_mb / elapsed:>8.1f} "
+                      f"{peak / 1024 / 1024:>9.1f} {count:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Benchmark harness: throughput and memory of every extractor on a synthetic corpus.
+
+Measures, each in a fresh child process so peak RSS belongs to that measurement alone:
+  email_at, email_no_at, time, credit_card, currency, phone
+                 - finditer of that extractor's pattern on its own
+  combined_scan  - all_validations.scan(), every extractor in one pass
+  pipeline       - all_validations.validate_all(): scan, filters, dedup and validation
+and reports MB/s, matches/s and peak RSS for each. The corpus is read in CHUNK_MB
+pieces cut at line ends, so a 10GB corpus needs no more memory than a small one.
+
+Results are written as JSON (--output). Passing an earlier file as --compare prints
+the speed ratio per measurement; with --max-slowdown, any measurement slower than
+that fraction makes the run exit with status 1.
+
+Run from the repository root:
+    python -m benchmarks.suite --size 64MB --output bench.json
+    python -m benchmarks.suite --corpus corpus.txt --compare bench.json --max-slowdown 0.1
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import generate, parse_size
+
+CHUNK_MB = 64
+PIPELINE = ['combined_scan', 'pipeline']
+
+
+def read_chunks(path, chunk_size=CHUNK_MB * 1024 * 1024):
+    """Yields the file's text in pieces of about chunk_size bytes, each ending at a newline."""
+    with open(path, 'rb') as f:
+        rest = b''
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+            data = rest + data
+            cut = data.rfind(b'\n') + 1 or len(data)
+            rest = data[cut:]
+            yield data[:cut].decode('utf-8')
+        if rest:
+            yield rest.decode('utf-8')
+
+
+def measure(name, path, repeat):
+    """Runs one measurement in this process. Returns its result dict."""
+    import all_validations as av
+
+    if name == 'combined_scan':
+        def count(text):
+            return sum(1 for _ in av.scan(text))
+    elif name == 'pipeline':
+        def count(text):
+            return sum(len(records) for records in av.validate_all(text).values())
+    else:
+        pattern = re.compile(dict(av.ENTITY_PATTERNS)[name])
+
+        def count(text):
+            return sum(1 for _ in pattern.finditer(text))
+
+    best = float('inf')
+    for _ in range(repeat):
+        matches = 0
+        elapsed = 0.0
+        for text in read_chunks(path):
+            start = time.perf_counter()
+            matches += count(text)
+            elapsed += time.perf_counter() - start
+        best = min(best, elapsed)
+    size = os.path.getsize(path)
+    return {
+        'seconds': best,
+        'mb_per_s': size / best / 1e6,
+        'matches': matches,
+        'matches_per_s': matches / best,
+        # ru_maxrss is in kilobytes on Linux
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def run_child(name, path, repeat):
+    out = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.suite', '--worker', name, '--corpus', path, '--repeat', str(repeat)],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout)
+
+
+def revision():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def run_suite(path, repeat, corpus_info):
+    from all_validations import ENTITY_NAMES
+
+    results = {}
+    print(f"{'measurement':>14} {'MB/s':>8} {'matches':>11} {'matches/s':>11} {'peak RSS':>9}")
+    for name in ENTITY_NAMES + PIPELINE:
+        r = results[name] = run_child(name, path, repeat)
+        print(f"{name:>14} {r['mb_per_s']:>8.2f} {r['matches']:>11,} {r['matches_per_s']:>11,.0f} "
+              f"{r['peak_rss_mb']:>7.1f}MB")
+    return {
+        'revision': revision(),
+        'python': platform.python_version(),
+        'corpus': corpus_info,
+        'results': results,
+    }
+
+
+def compare(report, baseline, max_slowdown):
+    """Prints new/old speed per measurement. Returns the names slower than allowed."""
+    print(f"\nvs {baseline.get('revision') or 'baseline'}:")
+    if baseline.get('corpus') != report['corpus']:
+        print("(different corpus: the match counts are not comparable)")
+    print(f"{'measurement':>14} {'old MB/s':>9} {'new MB/s':>9} {'speed':>7} {'matches':>9}")
+    slower = []
+    for name, new in report['results'].items():
+        old = baseline['results'].get(name)
+        if old is None:
+            continue
+        ratio = new['mb_per_s'] / old['mb_per_s']
+        same = 'same' if new['matches'] == old['matches'] else f"{new['matches'] - old['matches']:+,}"
+        print(f"{name:>14} {old['mb_per_s']:>9.2f} {new['mb_per_s']:>9.2f} {ratio:>6.2f}x {same:>9}")
+        if max_slowdown is not None and ratio < 1 - max_slowdown:
+            slower.append(name)
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extractor throughput and memory benchmark.")
+    parser.add_argument('--corpus', help="existing corpus file (default: generate one)")
+    parser.add_argument('--size', default='32MB', help="size of the generated corpus")
+    parser.add_argument('--density', type=float, default=0.2)
+    parser.add_argument('--adversarial', type=float, default=0.001)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="write the results as JSON to this file")
+    parser.add_argument('--compare', help="JSON results of an earlier run")
+    parser.add_argument('--max-slowdown', type=float, help="e.g. 0.1 fails on >10%% slower")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(measure(args.worker, args.corpus, args.repeat)))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.corpus:
+            path = args.corpus
+            corpus_info = {'path': os.path.abspath(path), 'bytes': os.path.getsize(path)}
+        else:
+            path = os.path.join(tmp, 'corpus.txt')
+            written = generate(path, parse_size(args.size), args.density, args.adversarial, args.seed)
+            corpus_info = {'bytes': written, 'density': args.density,
+                           'adversarial': args.adversarial, 'seed': args.seed}
+        print(f"corpus: {corpus_info['bytes'] / 1e6:,.1f} MB, best of {args.repeat}")
+        report = run_suite(path, args.repeat, corpus_info)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            slower = compare(report, json.load(f), args.max_slowdown)
+        if slower:
+            print(f"slower than allowed: {', '.join(slower)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+"""
+Throughput benchmark for the time scanner (extractors/times.py). The parse, extraction
+and previous-validator checks are in tests/test_times.py, on the same inputs
+(tests/inputs.py).
+
+Compares ways of extracting and validating the times of a log-like text:
+  two regexes    - the previous path: re.findall with the H:MM pattern, then
+                   validate_time's own re.fullmatch on every candidate
+  scan + parse   - extract_times(), then validate_time() on each candidate
+  single scanner - time_results(): validated from the groups of the one scan
+  messages only  - time_messages() (the time script): the same, without the values
+each keeping the first occurrence of each candidate, and for every occurrence.
+
+Run from the repository root:
+    python -m benchmarks.time_scanner
+"""
+import re
+import time
+
+from extractors.times import extract_times, time_messages, time_results, validate_time
+from tests.inputs import old_validate_time, time_log
+
+LINES = 100_000
+REPEATS = 3
+OLD_PATTERN = r'\b\d{1,2}:\d{2}(?:\s*[AaPp][Mm])?\b'
+
+
+class KeepAll:
+    """Dedup object that reports every candidate as new."""
+    def first_seen(self, candidate):
+        return True
+
+
+def two_regexes(text, every):
+    candidates = [c.strip() for c in re.findall(OLD_PATTERN, text)]
+    if not every:
+        candidates = list(dict.fromkeys(candidates))
+    return [(c, old_validate_time(c)) for c in candidates]
+
+
+def scan_then_parse(text, every):
+    return [(c, validate_time(c)) for c in extract_times(text, KeepAll() if every else None)]
+
+
+def single_scanner(text, every):
+    return [(c, message) for c, message, _ in time_results(text, KeepAll() if every else None)]
+
+
+def messages_only(text, every):
+    return time_messages(text, KeepAll() if every else None)
+
+
+def best_time(fn, *args):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    for label, new_forms in (("H:MM times only", 0), ("half seconds, ranges and ISO 8601", 0.5)):
+        text = time_log(LINES, new_forms)
+        mb = len(text.encode('utf-8')) / 1e6
+
+        print(f"\n{mb:.1f}MB, {LINES:,} lines, {label}")
+        print(f"{'path':>15} {'occurrences':>12} {'MB/s':>7} {'valid':>8}   {'unique':>7} {'MB/s':>7} {'valid':>8}")
+        for name, fn in (('two regexes', two_regexes), ('scan + parse', scan_then_parse),
+                         ('single scanner', single_scanner), ('messages only', messages_only)):
+            row = f"{name:>15}"
+            for every in (True, False):
+                elapsed, results = best_time(fn, text, every)
+                valid = sum(message.startswith("Valid") for _, message in results)
+                row += f" {len(results):>12,} {mb / elapsed:>7.1f} {valid:>8,}" if every else \
+                       f"   {len(results):>7,} {mb / elapsed:>7.1f} {valid:>8,}"
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
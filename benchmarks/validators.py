@@ -0,0 +1,153 @@
+"""
+Micro-benchmark: validations per second for each entity type, before and after
+moving the validators' regexes into the precompiled registry (patterns.py).
+
+"before" runs the original validators, which pass pattern strings to re.fullmatch,
+re.search and re.sub and so pay for a lookup in re's internal cache on every call.
+
+Run from the repository root:
+    python -m benchmarks.validators
+"""
+import random
+import re
+import time
+
+import all_validations as av
+from benchmarks.currency_table import currency_rules_changed
+from extractors.credit_cards import detect_issuer, is_repeated_sequence
+from extractors.phones import split_phone
+from tests.inputs import old_validate_time
+
+CALLS = 200_000
+CHURN_PATTERNS = [f'custom_extractor_{i}' for i in range(600)]
+
+
+# --- Original validators (string patterns through the re module cache) ---
+def old_validate_email(email):
+    if email.count('@') != 1:
+        return "Invalid: Missing or multiple @ symbols"
+    username, domain_part = email.split('@')
+    if not re.fullmatch(r'[\w\.-]+', username):
+        return "Invalid: Username contains illegal characters or spaces"
+    if '.' not in domain_part:
+        return "Invalid: Domain missing '.'"
+    domain_parts = domain_part.split('.')
+    for part in domain_parts[:-1]:
+        if not re.fullmatch(r'[\w-]+', part):
+            return f"Invalid: Domain name part '{part}' contains illegal characters"
+    if not re.fullmatch(r'[a-zA-Z]{2,}', domain_parts[-1]):
+        return f"Invalid: Top-level domain '{domain_parts[-1]}' is invalid"
+    return "Valid email"
+
+
+def old_validate_credit_card(card):
+    clean_card = re.sub(r'[\s-]', '', card)
+    if not clean_card.isdigit():
+        return "Invalid: Contains nondigit characters"
+    if not (13 <= len(clean_card) <= 16):
+        return "Invalid: Must be 13–16 digits long"
+    if is_repeated_sequence(clean_card):
+        return "Invalid: Repeated digit sequence (unlikely to be real card)"
+    issuer = detect_issuer(clean_card)
+    if issuer:
+        return f"Valid credit card number (Issuer: {issuer})"
+    return "Valid credit card number (Issuer: Unknown but plausible)"
+
+
+def old_validate_currency(candidate):
+    s = candidate.strip()
+    marker_pattern = r'^\s*(?:\$|£|€|RWF|UGX|USD|EUR|GBP|KSH|KES)'
+    marker_pattern_end = r'(?:RWF|UGX|USD|EUR|GBP|KSH|KES)\s*$'
+    if not re.search(marker_pattern, s, flags=re.IGNORECASE) and not re.search(marker_pattern_end, s, flags=re.IGNORECASE):
+        return "Invalid: Missing currency marker"
+    numeric_part = re.sub(r'(?:\$|£|€|RWF|UGX|USD|EUR|GBP|KSH|KES)', '', s, flags=re.IGNORECASE).strip()
+    if '.' in numeric_part:
+        int_part, dec_part = numeric_part.split('.', 1)
+        if len(dec_part) != 2 or not dec_part.isdigit():
+            return "Invalid: Decimal part must have exactly 2 digits"
+    else:
+        int_part = numeric_part
+    int_clean = int_part.replace(',', '')
+    if not int_clean.isdigit():
+        return "Invalid: Contains non-digit characters in integer part"
+    groups = int_part.split(',')
+    if len(groups) > 1:
+        if len(groups[0]) > 3 or any(len(g) != 3 for g in groups[1:]):
+            return "Invalid: Incorrect comma placement in thousands"
+    return "Valid currency amount"
+
+
+def old_validate_phone(number):
+    digits = re.sub(r'\D', '', number)
+    if len(digits) > 10:
+        digits = digits[-10:]
+    if len(digits) != 10:
+        return "Invalid: Must have exactly 10 digits (excluding country code)"
+    if '(' in number or ')' in number:
+        if not re.fullmatch(r'\(\d{3}\)[\s.-]?\d{3}[\s.-]?\d{4}', number):
+            return "Invalid: Area code parentheses incorrect"
+    return "Valid phone number"
+
+
+OLD_VALIDATORS = {
+    'email': old_validate_email,
+    'time': old_validate_time,
+    'credit_card': old_validate_credit_card,
+    'currency': old_validate_currency,
+    'phone': old_validate_phone,
+}
+
+# Candidates whose rules changed on purpose; the old and new validators must agree on
+# every other candidate. Currencies: see currency_rules_changed. Phones: numbers with a
+# +CC prefix are checked against their country's numbering plan (phone_plans.py), and
+# NANP numbers whose area code or exchange starts with 0 or 1 are now invalid.
+RULES_CHANGED_FOR = {
+    'currency': currency_rules_changed,
+    'phone': lambda number: number.lstrip().startswith('+') or split_phone(number)[0] == 'leading',
+}
+
+# Valid phone messages now end with the E.164 form, which the old validator didn't give
+E164_SUFFIX = re.compile(r' \(E\.164: \+\d+\)$')
+OLD_MESSAGE_FORMS = {
+    'phone': lambda message: E164_SUFFIX.sub('', message),
+}
+
+EXTRA_CANDIDATES = {
+    'email': ['a.b-c@mail.example.org', 'bad name@x.com', 'x@y', 'ops@host.c0m'],
+    'time': ['9:05 am', '23:59', '24:00', '7:75'],
+    'credit_card': ['4111 1111 1111 1111', '5500-0000-0000-0004', '378282246310005', '12345'],
+    'currency': ['KES 1,500', '12.5 RWF', '€1,00,000.00', 'UGX 20,000'],
+    'phone': ['+254 712 345 678', '(555)1234567', '555.123.4567', '(55) 123-4567'],
+}
+
+
+def candidate_pool(kind):
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        found = av.extract_all(f.read())[kind]
+    pool = found + EXTRA_CANDIDATES[kind]
+    rng = random.Random(0)
+    return [rng.choice(pool) for _ in range(CALLS)]
+
+
+def rate(validate, candidates):
+    start = time.perf_counter()
+    for candidate in candidates:
+        validate(candidate)
+    return len(candidates) / (time.perf_counter() - start)
+
+
+def main():
+    print(f"{'type':>12} {'before/s':>11} {'after/s':>11} {'gain':>6}")
+    for kind, validate in av.VALIDATORS.items():
+        candidates = candidate_pool(kind)
+        changed = RULES_CHANGED_FOR.get(kind, lambda c: False)
+        old_form = OLD_MESSAGE_FORMS.get(kind, lambda message: message)
+        compared = [c for c in candidates if not changed(c)]
+        assert [old_form(validate(c)) for c in compared] == [OLD_VALIDATORS[kind](c) for c in compared], kind
+        before = rate(OLD_VALIDATORS[kind], candidates)
+        after = rate(validate, candidates)
+        print(f"{kind:>12} {before:>11,.0f} {after:>11,.0f} {after / before:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
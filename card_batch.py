@@ -0,0 +1,110 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; validate_cards_batch falls back to the per-card loop
+    np = None
+
+from extractors.credit_cards import validate_credit_card
+from records import CARD_LENGTH, CARD_LUHN, CARD_NON_DIGIT, CARD_REPEATED, ERROR_MESSAGES, OK, Result
+
+##VECTORIZED CARD CHECKS
+# Validates thousands of cleaned card numbers (separators already removed) at once.
+# The cards are packed into an (n, 16) digit matrix and every rule of
+# validate_credit_card runs as a NumPy array operation over the whole batch:
+# digits-only, 13-16 length, repeated-digit rejection, Luhn checksum and issuer prefix.
+MAX_CARD_DIGITS = 16
+
+# Issuer codes returned by card_checks(); index 0 means no known issuer
+ISSUERS = (None, 'Visa', 'American Express', 'MasterCard', 'Discover')
+
+def pack_digits(clean_cards):
+    """
+    Returns (digits, lengths): an int16 matrix with one card per row, left-aligned
+    (cells past the card's length are -48), and each card's length.
+    Cards must be ASCII; longer ones are cut at 16 digits but keep their real length.
+    """
+    lengths = np.fromiter(map(len, clean_cards), dtype=np.int64, count=len(clean_cards))
+    raw = np.array(clean_cards, dtype=f'S{MAX_CARD_DIGITS}')
+    digits = raw.view(np.uint8).reshape(len(clean_cards), MAX_CARD_DIGITS).astype(np.int16) - 48
+    return digits, lengths
+
+def card_checks(clean_cards):
+    """
+    Runs every card rule over a batch of ASCII card strings.
+    Returns a dict of NumPy arrays, one entry per card:
+    digits_only, length_ok, repeated, luhn_ok (bool) and issuer (index into ISSUERS).
+    For cards longer than 16 characters digits_only only covers the first 16.
+    """
+    if np is None:
+        raise ImportError("card_checks requires numpy")
+    digits, lengths = pack_digits(clean_cards)
+    positions = np.arange(MAX_CARD_DIGITS)
+    in_card = positions < lengths[:, None]
+
+    is_digit = (digits >= 0) & (digits <= 9)
+    digits_only = (is_digit | ~in_card).all(axis=1) & (lengths > 0)
+    length_ok = (lengths >= 13) & (lengths <= 16)
+
+    # Repeated sequence: every digit equals the first one
+    repeated = ((digits == digits[:, :1]) | ~in_card).all(axis=1)
+
+    # Luhn: double every second digit counting from the rightmost one
+    from_right = lengths[:, None] - 1 - positions
+    doubled = np.where(from_right % 2 == 1, digits * 2, digits)
+    doubled = np.where(doubled > 9, doubled - 9, doubled)
+    luhn_ok = np.where(in_card, doubled, 0).sum(axis=1) % 10 == 0
+
+    # Issuer prefixes, same rules and order as detect_issuer
+    d = digits.astype(np.int32)
+    p1 = d[:, 0]
+    p2 = p1 * 10 + d[:, 1]
+    p3 = p2 * 10 + d[:, 2]
+    p4 = p3 * 10 + d[:, 3]
+    issuer = np.select(
+        [
+            (p1 == 4) & ((lengths == 13) | (lengths == 16)),
+            ((p2 == 34) | (p2 == 37)) & (lengths == 15),
+            (((p2 >= 51) & (p2 <= 55)) | ((p4 >= 2221) & (p4 <= 2720))) & (lengths == 16),
+            ((p4 == 6011) | (p2 == 65) | ((p3 >= 644) & (p3 <= 649))) & (lengths == 16),
+        ],
+        [1, 2, 3, 4],
+        default=0,
+    )
+    return {
+        'digits_only': digits_only,
+        'length_ok': length_ok,
+        'repeated': repeated,
+        'luhn_ok': luhn_ok,
+        'issuer': issuer,
+    }
+
+def validate_cards_batch(clean_cards, luhn=False):
+    """
+    Returns the validate_credit_card(card, luhn) message for every cleaned card.
+    Without numpy, or for batches with non-ASCII characters, runs the per-card loop.
+    """
+    if np is None or not all(card.isascii() for card in clean_cards):
+        return [validate_credit_card(card, luhn) for card in clean_cards]
+    if not clean_cards:
+        return []
+
+    checks = card_checks(clean_cards)
+    # The records' messages, rendered once per batch
+    valid_messages = [Result('credit_card', None, OK, name).message for name in ISSUERS]
+    messages = []
+    for card, digits_only, length_ok, repeated, luhn_ok, issuer in zip(
+            clean_cards, checks['digits_only'].tolist(), checks['length_ok'].tolist(),
+            checks['repeated'].tolist(), checks['luhn_ok'].tolist(), checks['issuer'].tolist()):
+        if len(card) > MAX_CARD_DIGITS:
+            # Only the first 16 characters were packed
+            messages.append(validate_credit_card(card, luhn))
+        elif not digits_only:
+            messages.append(ERROR_MESSAGES[CARD_NON_DIGIT])
+        elif not length_ok:
+            messages.append(ERROR_MESSAGES[CARD_LENGTH])
+        elif repeated:
+            messages.append(ERROR_MESSAGES[CARD_REPEATED])
+        elif luhn and not luhn_ok:
+            messages.append(ERROR_MESSAGES[CARD_LUHN])
+        else:
+            messages.append(valid_messages[issuer])
+    return messages
@@ -0,0 +1,209 @@
+import collections
+import functools
+import re
+
+from currency_table import trie_pattern
+
+##CONTEXT SCORING
+# A filter between the scan and the validators. Each match gets a score from the
+# characters around it, and matches scoring below the threshold never reach validate_*:
+#   - its extractor's prior (a match with '@' is likely an email, a dotted word isn't)
+#   - the weights of keywords in the WINDOW_BEFORE characters before it and the
+#     WINDOW_AFTER after it: "call" for phones, "card" for cards, "price" for amounts,
+#     "meeting" for times; negative ones such as "version", "http", "ref" and "sha" for
+#     the ids, hashes and hostnames that look like entities. The window after is short
+#     so the context phrase of the next entity on the line doesn't count.
+#   - penalties for windows that are mostly digits (ids, digit runs), for matches glued
+#     to more digits ("947937 8798-848-3951") and, for dotted words, for sitting against
+#     an '@' (the halves of an email already matched) or ending in digits ("v1.2.3")
+#
+# Keywords are found with one regex built as a trie of every keyword in lower, Title
+# and UPPER case (as currency markers are), searched only inside the windows: where
+# the windows of neighbouring matches overlap the shared part is searched once, so
+# the keyword search reads each character at most once whatever the match density,
+# and not at all in the text between sparse matches. The score stops as soon as the
+# keep/drop decision is known, so the digit count (the one step that copies the
+# window) only runs for matches the penalties can still drop.
+#
+# Scoring is opt-in: pass a ContextScorer as scorer= to all_validations.validate_all()
+# or unique_candidates(), and through it to the record, sink, mmap, batch and
+# streaming paths (scorer= on each). It is for precision, and it costs time: scoring a
+# match costs more than the validation it may save, so a scored run is slower than an
+# unscored one, and it trades some recall for the precision. The README gives the
+# figures; benchmarks/context_scoring.py measures them.
+WINDOW_BEFORE = 32
+WINDOW_AFTER = 12
+THRESHOLD = 1
+
+# Starting score by extractor name (all_validations.ENTITY_NAMES)
+PRIORS = {
+    'email_at': 3,
+    'email_no_at': 0,
+    'time': 2,
+    'credit_card': 1,
+    'currency': 2,
+    'phone': 1,
+}
+
+# Entity type -> keyword -> weight; keywords match as whole words
+KEYWORDS = {
+    'email': {
+        'email': 2, 'e-mail': 2, 'mail': 2, 'contact': 1, 'reply': 1, 'admin': 1,
+        'http': -2, 'https': -2, 'www': -2, 'url': -2, 'host': -2, 'hostname': -2,
+        'server': -1, 'version': -2, 'build': -2,
+    },
+    'phone': {
+        'call': 2, 'phone': 2, 'tel': 2, 'mobile': 2, 'dial': 2, 'fax': 2, 'sms': 2,
+        'contact': 1, 'number': 1,
+        'id': -1, 'ref': -1, 'order': -1, 'invoice': -1, 'trace': -1, 'sha': -2, 'tracking': -2,
+    },
+    'credit_card': {
+        'card': 2, 'credit': 2, 'debit': 2, 'visa': 2, 'mastercard': 2, 'amex': 2,
+        'discover': 1, 'payment': 1, 'paid': 1, 'charged': 1,
+        'id': -1, 'ref': -1, 'order': -1, 'trace': -1, 'sha': -2, 'tracking': -2,
+    },
+    'currency': {
+        'price': 2, 'cost': 2, 'total': 2, 'amount': 2, 'paid': 2, 'pay': 1, 'refund': 2,
+        'sale': 1, 'balance': 2, 'fee': 2, 'charge': 1, 'invoice': 1, 'discount': 1,
+    },
+    'time': {
+        'at': 1, 'meeting': 2, 'time': 2, 'scheduled': 2, 'until': 1, 'from': 1, 'by': 1,
+        'starts': 1, 'ends': 1, 'opens': 1, 'closes': 1, 'deadline': 2,
+        'version': -2, 'build': -2,
+    },
+}
+
+# Windows more than this fraction digits: the match sits among ids or digit runs
+DENSE_DIGITS = 0.5
+DENSE_DIGITS_PENALTY = 1
+# Digits right before the match, or a separator and a digit right after it
+GLUED_PENALTY = 2
+# Dotted word right before or after an '@', or with digits after its last dot
+EMAIL_PART_PENALTY = 3
+NUMERIC_SUFFIX_PENALTY = 3
+
+# Characters that join digit groups
+SEPARATORS = {'-', '.', '/'}
+
+# The text may be a str or bytes-like (mmap_scan.py, batch.py scan the mapped file)
+SEPARATORS |= {sep.encode() for sep in SEPARATORS}
+AT_SIGNS = {'@', b'@'}
+
+KINDS = {'email_at': 'email', 'email_no_at': 'email'}
+
+ASCII_DIGITS = b'0123456789'
+
+class ContextScorer:
+    """
+    before, after: characters searched on each side of a match
+    threshold: matches scoring below this are dropped
+    keywords: entity type -> keyword -> weight (default KEYWORDS)
+    priors: extractor name -> starting score (default PRIORS)
+    """
+    def __init__(self, before=WINDOW_BEFORE, after=WINDOW_AFTER, threshold=THRESHOLD,
+                 keywords=None, priors=None):
+        self.before = before
+        self.after = after
+        self.threshold = threshold
+        self.keywords = {kind: {k.lower(): w for k, w in words.items()}
+                         for kind, words in (keywords or KEYWORDS).items()}
+        self.priors = priors or PRIORS
+
+    @functools.cached_property
+    def variants(self):
+        """Every keyword spelling the pattern matches (lower, Title, UPPER)."""
+        words = set().union(*self.keywords.values())
+        return sorted({form for w in words for form in (w, w.title(), w.upper())})
+
+    @functools.cached_property
+    def keyword_re(self):
+        return re.compile(r'(?<![\w-])' + trie_pattern(self.variants) + r'(?![\w-])')
+
+    @functools.cached_property
+    def keyword_bytes_re(self):
+        # As mmap_scan.py's pattern: \w is ASCII-only in bytes mode
+        return re.compile(self.keyword_re.pattern.encode())
+
+    @functools.cached_property
+    def weights(self):
+        """Extractor name -> matched spelling (str and bytes) -> weight."""
+        weights = {}
+        for name in self.priors.keys() | self.keywords.keys() | KINDS.keys():
+            words = self.keywords.get(KINDS.get(name, name), {})
+            spellings = {form: words[form.lower()] for form in self.variants if form.lower() in words}
+            spellings.update({form.encode(): weight for form, weight in spellings.items()})
+            weights[name] = spellings
+        return weights
+
+    def keeper(self, text):
+        """
+        Returns keeps(name, start, end, candidate) for the matches of text (a str,
+        or bytes-like with byte offsets): True when the match scores at least the
+        threshold. Call it in text order; matches may be skipped.
+        """
+        before, after, threshold = self.before, self.after, self.threshold
+        priors, weights = self.priors, self.weights
+        is_str = isinstance(text, str)
+        search = (self.keyword_re if is_str else self.keyword_bytes_re).finditer
+        # A keyword starting inside a window is matched whole, with the character after it
+        longest = max(map(len, self.variants), default=0) + 1
+        # (start, spelling) of the keywords that may still be in a window, and the
+        # offset the text has been searched up to
+        window_hits = collections.deque()
+        searched = 0
+
+        def keeps(name, start, end, candidate):
+            nonlocal searched
+            lo, hi = start - before, end + after
+            while window_hits and window_hits[0][0] < lo:
+                window_hits.popleft()
+            if searched < hi:
+                for m in search(text, max(lo, searched, 0), hi + longest):
+                    at = m.start()
+                    if at >= hi:
+                        break
+                    window_hits.append((at, m.group()))
+                searched = hi
+
+            score = priors.get(name, 0)
+            spellings = weights.get(name, {})
+            for at, word in window_hits:
+                if at >= hi:
+                    break
+                # Keywords inside the match itself (the PM of "2:30 PM") don't count
+                if not start <= at < end:
+                    score += spellings.get(word, 0)
+            # Every penalty lowers the score: stop once it is below the threshold
+            if score < threshold:
+                return False
+
+            next_two = text[end:end + 2]
+            if text[start - 1:start].isdigit() or (next_two[:1] in SEPARATORS and next_two[1:].isdigit()):
+                score -= GLUED_PENALTY
+            if name == 'email_no_at':
+                if text[start - 1:start] in AT_SIGNS or next_two[:1] in AT_SIGNS:
+                    score -= EMAIL_PART_PENALTY
+                if not candidate.rpartition('.')[2].isalpha():
+                    score -= NUMERIC_SUFFIX_PENALTY
+            if score < threshold:
+                return False
+            if score - DENSE_DIGITS_PENALTY >= threshold:
+                return True
+
+            # Counted on the UTF-8 bytes: bytes.translate deletes characters far faster than str's
+            around = text[max(lo, 0):start] + text[end:hi]
+            if is_str:
+                around = around.encode()
+            return len(around) - len(around.translate(None, ASCII_DIGITS)) <= DENSE_DIGITS * len(around)
+
+        return keeps
+
+    def keep(self, text, matches):
+        """
+        Takes (name, start, end, candidate) tuples from scan(), in text order, and
+        yields those scoring at least the threshold.
+        """
+        keeps = self.keeper(text)
+        for match in matches:
+            if keeps(*match):
+                yield match
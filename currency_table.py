@@ -0,0 +1,309 @@
+import functools
+import re
+
+##CURRENCY MARKER TABLE
+# Single source for the currency markers the extractor and the validators accept.
+# A table maps each marker to its ISO 4217 code:
+#   - letter markers (codes such as USD, local forms such as KSh) may come before or
+#     after the amount;
+#   - symbol markers ($, £, ₦, ...) only before it.
+# Markers are compiled into a trie-shaped regex (K(?:ES|SH) instead of KES|KSH), so the
+# regex engine follows one branch per character instead of trying every alternative.
+# That keeps the scan fast when the table grows from a handful of markers to every ISO
+# code. Markers are matched case-insensitively unless ignore_case=False, and when one
+# marker is a prefix of another the longer one wins.
+#
+# The table also resolves, once per currency when it is built, how amounts in that
+# currency may be written: which number formats (decimal separator and digit grouping)
+# and how many minor units (cents) it has. The validator only runs the precompiled
+# regexes for the candidate's currency.
+
+# The markers the extractor has always accepted; pass a larger table (see below) for others
+DEFAULT_MARKERS = {
+    '$': 'USD', '£': 'GBP', '€': 'EUR',
+    'RWF': 'RWF', 'UGX': 'UGX', 'USD': 'USD', 'EUR': 'EUR', 'GBP': 'GBP', 'KSH': 'KES', 'KES': 'KES',
+}
+
+# Symbol markers that may also follow the amount (1.234,56 €)
+SUFFIX_SYMBOLS = ('€',)
+
+# Active ISO 4217 currency codes
+ISO_4217_CODES = (
+    'AED AFN ALL AMD ANG AOA ARS AUD AWG AZN BAM BBD BDT BGN BHD BIF BMD BND BOB BOV BRL BSD '
+    'BTN BWP BYN BZD CAD CDF CHE CHF CHW CLF CLP CNY COP COU CRC CUC CUP CVE CZK DJF DKK DOP '
+    'DZD EGP ERN ETB EUR FJD FKP GBP GEL GHS GIP GMD GNF GTQ GYD HKD HNL HTG HUF IDR ILS INR '
+    'IQD IRR ISK JMD JOD JPY KES KGS KHR KMF KPW KRW KWD KYD KZT LAK LBP LKR LRD LSL LYD MAD '
+    'MDL MGA MKD MMK MNT MOP MRU MUR MVR MWK MXN MXV MYR MZN NAD NGN NIO NOK NPR NZD OMR PAB '
+    'PEN PGK PHP PKR PLN PYG QAR RON RSD RUB RWF SAR SBD SCR SDG SEK SGD SHP SLE SLL SOS SRD '
+    'SSP STN SVC SYP SZL THB TJS TMT TND TOP TRY TTD TWD TZS UAH UGX USD USN UYI UYU UYW UZS '
+    'VED VES VND VUV WST XAF XAG XAU XBA XBB XBC XBD XCD XDR XOF XPD XPF XPT XSU XTS XUA XXX '
+    'YER ZAR ZMW ZWL'
+).split()
+
+# Local symbols and shorthands seen in East African and other responses
+LOCAL_SYMBOLS = {
+    'KSh': 'KES', 'KSH': 'KES', 'TSh': 'TZS', 'USh': 'UGX', 'RF': 'RWF', 'FRw': 'RWF',
+    '₦': 'NGN', '₹': 'INR', '¥': 'JPY', '₩': 'KRW', '₱': 'PHP', '₺': 'TRY', '₴': 'UAH',
+    '₽': 'RUB', '₪': 'ILS', '฿': 'THB', '₫': 'VND', 'R$': 'BRL', 'A$': 'AUD', 'C$': 'CAD',
+}
+
+# Number formats: name -> (group separators, decimal separator, grouping)
+# 'western' groups digits in threes (1,234,567); 'indian' groups the last three digits
+# and then pairs (12,34,567)
+NUMBER_FORMATS = {
+    'en': (',', '.', 'western'),           # 1,234.56
+    'de': ('.', ',', 'western'),           # 1.234,56
+    'fr': (' \u00a0\u202f', ',', 'western'),  # 1 234,56 (space, no-break or narrow no-break)
+    'in': (',', '.', 'indian'),            # 12,34,567.00
+}
+
+# Formats accepted per currency, most common first; other currencies use DEFAULT_FORMATS
+DEFAULT_FORMATS = ('en',)
+CURRENCY_FORMATS = {
+    'EUR': ('en', 'de', 'fr'),
+    'INR': ('in', 'en'),
+}
+
+# ISO 4217 minor units where they are not 2
+MINOR_UNITS = {
+    'BIF': 0, 'CLP': 0, 'DJF': 0, 'GNF': 0, 'ISK': 0, 'JPY': 0, 'KMF': 0, 'KRW': 0, 'PYG': 0,
+    'RWF': 0, 'UGX': 0, 'UYI': 0, 'VND': 0, 'VUV': 0, 'XAF': 0, 'XOF': 0, 'XPF': 0,
+    'BHD': 3, 'IQD': 3, 'JOD': 3, 'KWD': 3, 'LYD': 3, 'OMR': 3, 'TND': 3,
+    'CLF': 4, 'UYW': 4,
+}
+
+def minor_units(code):
+    """Number of decimals amounts in the currency have (2 unless MINOR_UNITS says otherwise)."""
+    return MINOR_UNITS.get(code, 2)
+
+# Currencies without minor units have no decimal separator, so any grouping is unambiguous
+ZERO_MINOR_FORMATS = ('en', 'de', 'fr')
+
+# Amounts as the extractor finds them: digit runs joined by ',' '.' or a no-break space.
+# After the amount (before a trailing marker) a plain space may also group three digits.
+# Which of these forms is valid for the currency is decided by the validator.
+# The no-break spaces are spliced in as characters, not \u escapes, so the pattern
+# still compiles when encoded to UTF-8 for the bytes scanner.
+NO_BREAK_SPACES = '\u00a0|\u202f'
+PREFIX_AMOUNT_PATTERN = r'\d+(?:(?:[,.]|' + NO_BREAK_SPACES + r')\d+)*'
+# A suffix amount only starts where an amount could not have started earlier: not
+# inside a digit run or right after a separator that joins it to earlier digits. Such
+# a start reads the same tail as the earlier one, so it could only repeat its result;
+# allowing it made long digit runs ("1.1.1...", "123 456 789 ...") quadratic.
+# The one case it drops: a three-digit suffix amount right after a prefix amount and a
+# space ("$5 100 EUR" gives $5 but no longer "100 EUR").
+# Lookbehinds are fixed-width in bytes too, hence one per separator.
+SUFFIX_AMOUNT_START = (
+    r'(?<!\d)(?<!\d[,.])' + ''.join(f'(?<!\\d{space})' for space in NO_BREAK_SPACES.split('|'))
+    + r'(?:(?<!\d )|(?!\d{3}(?!\d)))'
+)
+SUFFIX_AMOUNT_PATTERN = SUFFIX_AMOUNT_START + r'\d+(?:(?:[,.]|' + NO_BREAK_SPACES + r')\d+| \d{3}(?!\d))*'
+
+def amount_pattern(number_format, minor_units):
+    """
+    Regex source for an amount (markers removed) in number_format with minor_units
+    decimals: one group for the integer part, then one for the decimals if any.
+    """
+    groups, decimal, grouping = NUMBER_FORMATS[number_format]
+    if grouping == 'indian':
+        grouped = r'\d{1,2}(?:,\d{2})*,\d{3}'
+    else:
+        grouped = r'\d{1,3}(?:[' + re.escape(groups) + r']\d{3})+'
+    pattern = r'(' + grouped + r'|\d+)'
+    if minor_units:
+        pattern += r'(?:' + re.escape(decimal) + r'(\d{' + str(minor_units) + r'}))?'
+    return pattern
+
+@functools.cache
+def amount_re(formats, minor_units):
+    """
+    Compiled fullmatch regex trying each of formats in order, so a candidate takes one
+    regex call whatever the number of formats.
+    """
+    return re.compile('|'.join(amount_pattern(f, minor_units) for f in formats))
+
+class AmountRules:
+    """How amounts in one currency are written: minor units and the formats to try."""
+    __slots__ = ('minor_units', 'formats', 'regex', 'group_width', 'separators', 'number_formats')
+
+    def __init__(self, code, formats=None):
+        self.minor_units = minor_units(code)
+        if formats is None:
+            formats = ZERO_MINOR_FORMATS if self.minor_units == 0 else CURRENCY_FORMATS.get(code, DEFAULT_FORMATS)
+        self.formats = tuple(formats)
+        self.regex = amount_re(self.formats, self.minor_units)
+        # Groups per format: integer part, plus decimals when the currency has minor units
+        self.group_width = 2 if self.minor_units else 1
+        # Group separators of each format, removed from the integer part of a match
+        self.separators = tuple(NUMBER_FORMATS[name][0] for name in self.formats)
+        self.number_formats = tuple(NUMBER_FORMATS[name] for name in self.formats)
+
+    def split_amount(self, match):
+        """(integer part without its group separators, decimals or None) of a regex match."""
+        index = (match.lastindex - 1) // self.group_width
+        first = index * self.group_width + 1
+        int_part = match.group(first)
+        if not int_part.isdigit():
+            for separator in self.separators[index]:
+                int_part = int_part.replace(separator, '')
+        return int_part, match.group(first + 1) if self.minor_units else None
+
+    def diagnostic_format(self, numeric_part):
+        """
+        (group separators, decimal separator, grouping) of the format an invalid amount
+        was most likely written in: among the formats whose decimal separator is the
+        amount's last ',' or '.' (all of them if none is), the first whose group
+        separators it uses, else the first.
+        """
+        formats = self.number_formats
+        if len(formats) == 1:
+            return formats[0]
+        last = max(numeric_part.rfind(','), numeric_part.rfind('.'))
+        if last >= 0:
+            formats = [f for f in formats if f[1] == numeric_part[last]] or formats
+        for number_format in formats:
+            if any(separator in numeric_part for separator in number_format[0]):
+                return number_format
+        return formats[0]
+
+def trie_pattern(words, case_classes=False):
+    """
+    Regex source matching any of words, factored into a trie:
+    ['KES', 'KSH', 'USD'] -> '(?:K(?:ES|SH)|USD)'.
+    Single ASCII characters that end a word are merged into a character class.
+    case_classes: write ASCII letters as both cases ('[Kk](?:[Ee][Ss]|...)'), which
+    matches words in any case without re.IGNORECASE, whose case folding makes the
+    engine try each position the slow way.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    return node_pattern(trie, case_classes)
+
+def char_members(ch, case_classes):
+    """ch escaped, as a list of character class members (both cases with case_classes)."""
+    if case_classes and ch.isascii() and ch.isalpha():
+        return [ch.upper(), ch.lower()]
+    return [re.escape(ch)]
+
+def char_class(members):
+    return members[0] if len(members) == 1 else '[' + ''.join(members) + ']'
+
+def node_pattern(node, case_classes=False):
+    branches = []
+    leaves = []
+    for ch, child in sorted(node.items()):
+        if ch == '':
+            continue
+        if list(child) == [''] and ch.isascii():
+            leaves += char_members(ch, case_classes)
+        else:
+            branches.append(char_class(char_members(ch, case_classes)) + node_pattern(child, case_classes))
+    if leaves:
+        branches.append(char_class(leaves))
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        # The word may end here; the greedy ? still prefers the longer marker
+        return ('(?:' + body + ')' if len(branches) == 1 and len(body) > 1 else body) + '?'
+    return body
+
+class CurrencyTable:
+    """
+    markers: dict of marker -> ISO 4217 code (a list of codes maps each code to itself)
+    ignore_case: match markers case-insensitively
+    suffix_symbols: symbol markers that may also follow the amount
+    formats: dict of ISO code -> NUMBER_FORMATS names, overriding the defaults
+    Marker text is letters only, or starts with a non-letter symbol; digits are not allowed.
+    """
+    def __init__(self, markers=DEFAULT_MARKERS, ignore_case=True, suffix_symbols=SUFFIX_SYMBOLS, formats=None):
+        if not isinstance(markers, dict):
+            markers = {code: code for code in markers}
+        self.ignore_case = ignore_case
+        self.codes = {}
+        for marker, code in markers.items():
+            if not marker or any(ch.isdigit() or ch.isspace() for ch in marker):
+                raise ValueError(f"invalid currency marker {marker!r}")
+            self.codes[self.normalize(marker)] = code
+        self.suffix_markers = frozenset(
+            m for m in self.codes if m.isalpha() or m in map(self.normalize, suffix_symbols)
+        )
+        formats = formats or {}
+        self.rules = {code: AmountRules(code, formats.get(code)) for code in set(self.codes.values())}
+        # Normalized marker -> (ISO code, AmountRules): one lookup per candidate
+        self.marker_rules = {marker: (code, self.rules[code]) for marker, code in self.codes.items()}
+
+    def normalize(self, marker):
+        return marker.upper() if self.ignore_case else marker
+
+    def code_for(self, marker):
+        """ISO code for a matched marker."""
+        return self.codes[marker.upper() if self.ignore_case else marker]
+
+    @property
+    def word_markers(self):
+        """Markers made only of letters."""
+        return sorted(m for m in self.codes if m.isalpha())
+
+    @property
+    def symbol_chars(self):
+        """First characters of markers that start with a symbol."""
+        return sorted({m[0] for m in self.codes if not m[0].isalpha()})
+
+    @property
+    def word_followers(self):
+        """Characters right after the leading letters of a mixed marker such as 'R$'."""
+        followers = set()
+        for m in self.codes:
+            letters = re.match(r'[^\W\d_]*', m).end()
+            if 0 < letters < len(m):
+                followers.add(m[letters])
+        return sorted(followers)
+
+    def group(self, pattern):
+        """Wraps pattern in a group that applies the table's case rule."""
+        return ('(?i:' if self.ignore_case else '(?:') + pattern + ')'
+
+    @functools.cached_property
+    def prefix_pattern(self):
+        return trie_pattern(self.codes)
+
+    @functools.cached_property
+    def suffix_pattern(self):
+        return trie_pattern(self.suffix_markers)
+
+    @functools.cached_property
+    def candidate_pattern(self):
+        """Extractor pattern: marker then amount, or amount then letter (or suffix symbol) marker."""
+        return (self.group(self.prefix_pattern) + r'\s*' + PREFIX_AMOUNT_PATTERN + '|'
+                + SUFFIX_AMOUNT_PATTERN + r'\s*' + self.group(self.suffix_pattern))
+
+    @functools.cached_property
+    def marker_split_re(self):
+        # Letters as [Kk] classes rather than re.IGNORECASE when they are all ASCII:
+        # a candidate's markers are then found about a third faster
+        if self.ignore_case and all(m.isascii() for m in self.codes if any(c.isalpha() for c in m)):
+            return re.compile('(' + trie_pattern(self.codes, case_classes=True) + ')')
+        return re.compile('(' + self.prefix_pattern + ')', re.IGNORECASE if self.ignore_case else 0)
+
+    def split_markers(self, s):
+        """
+        Finds every marker in s with one regex call.
+        Returns (marker or None, s with all markers removed). The marker is the one s
+        starts with, else the suffix marker it ends with; code_for() gives its ISO code.
+        """
+        # [text, marker, text, marker, ..., text]
+        parts = self.marker_split_re.split(s)
+        if len(parts) == 1:
+            return None, s
+        if not parts[0]:
+            return parts[1], ''.join(parts[::2])
+        if not parts[-1] and (parts[-2].upper() if self.ignore_case else parts[-2]) in self.suffix_markers:
+            return parts[-2], ''.join(parts[::2])
+        return None, ''.join(parts[::2])
+
+DEFAULT_TABLE = CurrencyTable()
@@ -0,0 +1,177 @@
+import array
+import functools
+import math
+import sys
+
+##DEDUPLICATION
+# Every extractor reports each candidate once, in first-seen order. The bookkeeping
+# for "seen before" is pluggable so high-cardinality inputs (unique transaction emails,
+# order ids) don't have to keep every candidate string in memory:
+#
+#   ExactDedup  - a set of the candidates themselves; never wrong (the default)
+#   HashedDedup - 64-bit digests in an open-addressing array, 16-32 bytes per
+#                 candidate whatever its length; two different candidates share a digest
+#                 with probability ~n^2 / 2^65 (about 3e-6 at 10M candidates)
+#   BloomDedup  - a Bloom filter sized for `capacity` candidates, about 1.8 bytes per
+#                 candidate at 0.1%; a new candidate is wrongly treated as a duplicate
+#                 (dropped) with probability false_positive_rate while the filter holds
+#                 at most `capacity` candidates, rising beyond that
+#
+# Each has first_seen(candidate): True the first time (and records it), False after.
+# They also support `in`, add() and len() like the sets they replace.
+#
+# Digests come from the built-in hash(), 64-bit SipHash on 64-bit builds, which is
+# cached on the string and salted per process, so they are not stable across runs.
+HASH_MASK = (1 << 64) - 1
+
+class ExactDedup(set):
+    def first_seen(self, candidate):
+        if candidate in self:
+            return False
+        self.add(candidate)
+        return True
+
+    def memory_bytes(self):
+        """Size of the set and the strings it holds."""
+        return sys.getsizeof(self) + sum(sys.getsizeof(c) for c in self)
+
+class HashedDedup:
+    """Digests in a linear-probing table kept at most half full (0 marks an empty slot)."""
+    def __init__(self, initial_size=1024):
+        size = 1 << max(initial_size - 1, 1).bit_length()
+        self.table = array.array('Q', bytes(8 * size))
+        self.mask = size - 1
+        self.count = 0
+
+    def digest(self, candidate):
+        return hash(candidate) & HASH_MASK or 1
+
+    def first_seen(self, candidate):
+        digest = self.digest(candidate)
+        table, mask = self.table, self.mask
+        i = digest & mask
+        while True:
+            slot = table[i]
+            if slot == digest:
+                return False
+            if not slot:
+                break
+            i = (i + 1) & mask
+        table[i] = digest
+        self.count += 1
+        if 2 * self.count > len(table):
+            self.grow()
+        return True
+
+    def grow(self):
+        old = self.table
+        self.table = array.array('Q', bytes(16 * len(old)))
+        self.mask = len(self.table) - 1
+        table, mask = self.table, self.mask
+        for digest in old:
+            if digest:
+                i = digest & mask
+                while table[i]:
+                    i = (i + 1) & mask
+                table[i] = digest
+
+    def __contains__(self, candidate):
+        digest = self.digest(candidate)
+        table, mask = self.table, self.mask
+        i = digest & mask
+        while table[i]:
+            if table[i] == digest:
+                return True
+            i = (i + 1) & mask
+        return False
+
+    def add(self, candidate):
+        self.first_seen(candidate)
+
+    def __len__(self):
+        return self.count
+
+    def memory_bytes(self):
+        return self.table.itemsize * len(self.table)
+
+class BloomDedup:
+    """
+    Bloom filter with the optimal bit count and hash count for capacity and
+    false_positive_rate. Bit positions use double hashing of one 64-bit digest.
+    """
+    def __init__(self, capacity=10_000_000, false_positive_rate=0.001):
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.bits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.array = bytearray((self.bits + 7) // 8)
+        self.count = 0
+
+    def positions(self, candidate):
+        digest = hash(candidate) & HASH_MASK
+        bits = self.bits
+        pos, step = digest % bits, ((digest >> 32) | 1) % bits
+        for _ in range(self.hashes):
+            yield pos
+            pos = (pos + step) % bits
+
+    def first_seen(self, candidate):
+        # positions() inlined: this runs once per candidate
+        digest = hash(candidate) & HASH_MASK
+        bits, bit_array = self.bits, self.array
+        pos, step = digest % bits, ((digest >> 32) | 1) % bits
+        new = False
+        for _ in range(self.hashes):
+            byte, bit = pos >> 3, 1 << (pos & 7)
+            if not bit_array[byte] & bit:
+                bit_array[byte] |= bit
+                new = True
+            pos = (pos + step) % bits
+        if new:
+            self.count += 1
+        return new
+
+    def __contains__(self, candidate):
+        bit_array = self.array
+        return all(bit_array[pos >> 3] & (1 << (pos & 7)) for pos in self.positions(candidate))
+
+    def add(self, candidate):
+        self.first_seen(candidate)
+
+    def __len__(self):
+        """Candidates reported as new so far."""
+        return self.count
+
+    def false_positive_rate(self):
+        """Expected rate for the candidates added so far."""
+        return (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+    def memory_bytes(self):
+        return len(self.array)
+
+DEDUP_MODES = {
+    'exact': ExactDedup,
+    'hashed': HashedDedup,
+    'bloom': BloomDedup,
+}
+
+def dedup_factory(mode='exact', **options):
+    """
+    Returns a zero-argument callable making a fresh dedup of that mode (options go to its
+    constructor). It pickles, so it can be handed to batch.py's worker processes.
+    """
+    return functools.partial(DEDUP_MODES[mode], **options)
+
+def unique(values, dedup=None):
+    """
+    First occurrence of each value, in order.
+    dedup: a dedup object (shared across calls to deduplicate across inputs);
+    None uses a fresh exact one
+    """
+    if dedup is None:
+        return list(dict.fromkeys(values))
+    first_seen = dedup.first_seen
+    return [v for v in values if first_seen(v)]
@@ -0,0 +1,427 @@
+import argparse
+import array
+import bisect
+import datetime
+import json
+import math
+import mmap
+import sys
+from decimal import Decimal, InvalidOperation
+
+from all_validations import byte_offsets, scan, unique_candidates
+from currency_table import minor_units
+from extractors.times import clock_text, written_seconds
+from patterns import card_separator_re
+from records import EXACT
+from results import CHECKS
+
+##ENTITY INDEX
+# An inverted index of the valid entities found in a set of files, so questions like
+# "which files contain this card" or "all times between 09:00 and 17:00" are answered
+# from one file instead of re-running the extractors over the corpus.
+#
+# Every entity is indexed under its normalized term, so different spellings of the
+# same value share one entry:
+#   email       - lowercased             Bob@Example.com      -> bob@example.com
+#   phone       - E.164                  (212) 555-0134       -> +12125550134
+#   credit_card - digits only            4111-1111-1111-1111  -> 4111111111111111
+#   time        - 24-hour HH:MM[:SS]     2:30 PM              -> 14:30
+#                 (seconds when written) 2:30:00 PM           -> 14:30:00
+#                 ranges and ISO 8601    9:00 AM to 5:30 PM   -> 09:00-17:30
+#                                        2025-09-26 14:30Z    -> 2025-09-26T14:30:00+00:00
+#   currency    - ISO code and amount    $12                  -> USD 12.00
+# Terms are interned: each is stored once, and validated once per spelling while
+# building, however often it occurs.
+#
+# The index file uses the layout of sinks.py's columnar format (MAGIC, 8-byte header
+# length, JSON header, then packed little-endian arrays), with each array aligned to
+# 8 bytes so EntityIndex can memory-map the file and read the arrays in place:
+#   term_offsets/term_text - the terms as one UTF-8 blob, sorted by type then term,
+#                            so a lookup is a binary search in its type's range
+#   posting_starts         - term i's occurrences are postings[starts[i]:starts[i + 1]]
+#   posting_source/_offset - the occurrences: source id and byte offset, in file order
+#   time_keys/time_terms   - seconds since midnight of each time term (the start of a
+#                            range, the time of day of a date-time), sorted
+#   amount_keys/amount_terms - amount of each currency term in integer minor units
+#                            (USD 12.50 -> 1250, RWF 1500 -> 1500), sorted by code then
+#                            amount (header 'amount_ranges' gives each code's slice);
+#                            exact where a double would round amounts past 2**53
+# Building keeps about 16 bytes per occurrence plus the distinct terms in memory.
+INDEX_MAGIC = b'RXINDEX2'
+ALIGNMENT = 8
+
+TYPES = list(CHECKS)
+TYPE_IDS = {kind: i for i, kind in enumerate(TYPES)}
+
+SECTIONS = [
+    ('term_offsets', 'Q'),
+    ('term_text', 'B'),
+    ('posting_starts', 'Q'),
+    ('posting_source', 'I'),
+    ('posting_offset', 'Q'),
+    ('time_keys', 'I'),
+    ('time_terms', 'I'),
+    ('amount_keys', 'q'),
+    ('amount_terms', 'I'),
+]
+
+def normalized_term(result):
+    """(term, range key) for a valid Result; the key is None for emails, phones and cards."""
+    kind = result.entity_type
+    if kind == 'email':
+        return result.raw.lower(), None
+    if kind == 'phone':
+        return result.value, None
+    if kind == 'credit_card':
+        return card_separator_re.sub('', result.raw), None
+    if kind == 'time':
+        value, seconds = result.value, written_seconds(result.raw)
+        if isinstance(value, tuple):
+            term, t = f'{clock_text(value[0], seconds)}-{clock_text(value[1], seconds)}', value[0]
+        elif isinstance(value, datetime.datetime):
+            term, t = value.isoformat(), value.time()
+        else:
+            term, t = clock_text(value, seconds), value
+        return term, seconds_of_day(t)
+    return f'{result.detail} {result.value}', (result.detail, min(result.amount_minor, MAX_AMOUNT_KEY))
+
+# Largest amount key the signed 64-bit amount_keys hold; larger amounts share it
+MAX_AMOUNT_KEY = 2 ** 63 - 1
+
+def amount_key(amount, code, round_to):
+    """amount (Decimal, int or str) in code's minor units, rounded by round_to (math.ceil or math.floor)."""
+    return round_to(Decimal(amount).scaleb(minor_units(code), EXACT))
+
+def seconds_of_day(t):
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+class KeepAll:
+    """Dedup object that reports every candidate as new."""
+    def first_seen(self, candidate):
+        return True
+
+EVERY_OCCURRENCE = {kind: KeepAll() for kind in TYPES}
+
+def occurrences(text):
+    """Yields (entity type, byte offset, candidate) for every candidate occurrence in text."""
+    for kind, start, _, candidate in byte_offsets(text, unique_candidates(scan(text), EVERY_OCCURRENCE)):
+        yield kind, start, candidate
+
+class IndexBuilder:
+    def __init__(self):
+        self.sources = []
+        # (entity type, candidate) -> term id, or -1 for invalid candidates
+        self.spellings = {}
+        # (entity type, term) -> term id
+        self.term_ids = {}
+        # term id -> (type id, term, range key)
+        self.terms = []
+        self.posting_term = array.array('I')
+        self.posting_source = array.array('I')
+        self.posting_offset = array.array('Q')
+
+    def term_id(self, kind, candidate):
+        result = CHECKS[kind](candidate)
+        if not result.valid:
+            return -1
+        term, key = normalized_term(result)
+        term_id = self.term_ids.get((kind, term))
+        if term_id is None:
+            term_id = self.term_ids[kind, term] = len(self.terms)
+            self.terms.append((TYPE_IDS[kind], term, key))
+        return term_id
+
+    def add(self, source, text):
+        """Indexes every valid entity in text under the source name."""
+        source_id = len(self.sources)
+        self.sources.append(source)
+        spellings = self.spellings
+        for kind, offset, candidate in occurrences(text):
+            term_id = spellings.get((kind, candidate))
+            if term_id is None:
+                term_id = spellings[kind, candidate] = self.term_id(kind, candidate)
+            if term_id >= 0:
+                self.posting_term.append(term_id)
+                self.posting_source.append(source_id)
+                self.posting_offset.append(offset)
+
+    def add_file(self, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            self.add(path, f.read())
+
+    def sections(self):
+        """Returns (header fields, {section name: array}) for the index as built so far."""
+        terms = self.terms
+        order = sorted(range(len(terms)), key=lambda i: terms[i][:2])
+        rank = array.array('I', bytes(4 * len(terms)))
+        for new_id, old_id in enumerate(order):
+            rank[old_id] = new_id
+
+        text = bytearray()
+        offsets = array.array('Q', [0])
+        type_ranges = {kind: [0, 0] for kind in TYPES}
+        for new_id, old_id in enumerate(order):
+            type_id, term, _ = terms[old_id]
+            text += term.encode('utf-8')
+            offsets.append(len(text))
+            kind_range = type_ranges[TYPES[type_id]]
+            if kind_range[1] == 0:
+                kind_range[0] = new_id
+            kind_range[1] = new_id + 1
+
+        # Counting sort of the postings by term; stable, so each term's stay in file order
+        starts = array.array('Q', bytes(8 * (len(terms) + 1)))
+        for term_id in self.posting_term:
+            starts[rank[term_id] + 1] += 1
+        for i in range(len(terms)):
+            starts[i + 1] += starts[i]
+        fill = array.array('Q', starts[:-1])
+        count = len(self.posting_term)
+        posting_source = array.array('I', bytes(4 * count))
+        posting_offset = array.array('Q', bytes(8 * count))
+        for term_id, source_id, offset in zip(self.posting_term, self.posting_source, self.posting_offset):
+            new_id = rank[term_id]
+            at = fill[new_id]
+            fill[new_id] = at + 1
+            posting_source[at] = source_id
+            posting_offset[at] = offset
+
+        time_type, amount_type = TYPE_IDS['time'], TYPE_IDS['currency']
+        times = sorted((key, rank[i]) for i, (type_id, _, key) in enumerate(terms) if type_id == time_type)
+        amounts = sorted((key, rank[i]) for i, (type_id, _, key) in enumerate(terms) if type_id == amount_type)
+        amount_ranges = {}
+        for i, ((code, _), _) in enumerate(amounts):
+            amount_ranges.setdefault(code, [i, i])[1] = i + 1
+
+        header = {
+            'types': TYPES,
+            'sources': self.sources,
+            'terms': len(terms),
+            'postings': count,
+            'type_ranges': type_ranges,
+            'amount_ranges': amount_ranges,
+        }
+        return header, {
+            'term_offsets': offsets,
+            'term_text': array.array('B', text),
+            'posting_starts': starts,
+            'posting_source': posting_source,
+            'posting_offset': posting_offset,
+            'time_keys': array.array('I', [key for key, _ in times]),
+            'time_terms': array.array('I', [term_id for _, term_id in times]),
+            'amount_keys': array.array('q', [amount for (_, amount), _ in amounts]),
+            'amount_terms': array.array('I', [term_id for _, term_id in amounts]),
+        }
+
+    def write(self, path):
+        header, arrays = self.sections()
+        # Section offsets are relative to the data start, which is aligned after the header
+        offset = 0
+        header['sections'] = []
+        for name, code in SECTIONS:
+            data = arrays[name]
+            header['sections'].append({'name': name, 'typecode': code, 'offset': offset, 'count': len(data)})
+            offset += -(-len(data) * data.itemsize // ALIGNMENT) * ALIGNMENT
+        header_bytes = json.dumps(header).encode('utf-8')
+        data_start = len(INDEX_MAGIC) + 8 + len(header_bytes)
+        with open(path, 'wb') as f:
+            f.write(INDEX_MAGIC)
+            f.write(len(header_bytes).to_bytes(8, 'little'))
+            f.write(header_bytes)
+            f.write(bytes(-data_start % ALIGNMENT))
+            for name, code in SECTIONS:
+                data = arrays[name]
+                if sys.byteorder == 'big':
+                    data = array.array(code, data)
+                    data.byteswap()
+                raw = data.tobytes()
+                f.write(raw)
+                f.write(bytes(-len(raw) % ALIGNMENT))
+
+def build_index(paths, index_path):
+    """Indexes the files at paths into index_path. Returns the IndexBuilder."""
+    builder = IndexBuilder()
+    for path in paths:
+        builder.add_file(path)
+    builder.write(index_path)
+    return builder
+
+class EntityIndex:
+    """
+    Read-only view of an index file. The file is memory-mapped and the arrays are read
+    in place, so opening it costs the same whatever its size; close() (or a with-block)
+    unmaps it.
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                raise ValueError(f"{path} is not an entity index file")
+            header_length = int.from_bytes(f.read(8), 'little')
+            self.header = json.loads(f.read(header_length))
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data_start = len(INDEX_MAGIC) + 8 + header_length
+        data_start += -data_start % ALIGNMENT
+        self.sources = self.header['sources']
+        self.type_ranges = self.header['type_ranges']
+        self.views = []
+        for section in self.header['sections']:
+            start = data_start + section['offset']
+            itemsize = array.array(section['typecode']).itemsize
+            raw = memoryview(self.mm)[start:start + section['count'] * itemsize]
+            self.views.append(raw)
+            if sys.byteorder == 'big':
+                data = array.array(section['typecode'], raw.tobytes())
+                data.byteswap()
+            else:
+                data = raw.cast(section['typecode'])
+                self.views.append(data)
+            setattr(self, section['name'], data)
+
+    def close(self):
+        # The mapping can't close while memoryviews into it are alive
+        for view in reversed(self.views):
+            view.release()
+        self.views = []
+        self.mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.header['terms']
+
+    def term(self, term_id):
+        offsets = self.term_offsets
+        return bytes(self.term_text[offsets[term_id]:offsets[term_id + 1]]).decode('utf-8')
+
+    def term_id(self, kind, value):
+        """Id of the term value normalizes to (any spelling the extractor accepts), or -1."""
+        result = CHECKS[kind](value)
+        if not result.valid:
+            return -1
+        term, _ = normalized_term(result)
+        lo, hi = self.type_ranges[kind]
+        i = bisect.bisect_left(range(lo, hi), term, key=self.term) + lo
+        return i if i < hi and self.term(i) == term else -1
+
+    def postings(self, term_id):
+        """[(source, byte offset)] of a term's occurrences, in file order."""
+        if term_id < 0:
+            return []
+        starts, sources, offsets = self.posting_starts, self.posting_source, self.posting_offset
+        return [(self.sources[sources[i]], offsets[i]) for i in range(starts[term_id], starts[term_id + 1])]
+
+    def find(self, kind, value):
+        """[(source, byte offset)] of every occurrence of value as an entity of this type."""
+        return self.postings(self.term_id(kind, value))
+
+    def files(self, kind, value):
+        """Names of the sources containing value, in index order."""
+        term_id = self.term_id(kind, value)
+        if term_id < 0:
+            return []
+        source_ids = self.posting_source[self.posting_starts[term_id]:self.posting_starts[term_id + 1]]
+        return [self.sources[i] for i in sorted(set(source_ids))]
+
+    def terms(self, kind):
+        """Every distinct term of one type, sorted."""
+        lo, hi = self.type_ranges[kind]
+        return [self.term(i) for i in range(lo, hi)]
+
+    def range_postings(self, term_ids, lo, hi):
+        for i in range(lo, hi):
+            term_id = term_ids[i]
+            term = self.term(term_id)
+            for source, offset in self.postings(term_id):
+                yield term, source, offset
+
+    def times_between(self, low, high):
+        """Yields (term, source, byte offset) for times from low to high (datetime.time, inclusive), by time."""
+        keys = self.time_keys
+        lo = bisect.bisect_left(keys, seconds_of_day(low))
+        hi = bisect.bisect_right(keys, seconds_of_day(high))
+        return self.range_postings(self.time_terms, lo, hi)
+
+    def amounts_between(self, low, high, code=None):
+        """
+        Yields (term, source, byte offset) for currency amounts from low to high
+        (inclusive), by code then amount; code: only this ISO currency code.
+        """
+        keys = self.amount_keys
+        ranges = self.header['amount_ranges']
+        codes = [code] if code is not None else sorted(ranges)
+        for c in codes:
+            if c not in ranges:
+                continue
+            start, stop = ranges[c]
+            lo = bisect.bisect_left(keys, amount_key(low, c, math.ceil), start, stop)
+            hi = bisect.bisect_right(keys, amount_key(high, c, math.floor), start, stop)
+            yield from self.range_postings(self.amount_terms, lo, hi)
+
+def parse_time(text):
+    """'09:30' -> datetime.time(9, 30), for the command line."""
+    try:
+        return datetime.time.fromisoformat(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a time: {text!r}")
+
+def parse_amount(text):
+    try:
+        return Decimal(text)
+    except InvalidOperation:
+        raise argparse.ArgumentTypeError(f"not an amount: {text!r}")
+
+def main(argv=None):
+    # Usage: python entity_index.py --output corpus.idx file ...
+    #        python entity_index.py --index corpus.idx --find TYPE VALUE | --times FROM TO | --amounts LOW HIGH [--code USD]
+    parser = argparse.ArgumentParser(description="Build or query an index of the entities in a set of files.")
+    parser.add_argument('paths', nargs='*', help="files to index")
+    parser.add_argument('--output', help="index file to build from paths")
+    parser.add_argument('--index', help="index file to query")
+    query = parser.add_mutually_exclusive_group()
+    query.add_argument('--find', nargs=2, metavar=('TYPE', 'VALUE'), help="occurrences of one entity")
+    query.add_argument('--files', nargs=2, metavar=('TYPE', 'VALUE'), help="files containing one entity")
+    query.add_argument('--times', nargs=2, type=parse_time, metavar=('FROM', 'TO'), help="times in a range")
+    query.add_argument('--amounts', nargs=2, type=parse_amount, metavar=('LOW', 'HIGH'), help="amounts in a range")
+    parser.add_argument('--code', help="with --amounts: only this currency code")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        try:
+            builder = build_index(args.paths, args.output)
+        except FileNotFoundError as e:
+            print(f"Error: File not found at {e.filename}", file=sys.stderr)
+            return 1
+        print(f"indexed {len(builder.posting_term):,} entities ({len(builder.terms):,} distinct) "
+              f"from {len(builder.sources)} files into {args.output}")
+        return 0
+    if not args.index:
+        parser.error("give --output to build an index or --index to query one")
+    for option in ('find', 'files'):
+        kind = (getattr(args, option) or [None])[0]
+        if kind is not None and kind not in CHECKS:
+            parser.error(f"unknown entity type {kind!r} (one of {', '.join(CHECKS)})")
+
+    with EntityIndex(args.index) as index:
+        if args.find:
+            for source, offset in index.find(*args.find):
+                print(f"{source}:{offset}")
+        elif args.files:
+            for source in index.files(*args.files):
+                print(source)
+        elif args.times:
+            for term, source, offset in index.times_between(*args.times):
+                print(f"{term} {source}:{offset}")
+        elif args.amounts:
+            for term, source, offset in index.amounts_between(*args.amounts, code=args.code):
+                print(f"{term} {source}:{offset}")
+        else:
+            print(json.dumps({key: index.header[key] for key in ('terms', 'postings', 'type_ranges')}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
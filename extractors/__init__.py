@@ -0,0 +1,56 @@
+"""
+Extraction and validation of emails, times, credit card numbers, currency amounts
+and phone numbers.
+
+Names are loaded on first use: `from extractors import validate_phone` only imports
+extractors.phones and compiles the phone regexes. The single-pass engine over all
+types lives in all_validations.py.
+"""
+# Public name -> submodule that defines it
+EXPORTS = {
+    'validate_email': 'emails',
+    'check_email': 'emails',
+    'is_email_like': 'emails',
+    'extract_emails': 'emails',
+    'email_with_at_pattern': 'emails',
+    'email_without_at_pattern': 'emails',
+    'validate_time': 'times',
+    'parse_time': 'times',
+    'time_results': 'times',
+    'time_messages': 'times',
+    'extract_times': 'times',
+    'time_candidate_pattern': 'times',
+    'detect_issuer': 'credit_cards',
+    'is_repeated_sequence': 'credit_cards',
+    'passes_luhn': 'credit_cards',
+    'validate_credit_card': 'credit_cards',
+    'check_credit_card': 'credit_cards',
+    'extract_credit_cards': 'credit_cards',
+    'cc_pattern': 'credit_cards',
+    'validate_currency': 'currencies',
+    'parse_currency': 'currencies',
+    'parse_amount': 'currencies',
+    'check_currency': 'currencies',
+    'extract_currencies': 'currencies',
+    'currency_pattern': 'currencies',
+    'validate_phone': 'phones',
+    'parse_phone': 'phones',
+    'check_phone': 'phones',
+    'is_credit_card_like': 'phones',
+    'extract_phones': 'phones',
+    'phone_pattern': 'phones',
+    'main': 'cli',
+}
+
+__all__ = sorted(EXPORTS)
+
+def __getattr__(name):
+    try:
+        module = EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = getattr(__import__(f'{__name__}.{module}', fromlist=[name]), name)
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(EXPORTS))
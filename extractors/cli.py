@@ -0,0 +1,52 @@
+import sys
+
+##COMMAND LINE
+# Shared entry point code for the per-type modules and `python -m extractors`.
+# Nothing here runs on import; file I/O only happens when a main() is called.
+DEFAULT_INPUT = r"api_response.txt"
+
+# Entity type -> module holding its main()
+COMMANDS = {
+    'email': 'extractors.emails',
+    'time': 'extractors.times',
+    'credit_card': 'extractors.credit_cards',
+    'currency': 'extractors.currencies',
+    'phone': 'extractors.phones',
+    'all': 'all_validations',
+}
+
+def read_input(argv=None):
+    """
+    Reads the file named by argv[0] (default api_response.txt).
+    Returns the text, or None after printing an error when the file is missing.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    file_path = argv[0] if argv else DEFAULT_INPUT
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        print(f"Error: File not found at {file_path}")
+        return None
+
+def run(title, extract, validate, argv=None):
+    """Prints title and a 'candidate: result' line per extracted candidate. Returns an exit status."""
+    return run_results(title, lambda text: [(c, validate(c)) for c in extract(text)], argv)
+
+def run_results(title, results, argv=None):
+    """Like run(), for a results(text) function returning (candidate, result) pairs."""
+    text = read_input(argv)
+    if text is None:
+        return 1
+    lines = [title, ""] + [f"{candidate}: {result}" for candidate, result in results(text)]
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return 0
+
+def main(argv=None):
+    # Usage: python -m extractors [email|time|credit_card|currency|phone|all] [path]
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv and argv[0] in COMMANDS else 'all'
+    if argv and argv[0] in COMMANDS:
+        argv = argv[1:]
+    module = __import__(COMMANDS[command], fromlist=['main'])
+    return module.main(argv)
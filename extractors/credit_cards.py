@@ -0,0 +1,87 @@
+import re
+
+from dedup import unique
+from patterns import card_separator_re
+from extractors.cli import run
+from records import Result, OK, CARD_NON_DIGIT, CARD_LENGTH, CARD_REPEATED, CARD_LUHN
+
+##CREDIT CARD VALIDATION
+# Issuer detection function
+def detect_issuer(clean_card):
+    # Visa: starts with 4, usually 13 or 16 digits
+    if clean_card.startswith('4') and len(clean_card) in (13, 16):
+        return 'Visa'
+    # American Express: starts with 34 or 37, 15 digits
+    if clean_card[:2] in ('34', '37') and len(clean_card) == 15:
+        return 'American Express'
+    # MasterCard: 51-55 OR 2221-2720, usually 16 digits
+    start2 = int(clean_card[:2]) if len(clean_card) >= 2 and clean_card[:2].isdigit() else -1
+    start4 = int(clean_card[:4]) if len(clean_card) >= 4 and clean_card[:4].isdigit() else -1
+    if (51 <= start2 <= 55 or 2221 <= start4 <= 2720) and len(clean_card) == 16:
+        return 'MasterCard'
+    # Discover: 6011, 65, 644-649 (typical 16 digits)
+    if (clean_card.startswith('6011') or clean_card.startswith('65') or
+        (len(clean_card) >= 3 and 644 <= int(clean_card[:3]) <= 649)) and len(clean_card) == 16:
+        return 'Discover'
+    # Fallback: unknown issuer but plausible length
+    return None
+
+def is_repeated_sequence(s):
+    # One comparison instead of a generator over the digits; s may be str or bytes
+    return s == s[:1] * len(s)
+
+# Luhn checksum: double every second digit from the right (minus 9 if over 9), total must end in 0
+def passes_luhn(clean_card):
+    total = 0
+    for i, ch in enumerate(reversed(clean_card)):
+        digit = int(ch)
+        if i % 2 == 1:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return total % 10 == 0
+
+# Validation function (Luhn check is opt-in): a records.Result (see results.py)
+def check_credit_card(card, start=-1, end=-1, luhn=False):
+    # Remove spaces and dashes (none to remove from a run of digits)
+    return card_result(card, card if card.isdigit() else card_separator_re.sub('', card), start, end, luhn)
+
+def card_result(card, clean_card, start=-1, end=-1, luhn=False, passes=passes_luhn, issuer_of=detect_issuer):
+    """
+    check_credit_card() with the separators already removed. clean_card may also be
+    ASCII bytes, with passes and issuer_of working on bytes (fast_validators.py).
+    """
+    # Ensure only digits remain
+    if not clean_card.isdigit():
+        return Result('credit_card', card, CARD_NON_DIGIT, None, None, start, end)
+
+    # Check digit length
+    if not (13 <= len(clean_card) <= 16):
+        return Result('credit_card', card, CARD_LENGTH, None, None, start, end)
+
+    # Reject obvious repeated digit sequences like '0000...'
+    if is_repeated_sequence(clean_card):
+        return Result('credit_card', card, CARD_REPEATED, None, None, start, end)
+
+    # Reject numbers with a bad check digit (only when asked)
+    if luhn and not passes(clean_card):
+        return Result('credit_card', card, CARD_LUHN, None, None, start, end)
+
+    # Check issuer heuristics; if format is OK but issuer unknown, still plausible
+    return Result('credit_card', card, OK, issuer_of(clean_card), None, start, end)
+
+def validate_credit_card(card, luhn=False):
+    """Returns a descriptive validation string."""
+    return check_credit_card(card, -1, -1, luhn).message
+
+# Regex to capture common card formats (groups of 4 separated by space/dash OR continuous digits)
+cc_pattern = r'(?:\d{4}[-\s]?){3}\d{4}|\d{13,16}'
+
+# Clean up, preserving order
+def extract_credit_cards(text, dedup=None):
+    return unique((c.strip() for c in re.findall(cc_pattern, text)), dedup)
+
+def main(argv=None):
+    return run("Credit Card Validation Results (heuristic, no Luhn):",
+               extract_credit_cards, validate_credit_card, argv)
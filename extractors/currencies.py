@@ -0,0 +1,117 @@
+import re
+from decimal import Decimal
+
+from currency_table import DEFAULT_TABLE
+from dedup import unique
+from extractors.cli import run
+from records import (
+    AmountResult, Result, render_message, OK, CURRENCY_MARKER, CURRENCY_DECIMALS, CURRENCY_NO_DECIMALS,
+    CURRENCY_NON_DIGIT, CURRENCY_COMMAS
+)
+
+##CURRENCY VALIDATION
+# check_currency returns a records.Result; the validate/parse functions return its
+# message (records.render_message), without building the record.
+
+def match_currency(candidate, table=DEFAULT_TABLE):
+    """
+    Validates currency amounts with mandatory currency markers:
+    Examples: $1234.56, £1,234.56, 1.234,56 €, ₹12,34,567.00, 1,500 RWF, Ksh 1200
+    The number format and minor units are those of the marker's currency
+    (see currency_table.CurrencyTable).
+    Returns (error, detail, integer digits, decimals): error a records.ErrorCode (OK
+    when valid), detail the ISO code when valid and the error's Result.detail when
+    not (the currency's minor units for CURRENCY_DECIMALS); digits and decimals are
+    None when invalid, decimals also when the amount has none.
+    table: currency_table.CurrencyTable listing the accepted markers
+    """
+    s = candidate.strip()
+
+    # Must have a currency marker: symbol or code at the start, or code at the end.
+    # The same pass removes known symbols/codes for numeric validation
+    marker, numeric_part = table.split_markers(s)
+    if marker is None:
+        return CURRENCY_MARKER, None, None, None
+    numeric_part = numeric_part.strip()
+    code, rules = table.marker_rules[marker.upper() if table.ignore_case else marker]
+
+    # One regex tries each of the currency's number formats (precompiled per currency)
+    m = rules.regex.fullmatch(numeric_part)
+    if m:
+        return (OK, code) + rules.split_amount(m)
+
+    # No format fits: explain why under the format whose decimal separator
+    # is the last separator in the amount (or the currency's main format)
+    groups, decimal, grouping = rules.diagnostic_format(numeric_part)
+
+    # Split integer and decimal if exists
+    if decimal in numeric_part:
+        int_part, dec_part = numeric_part.split(decimal, 1)
+        if len(dec_part) != rules.minor_units or not dec_part.isdigit():
+            if not rules.minor_units:
+                return CURRENCY_NO_DECIMALS, None, None, None
+            return CURRENCY_DECIMALS, rules.minor_units, None, None
+    else:
+        int_part = numeric_part
+
+    # Remove group separators for numeric check
+    int_clean = int_part
+    for separator in groups:
+        int_clean = int_clean.replace(separator, '')
+    if not int_clean.isdigit():
+        return CURRENCY_NON_DIGIT, None, None, None
+
+    # Digits are fine, so the separators are misplaced
+    return CURRENCY_COMMAS, None, None, None
+
+def check_currency(candidate, start=-1, end=-1, table=DEFAULT_TABLE):
+    """
+    A records.Result for candidate: an AmountResult (amount in integer minor units,
+    $12 -> 1200, 1.500 RWF -> 1500) when valid.
+    """
+    error, code, digits, decimals = match_currency(candidate, table)
+    if error:
+        return Result('currency', candidate, error, None, code, start, end)
+    if decimals is None:
+        decimals = '0' * table.rules[code].minor_units
+    return AmountResult(candidate, int(digits + decimals), code, start, end)
+
+def parse_currency(candidate, table=DEFAULT_TABLE):
+    """
+    Returns (message, ISO code, Decimal amount); code and amount are None when invalid.
+    Amounts carry the currency's minor units: $12 -> 12.00, 1.500 RWF -> 1500.
+    """
+    error, code, digits, decimals = match_currency(candidate, table)
+    if error:
+        return render_message('currency', error, None, code), None, None
+    minor_units = table.rules[code].minor_units
+    if minor_units:
+        return render_message('currency', OK), code, Decimal(f"{digits}.{decimals or '0' * minor_units}")
+    return render_message('currency', OK), code, Decimal(digits)
+
+def parse_amount(candidate, table=DEFAULT_TABLE):
+    """
+    parse_currency() with the amount as an integer number of minor units:
+    $12 -> 1200, $1,234.56 -> 123456, 1.500 RWF -> 1500.
+    """
+    error, code, digits, decimals = match_currency(candidate, table)
+    if error:
+        return render_message('currency', error, None, code), None, None
+    if decimals is None:
+        decimals = '0' * table.rules[code].minor_units
+    return render_message('currency', OK), code, int(digits + decimals)
+
+def validate_currency(candidate, table=DEFAULT_TABLE):
+    error, code, digits, decimals = match_currency(candidate, table)
+    return render_message('currency', error, None, code)
+
+# Regex to capture numbers with mandatory currency markers (markers come from the table)
+currency_pattern = DEFAULT_TABLE.candidate_pattern
+
+# Deduplicate and remove empty matches
+def extract_currencies(text, dedup=None):
+    candidates = re.findall(currency_pattern, text)
+    return unique((c.strip() for c in candidates if c.strip()), dedup)
+
+def main(argv=None):
+    return run("Currency Validation Results:", extract_currencies, validate_currency, argv)
@@ -0,0 +1,97 @@
+import re
+
+from dedup import unique
+from patterns import (
+    email_username_re, email_domain_part_re, email_tld_re, valid_email_re, numeric_dotted_re,
+    letter_re
+)
+from extractors.cli import run
+from records import (
+    Result, OK, EMAIL_AT_COUNT, EMAIL_USERNAME, EMAIL_DOMAIN_DOT, EMAIL_DOMAIN_PART, EMAIL_TLD
+)
+
+##EMAIL VALIDATION
+# Validation function: a records.Result (see results.py); validate_email is its message
+def check_email(email, start=-1, end=-1):
+    # Valid addresses, the common case, take one regex; the checks below find the error
+    if valid_email_re.fullmatch(email):
+        return Result('email', email, OK, None, None, start, end)
+
+    # Check for exactly one @ symbol
+    if email.count('@') != 1:
+        return Result('email', email, EMAIL_AT_COUNT, None, None, start, end)
+
+    username, domain_part = email.split('@')
+
+    # Username: letters, digits, dot, dash, underscore
+    if not email_username_re.fullmatch(username):
+        return Result('email', email, EMAIL_USERNAME, None, None, start, end)
+
+    # Domain must contain at least one dot
+    if '.' not in domain_part:
+        return Result('email', email, EMAIL_DOMAIN_DOT, None, None, start, end)
+
+    # Split domain into parts
+    domain_parts = domain_part.split('.')
+    for part in domain_parts[:-1]:
+        if not email_domain_part_re.fullmatch(part):
+            return Result('email', email, EMAIL_DOMAIN_PART, None, part, start, end)
+
+    # Top-level domain check
+    if not email_tld_re.fullmatch(domain_parts[-1]):
+        return Result('email', email, EMAIL_TLD, None, domain_parts[-1], start, end)
+
+    return Result('email', email, OK, None, None, start, end)
+
+def validate_email(email):
+    """Returns a descriptive validation string."""
+    return check_email(email).message
+
+##LINEAR-TIME CANDIDATE PATTERNS
+# Both patterns only start at the beginning of a run of [\w.-] characters, and take the
+# run with a possessive or single-direction scan. Each run is therefore tried once
+# and read a bounded number of times, so extraction time is linear in the text length.
+# The original patterns could be retried at every position of a long dotted or
+# hyphenated token (minified JS, base64, "a-b-c-..."), and the one without '@' also
+# backtracked over every pair of dots, which is quadratic in the token length or worse.
+# See benchmarks/email_backtracking.py.
+#
+# They find the same candidates as the original patterns, except:
+#   - with '@': a match no longer starts right where the previous one ended inside the
+#     same run ("a@b.c-x@e.ff" gives a@b.c but no longer "-x@e.ff");
+#   - without '@': a run starting with more than MAX_LEADING_SEPARATORS dots or dashes
+#     ("---------abc.def") gives no candidate.
+MAX_LEADING_SEPARATORS = 8
+
+# Start of a run, or the first word character after up to MAX_LEADING_SEPARATORS
+# leading dots/dashes (lookbehind must be fixed-width, so one lookbehind per count)
+RUN_START = r'(?<![\w.-])'
+FIRST_WORD_IN_RUN = '(?:' + '|'.join(
+    [RUN_START] + [rf'(?<={RUN_START}[.-]{{{n}}})' for n in range(1, MAX_LEADING_SEPARATORS + 1)]
+) + ')'
+
+# Step 1: Extract standard emails (with @)
+# Originally r'[\w\.-]+@[\w\.-]+\.\w+'
+# ++ and *+ below are possessive (Python 3.11+): a run is never given back to retry
+email_with_at_pattern = RUN_START + r'[\w.-]++@[\w.-]+\.\w+'
+
+# Step 2: Extract "email-like" strings without @ but containing a dot:
+# from the first to the last word character of the run, with a dot in between
+# Originally r'\b[\w\.-]+\.[\w\.-]+\b'
+email_without_at_pattern = FIRST_WORD_IN_RUN + r'\w[\w-]*+\.[\w.-]*\w'
+
+# Step 2a: Remove purely numeric strings (e.g., 123.456)
+def is_email_like(e):
+    # Remove purely numeric strings
+    return (not numeric_dotted_re.fullmatch(e)
+            # Keep only if there's at least one letter before the first dot
+            and letter_re.search(e.split('.')[0]))
+
+# Step 3: Combine both lists, remove duplicates (first-seen order)
+def extract_emails(text, dedup=None):
+    emails_with_at = re.findall(email_with_at_pattern, text)
+    emails_without_at = [e for e in re.findall(email_without_at_pattern, text) if is_email_like(e)]
+    return unique(emails_with_at + emails_without_at, dedup)
+
+def main(argv=None):
+    return run("Email Validation Results:", extract_emails, validate_email, argv)
@@ -0,0 +1,112 @@
+import re
+
+from dedup import unique
+from patterns import non_digit_re, phone_parentheses_re, phone_intl_parentheses_re
+from phone_plans import DEFAULT_PLANS
+from extractors.cli import run
+from records import Result, render_message, OK, PHONE_COUNTRY_CODE, PHONE_DIGIT_COUNT, PHONE_PARENTHESES, PHONE_LEADING_DIGITS
+
+##PHONE NUMBER VALIDATION
+# Numbers starting with '+' are read with the country calling code trie in
+# phone_plans.py: one walk over the digits finds the code, then the rest must have a
+# length that country's plan allows. Numbers without '+' are national numbers in the
+# plan's national country (NANP: 10 digits, or 11 with the leading 1). Numbers of a
+# plan with leading digit rules must also start as it allows (NANP: the area code and
+# the exchange start with 2-9).
+# Valid numbers are normalized to E.164: '+', calling code, national significant number.
+# check_phone returns a records.Result; the validate/parse functions return its
+# message (records.render_message), without building the record.
+def split_phone(number, plans=DEFAULT_PLANS):
+    """
+    Returns (status, plan, national significant number) where status is one of
+    'ok', 'code' (unknown calling code), 'length', 'parentheses' or 'leading'
+    (first digits the plan doesn't allow).
+    """
+    return split_phone_digits(number, non_digit_re.sub('', number), plans)
+
+# Area code parentheses checks: (national number, number with '+')
+PARENTHESES_CHECKS = (phone_parentheses_re.fullmatch, phone_intl_parentheses_re.fullmatch)
+
+def split_phone_digits(number, digits, plans=DEFAULT_PLANS, parentheses_checks=PARENTHESES_CHECKS):
+    """
+    split_phone() with the digits of number already taken out (the regex-free path
+    in fast_validators.py gets them another way, and checks parentheses without
+    regexes through parentheses_checks).
+    """
+    parenthesized = '(' in number or ')' in number
+    # Most numbers have no '+' at all: skip lstrip() for them
+    if number[:1] == '+' or ('+' in number and number.lstrip()[:1] == '+'):
+        plan, nsn = plans.split_code(digits)
+        if plan is None:
+            return 'code', None, digits
+        # '+44 (0)20 ...': the trunk prefix written in parentheses is not dialled
+        if parenthesized and plan.trunk and f'({plan.trunk})' in number and nsn.startswith(plan.trunk):
+            nsn = nsn[len(plan.trunk):]
+        parentheses_ok = parentheses_checks[1]
+    else:
+        plan, nsn = plans.national, digits
+        if plan.trunk and nsn.startswith(plan.trunk) and len(nsn) - len(plan.trunk) in plan.lengths:
+            nsn = nsn[len(plan.trunk):]
+        parentheses_ok = parentheses_checks[0]
+
+    if len(nsn) not in plan.lengths:
+        return 'length', plan, nsn
+
+    # Area code parentheses check
+    if parenthesized:
+        if not parentheses_ok(number):
+            return 'parentheses', plan, nsn
+
+    if plan.restricted and not plan.leading_ok(nsn):
+        return 'leading', plan, nsn
+
+    return 'ok', plan, nsn
+
+# Error code for each failed check of split_phone()
+PHONE_STATUS_CODES = {
+    'code': PHONE_COUNTRY_CODE,
+    'length': PHONE_DIGIT_COUNT,
+    'parentheses': PHONE_PARENTHESES,
+    'leading': PHONE_LEADING_DIGITS,
+}
+
+def phone_detail(status, plan):
+    """Result.detail of a failed split_phone() check."""
+    return plan.length_rule() if status == 'length' else plan.leading if status == 'leading' else None
+
+def check_phone(number, start=-1, end=-1):
+    status, plan, nsn = split_phone(number)
+    if status == 'ok':
+        return Result('phone', number, OK, f'+{plan.code}{nsn}', plan.region, start, end)
+    return Result('phone', number, PHONE_STATUS_CODES[status], None, phone_detail(status, plan), start, end)
+
+def phone_message(status, plan, nsn):
+    """(message, E.164 form or None) for a split_phone() result."""
+    if status == 'ok':
+        e164 = f'+{plan.code}{nsn}'
+        return render_message('phone', OK, e164), e164
+    return render_message('phone', PHONE_STATUS_CODES[status], None, phone_detail(status, plan)), None
+
+def parse_phone(number, plans=DEFAULT_PLANS):
+    """Returns (message, E.164 form or None)."""
+    return phone_message(*split_phone(number, plans))
+
+def validate_phone(number):
+    return parse_phone(number)[0]
+
+# An international number with a known calling code and a plausible length for it,
+# else a 3-3-4 national number with optional separators and optional country code
+phone_pattern = DEFAULT_PLANS.candidate_pattern
+
+# Filter out credit card-like numbers (16 digits)
+def is_credit_card_like(number):
+    digits_only = non_digit_re.sub('', number)
+    return len(digits_only) == 16
+
+# Remove duplicates, then card-like numbers
+def extract_phones(text, dedup=None):
+    phones = unique((m.group(0) for m in re.finditer(phone_pattern, text)), dedup)
+    return [p for p in phones if not is_credit_card_like(p)]
+
+def main(argv=None):
+    return run("Phone Number Validation Results:", extract_phones, validate_phone, argv)
@@ -0,0 +1,255 @@
+import datetime
+import functools
+import re
+
+from dedup import ExactDedup, unique
+from extractors.cli import run_results
+from records import ERROR_MESSAGES, TIME_DATE, TIME_FORMAT, TIME_HOUR_12, TIME_HOUR_24, TIME_MINUTE, TIME_SECOND
+
+##TIME EXTRACTION
+# One pattern covers every time form, and its groups capture the hour, minute and
+# second as the text is scanned, so a match is validated from those integers without
+# parsing the candidate a second time:
+#   14:30, 2:30 PM, 12:59am          - H:MM, optional AM/PM
+#   14:30:15, 2:30:15 pm             - with seconds
+#   09:00-17:30, 9:00 AM to 5:30 PM  - a range of two of the above (-, en/em dash or 'to')
+#   2025-09-26T14:30:00Z             - ISO 8601 date-time: optional seconds, fraction
+#                                      and UTC offset; 'T' or a space before the time
+# time_candidate_pattern is the same pattern without the groups, for the single-pass
+# engine (all_validations.py), which only needs where a time starts and ends.
+
+# Dashes as an alternation, not a class: mmap_scan.py runs this pattern UTF-8 encoded,
+# where '–' and '—' are three bytes each
+RANGE_SEPARATOR = r'\s*(?:-|–|—)\s*|\s+to\s+'
+UTC_OFFSET = r'[Zz]|[+-](?:[01]\d|2[0-3])(?::?[0-5]\d)?'
+
+def capture(name, body, named=True):
+    return f'(?P<{name}>{body})' if named else f'(?:{body})'
+
+def clock_source(prefix='', named=True):
+    """One clock time: H:MM with optional :SS and AM/PM; group names start with prefix."""
+    return (capture(prefix + 'hour', r'\d{1,2}', named) + ':' + capture(prefix + 'minute', r'\d{2}', named)
+            + '(?::' + capture(prefix + 'second', r'\d{2}', named) + ')?'
+            + r'(?:\s*' + capture(prefix + 'ampm', '[AaPp][Mm]', named) + ')?')
+
+def time_source(named=True):
+    """Source of the time pattern; named=False leaves out the capture groups."""
+    iso = (capture('year', r'\d{4}', named) + '-' + capture('month', r'\d{2}', named)
+           + '-' + capture('day', r'\d{2}', named)
+           + '[Tt ]' + capture('iso_hour', r'\d{2}', named) + ':' + capture('iso_minute', r'\d{2}', named)
+           + '(?::' + capture('iso_second', r'\d{2}', named)
+           + '(?:[.,]' + capture('fraction', r'\d{1,9}', named) + ')?)?'
+           + capture('offset', UTC_OFFSET, named) + '?')
+    # (?=\d) first: positions without a digit fail before the \b and the alternatives are tried
+    return (rf'(?=\d)\b(?:{iso}|{clock_source("", named)}'
+            rf'(?:(?:{RANGE_SEPARATOR}){clock_source("end_", named)})?)\b')
+
+# Candidate extraction: the pattern above without its groups
+time_candidate_pattern = time_source(named=False)
+
+# Compiled on first use, like the single-pass engine
+@functools.cache
+def compiled_time_scanner():
+    return re.compile(time_source())
+
+# validate_time() on a lone clock time, the most common candidate: fullmatching this
+# alone skips trying the ISO 8601 and range alternatives first
+@functools.cache
+def compiled_clock_pattern():
+    return re.compile(clock_source())
+
+##TIME VALIDATION
+# Validation works on the groups of a time_scanner match (groups(), or the same slice
+# of the single-pass engine's groups, see all_validations.scan) and returns (status,
+# value, clock): status 'ok' or the failed check, value a datetime.time, a (start, end)
+# pair of them for ranges, or a datetime.datetime for ISO 8601, and clock 12 or 24, the
+# clock the (first) time was written in.
+# Error code for each failed check; the messages are the records' (see records.py)
+TIME_STATUS_CODES = {
+    'format': TIME_FORMAT,
+    'minute': TIME_MINUTE,
+    'second': TIME_SECOND,
+    'hour12': TIME_HOUR_12,
+    'hour24': TIME_HOUR_24,
+    'date': TIME_DATE,
+}
+TIME_MESSAGES = {status: ERROR_MESSAGES[code] for status, code in TIME_STATUS_CODES.items()}
+
+def clock_parts(hour, minute, second, ampm):
+    """(status, hour on the 24-hour clock, minute, second) from the captured parts of one clock time."""
+    hour, minute = int(hour), int(minute)
+    second = int(second) if second is not None else 0
+    if minute > 59:
+        return 'minute', hour, minute, second
+    if second > 59:
+        return 'second', hour, minute, second
+    if ampm:
+        if not (1 <= hour <= 12):
+            return 'hour12', hour, minute, second
+        hour = hour % 12 + (12 if ampm.upper() == 'PM' else 0)
+    elif hour > 23:
+        return 'hour24', hour, minute, second
+    return 'ok', hour, minute, second
+
+def clock_value(hour, minute, second, ampm):
+    """(status, datetime.time or None) from the captured parts of one clock time."""
+    status, hour, minute, second = clock_parts(hour, minute, second, ampm)
+    return status, datetime.time(hour, minute, second) if status == 'ok' else None
+
+def iso_value(year, month, day, hour, minute, second, fraction, offset):
+    try:
+        date = datetime.date(int(year), int(month), int(day))
+    except ValueError:
+        return 'date', None
+    status, t = clock_value(hour, minute, second, None)
+    if t is None:
+        return status, None
+    microsecond = int(fraction[:6].ljust(6, '0')) if fraction else 0
+    tz = None
+    if offset in ('Z', 'z'):
+        tz = datetime.timezone.utc
+    elif offset:
+        sign = -1 if offset[0] == '-' else 1
+        digits = offset[1:].replace(':', '')
+        tz = datetime.timezone(sign * datetime.timedelta(hours=int(digits[:2]), minutes=int(digits[2:] or 0)))
+    return 'ok', datetime.datetime.combine(date, t.replace(microsecond=microsecond), tz)
+
+def groups_time(groups):
+    """(status, value, clock) for the groups() of a time_scanner match."""
+    # The order is the pattern's
+    (year, month, day, iso_hour, iso_minute, iso_second, fraction, offset,
+     hour, minute, second, ampm, end_hour, end_minute, end_second, end_ampm) = groups
+    if year is not None:
+        status, value = iso_value(year, month, day, iso_hour, iso_minute, iso_second, fraction, offset)
+        return status, value, 24
+    clock = 12 if ampm else 24
+    status, start = clock_value(hour, minute, second, ampm)
+    if start is None or end_hour is None:
+        return status, start, clock
+    status, end = clock_value(end_hour, end_minute, end_second, end_ampm)
+    return status, (start, end) if end is not None else None, clock
+
+def match_time(m):
+    """(status, value, clock) for a time_scanner match."""
+    return groups_time(m.groups())
+
+# A clock time written with seconds: '14:30:00', '09:00-17:30:00'
+seconds_re = re.compile(r':\d\d:')
+
+def written_seconds(candidate):
+    """Whether a clock time or range candidate has seconds, even if they are zero."""
+    return seconds_re.search(candidate) is not None
+
+def clock_text(t, seconds=False):
+    """'14:30', or '14:30:15' when there are seconds or seconds=True ('14:30:00')."""
+    if seconds or t.second:
+        return f'{t.hour:02d}:{t.minute:02d}:{t.second:02d}'
+    return f'{t.hour:02d}:{t.minute:02d}'
+
+def time_message(value, clock, seconds=False):
+    """
+    The validation message for a valid time value; seconds: the candidate was written
+    with seconds (see written_seconds()), which the message keeps when they are zero.
+    """
+    if type(value) is datetime.time:
+        if clock == 12:
+            hour = value.hour % 12 or 12
+            return f"Valid 12-hour time (normalized: {clock_text(value.replace(hour=hour), seconds)} {'AM' if value.hour < 12 else 'PM'})"
+        return f"Valid 24-hour time (normalized: {clock_text(value, seconds)})"
+    if isinstance(value, tuple):
+        return f"Valid time range (normalized: {clock_text(value[0], seconds)}-{clock_text(value[1], seconds)})"
+    return f"Valid ISO 8601 date-time (normalized: {value.isoformat()})"
+
+def clock_message(hour, minute, second, ampm):
+    """time_message() for one clock time, straight from its captured parts."""
+    written = second is not None
+    status, hour, minute, second = clock_parts(hour, minute, second, ampm)
+    if status != 'ok':
+        return TIME_MESSAGES[status]
+    seconds = f':{second:02d}' if written else ''
+    if ampm:
+        return f"Valid 12-hour time (normalized: {hour % 12 or 12:02d}:{minute:02d}{seconds} {'AM' if hour < 12 else 'PM'})"
+    return f"Valid 24-hour time (normalized: {hour:02d}:{minute:02d}{seconds})"
+
+@functools.cache
+def message_group_indices():
+    """
+    (year, end_hour, clock slice, second, end_second): where groups_message looks in
+    a time_scanner match's groups().
+    """
+    index = compiled_time_scanner().groupindex
+    return (index['year'] - 1, index['end_hour'] - 1, slice(index['hour'] - 1, index['ampm']),
+            index['second'] - 1, index['end_second'] - 1)
+
+def groups_message(groups):
+    """The validation message for the groups() of a time_scanner match."""
+    year, end_hour, clock, second, end_second = message_group_indices()
+    if groups[year] is None and groups[end_hour] is None:
+        # A single clock time: no datetime values needed for its message
+        return clock_message(*groups[clock])
+    status, value, clock = groups_time(groups)
+    if value is None:
+        return TIME_MESSAGES[status]
+    return time_message(value, clock, groups[second] is not None or groups[end_second] is not None)
+
+def parse_time(candidate):
+    """
+    candidate: string matched like '14:30', '2:30 PM', '14:30:15', '09:00-17:30',
+    '2025-09-26T14:30:00Z'
+    Returns (message, value); value is None when invalid.
+    """
+    m = compiled_time_scanner().fullmatch(candidate.strip())
+    if not m:
+        return TIME_MESSAGES['format'], None
+    status, value, clock = match_time(m)
+    if value is None:
+        return TIME_MESSAGES[status], None
+    return time_message(value, clock, written_seconds(candidate)), value
+
+def validate_time(candidate):
+    """Returns a descriptive validation string."""
+    s = candidate.strip()
+    m = compiled_clock_pattern().fullmatch(s)
+    if m is not None:
+        return clock_message(*m.groups())
+    m = compiled_time_scanner().fullmatch(s)
+    return groups_message(m.groups()) if m is not None else TIME_MESSAGES['format']
+
+# Deduplicate while preserving order
+def extract_times(text, dedup=None):
+    return unique((m.group() for m in compiled_time_scanner().finditer(text)), dedup)
+
+def first_matches(text, dedup=None):
+    """Yields the time_scanner match of the first occurrence of each time in text."""
+    first_seen = (ExactDedup() if dedup is None else dedup).first_seen
+    for m in compiled_time_scanner().finditer(text):
+        if first_seen(m.group()):
+            yield m
+
+def time_results(text, dedup=None):
+    """
+    [(candidate, message, value)] for the first occurrence of each time in text,
+    validated from the scanner's groups: the same as validate_time() on each of
+    extract_times(), in one pass.
+    """
+    results = []
+    append = results.append
+    for m in first_matches(text, dedup):
+        candidate = m.group()
+        status, value, clock = match_time(m)
+        if value is None:
+            append((candidate, TIME_MESSAGES[status], None))
+        else:
+            append((candidate, time_message(value, clock, written_seconds(candidate)), value))
+    return results
+
+def time_messages(text, dedup=None):
+    """
+    [(candidate, message)] for the first occurrence of each time in text: time_results()
+    without building the values.
+    """
+    return [(m.group(), groups_message(m.groups())) for m in first_matches(text, dedup)]
+
+def main(argv=None):
+    # Validated from the scanner's groups: each time is parsed once, as it is found
+    return run_results("Time Validation Results:", time_messages, argv)
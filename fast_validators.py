@@ -0,0 +1,114 @@
+from all_validations import VALIDATORS
+from extractors.credit_cards import card_result, validate_credit_card
+from extractors.phones import phone_message, split_phone_digits, validate_phone
+from phone_plans import DEFAULT_PLANS
+
+##REGEX-FREE FAST PATH FOR CARDS AND PHONES
+# Drop-in replacements for validate_credit_card and validate_phone that return the
+# same messages without running any regex:
+# - the input is encoded to ASCII bytes and separators are removed with
+#   bytes.translate instead of re.sub
+# - the issuer comes from a prefix table built once at import instead of the
+#   startswith/int() chain in detect_issuer
+# - a phone number's calling code is found with the numbering plans' trie walk
+#   (split_phone_digits) and its parentheses are checked by walking the characters
+# Inputs with non-ASCII characters (Unicode digits or whitespace) are rare and are
+# handed to the regex validators so every result stays identical.
+
+# ASCII characters \s matches, plus '-'
+CARD_SEPARATORS = bytes(i for i in range(128) if chr(i).isspace()) + b'-'
+
+# Every ASCII character except 0-9
+ASCII_NON_DIGITS = bytes(i for i in range(128) if not chr(i).isdigit())
+
+# Characters [\s.-] matches in ASCII text
+PHONE_SEPARATORS = frozenset(chr(i) for i in range(128) if chr(i).isspace()) | {'.', '-'}
+
+# Issuer prefix ranges, same rules as detect_issuer:
+# (first prefix, last prefix, card lengths, issuer)
+IIN_RANGES = [
+    ('4', '4', (13, 16), 'Visa'),
+    ('34', '34', (15,), 'American Express'),
+    ('37', '37', (15,), 'American Express'),
+    ('51', '55', (16,), 'MasterCard'),
+    ('2221', '2720', (16,), 'MasterCard'),
+    ('6011', '6011', (16,), 'Discover'),
+    ('65', '65', (16,), 'Discover'),
+    ('644', '649', (16,), 'Discover'),
+]
+
+def build_issuer_table(ranges):
+    """Expands prefix ranges into a dict of (card length, first 4 digits as bytes) -> issuer."""
+    table = {}
+    for first, last, lengths, issuer in ranges:
+        width = len(first)
+        fill = 4 - width
+        for prefix in range(int(first), int(last) + 1):
+            for tail in range(10 ** fill):
+                key = f'{prefix:0{width}d}' + (f'{tail:0{fill}d}' if fill else '')
+                for length in lengths:
+                    table.setdefault((length, key.encode('ascii')), issuer)
+    return table
+
+ISSUER_BY_PREFIX = build_issuer_table(IIN_RANGES)
+
+# Luhn value of each digit byte when it sits in a doubled position
+LUHN_DOUBLED = {ord(str(d)): (d * 2 - 9 if d > 4 else d * 2) for d in range(10)}
+
+def passes_luhn_fast(clean_card):
+    # clean_card: ASCII digit bytes
+    total = sum(clean_card[-1::-2]) - 48 * len(clean_card[-1::-2])
+    total += sum(LUHN_DOUBLED[b] for b in clean_card[-2::-2])
+    return total % 10 == 0
+
+def issuer_fast(clean_card):
+    # clean_card: ASCII digit bytes
+    return ISSUER_BY_PREFIX.get((len(clean_card), clean_card[:4]))
+
+def validate_credit_card_fast(card, luhn=False):
+    # Unicode digits or whitespace: let the original validator handle them
+    if not card.isascii():
+        return validate_credit_card(card, luhn)
+    # The card rules are check_credit_card's, run on the bytes
+    clean_card = card.encode('ascii').translate(None, CARD_SEPARATORS)
+    return card_result(card, clean_card, -1, -1, luhn, passes_luhn_fast, issuer_fast).message
+
+def is_parenthesized_phone(number):
+    # Same as fullmatch(r'\(\d{3}\)[\s.-]?\d{3}[\s.-]?\d{4}') for ASCII input
+    if len(number) < 12 or number[0] != '(' or number[4] != ')' or not number[1:4].isdigit():
+        return False
+    rest = number[5:]
+    if rest[:1] in PHONE_SEPARATORS:
+        rest = rest[1:]
+    if len(rest) < 7 or not rest[:3].isdigit():
+        return False
+    rest = rest[3:]
+    if rest[:1] in PHONE_SEPARATORS:
+        rest = rest[1:]
+    return len(rest) == 4 and rest.isdigit()
+
+def is_intl_parenthesized_phone(number):
+    # Same as fullmatch(r'\+\d{1,3}[\s.-]?\(\d{1,4}\)[^()]*') for ASCII input
+    open_at, close_at = number.find('('), number.find(')')
+    if number[:1] != '+' or not 0 < open_at < close_at:
+        return False
+    code = number[1:open_at]
+    if code[-1:] in PHONE_SEPARATORS:
+        code = code[:-1]
+    if not (1 <= len(code) <= 3 and code.isdigit()):
+        return False
+    if not (1 <= close_at - open_at - 1 <= 4 and number[open_at + 1:close_at].isdigit()):
+        return False
+    rest = number[close_at + 1:]
+    return '(' not in rest and ')' not in rest
+
+PARENTHESES_CHECKS = (is_parenthesized_phone, is_intl_parenthesized_phone)
+
+def validate_phone_fast(number):
+    # Unicode digits or whitespace: let the original validator handle them
+    if not number.isascii():
+        return validate_phone(number)
+    digits = number.encode('ascii').translate(None, ASCII_NON_DIGITS).decode('ascii')
+    return phone_message(*split_phone_digits(number, digits, DEFAULT_PLANS, PARENTHESES_CHECKS))[0]
+
+FAST_VALIDATORS = dict(VALIDATORS, credit_card=validate_credit_card_fast, phone=validate_phone_fast)
@@ -0,0 +1,157 @@
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import sys
+
+from all_validations import new_seen, scan, unique_candidates, VALIDATORS
+from mmap_scan import combined_bytes_pattern
+
+##INCREMENTAL EXTRACTION
+# For append-only logs: each run scans only the bytes appended since the previous run
+# and reports only their matches. Where the previous run stopped is kept in a small
+# JSON checkpoint next to the input (or wherever state_path points):
+#   offset     - bytes already scanned; always just after a newline
+#   inode/size - the file's identity and size at that point
+#   tail_hash  - SHA-256 of the TAIL_BYTES bytes before offset
+#   resume     - extractor name -> byte offset it may match from (see all_validations.scan)
+#
+# The file is memory-mapped and the scan starts at offset, so the regexes still see
+# the bytes before it (lookbehind, \b) and a run costs time for the appended bytes only.
+# Only complete lines are scanned: a trailing line without its newline yet is left for
+# the next run, so a token being written as the run happens is never cut in two.
+# A match can still run past the last newline into that unfinished line (a phone
+# number broken across lines, say). It is held back: not reported, its extractor's
+# resume offset left as it was, and the checkpoint offset put at the start of its
+# line, so the next run scans that line again once the text after it is final.
+#
+# The file is scanned again from byte 0 when it is not the one the checkpoint saw:
+#   rotated   - different inode (the log was renamed away and a new one created)
+#   truncated - smaller than the checkpoint offset
+#   rewritten - the bytes before offset changed (copy-truncate, then regrown past it)
+# Bytes appended to a rotated file after the last run are not read.
+TAIL_BYTES = 4096
+CHECKPOINT_SUFFIX = '.checkpoint'
+
+def default_state_path(file_path):
+    return file_path + CHECKPOINT_SUFFIX
+
+def load_checkpoint(state_path):
+    """Returns the saved checkpoint dict, or None if there is none yet."""
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def save_checkpoint(state_path, checkpoint):
+    # Write then rename, so a crash mid-write leaves the previous checkpoint intact
+    tmp_path = state_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, state_path)
+
+def tail_hash(data, offset):
+    return hashlib.sha256(data[max(offset - TAIL_BYTES, 0):offset]).hexdigest()
+
+def start_state(checkpoint, inode, data):
+    """
+    Returns (offset, resume, status) for a run over data (the file's current bytes):
+    where to start scanning, the extractors' resume offsets, and why. status is 'new',
+    'appended', 'rotated', 'truncated' or 'rewritten'.
+    """
+    if checkpoint is None:
+        return 0, {}, 'new'
+    offset = checkpoint['offset']
+    if checkpoint['inode'] != inode:
+        return 0, {}, 'rotated'
+    if len(data) < offset:
+        return 0, {}, 'truncated'
+    if tail_hash(data, offset) != checkpoint['tail_hash']:
+        return 0, {}, 'rewritten'
+    return offset, checkpoint['resume'], 'appended'
+
+def complete_lines_end(data, offset):
+    """Offset just after the last newline in data at or after offset (offset if none)."""
+    return max(data.rfind(b'\n', offset) + 1, offset)
+
+def appended_matches(file_path, state_path=None):
+    """
+    Scans the bytes appended to file_path since the checkpoint in state_path
+    (default: file_path + '.checkpoint') and saves the new checkpoint.
+    Returns (matches, status, start, stop): matches are (name, start, end, candidate) as
+    from all_validations.scan(), for the complete lines [start, stop), with byte offsets
+    into the file; status is as for start_state().
+    """
+    if state_path is None:
+        state_path = default_state_path(file_path)
+    checkpoint = load_checkpoint(state_path)
+    with open(file_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        # mmap can't map an empty file
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if st.st_size else contextlib.nullcontext(b'')
+        with mapping as data:
+            start, resume, status = start_state(checkpoint, st.st_ino, data)
+            stop = complete_lines_end(data, start)
+            matches, resume, offset = complete_matches(data, start, stop, resume)
+            save_checkpoint(state_path, {
+                'path': os.path.abspath(file_path),
+                'inode': st.st_ino,
+                'size': st.st_size,
+                'offset': offset,
+                'tail_hash': tail_hash(data, offset),
+                'resume': resume,
+            })
+    return matches, status, start, stop
+
+def complete_matches(data, start, stop, resume):
+    """
+    Returns (matches, resume, offset): the scan() matches in [start, stop) that end by
+    stop, the updated resume offsets, and where the next run should start: stop, or the
+    start of the line of the first match held back for running past stop.
+    """
+    matches = []
+    new_resume = dict(resume)
+    held = {}   # extractor name -> start of its first match that runs past stop
+    for name, match_start, match_end, candidate in scan(data, start, stop, dict(resume), combined_bytes_pattern):
+        if name in held:
+            # Later matches of this extractor depend on where the held one ends
+            continue
+        if match_end > stop:
+            held[name] = match_start
+            continue
+        new_resume[name] = match_end
+        matches.append((name, match_start, match_end, candidate.decode('utf-8')))
+    if not held:
+        return matches, new_resume, stop
+    offset = data.rfind(b'\n', start, min(held.values())) + 1 or start
+    return matches, new_resume, offset
+
+def extract_appended(file_path, state_path=None, make_dedup=None):
+    """
+    Like appended_matches(), but returns (records, status, start, stop) with records
+    (entity type, candidate, result, start, end) for the first occurrence of each
+    candidate in the appended bytes.
+    make_dedup: dedup object factory (dedup.py) to bound memory on high-cardinality appends
+    """
+    matches, status, start, stop = appended_matches(file_path, state_path)
+    records = [
+        (kind, candidate, VALIDATORS[kind](candidate), match_start, match_end)
+        for kind, match_start, match_end, candidate in unique_candidates(matches, new_seen(make_dedup))
+    ]
+    return records, status, start, stop
+
+
+if __name__ == "__main__":
+    # Usage: python incremental.py [path] [state file]
+    file_path = sys.argv[1] if len(sys.argv) > 1 else r"api_response.txt"
+    state_path = sys.argv[2] if len(sys.argv) > 2 else None
+    try:
+        records, status, start, stop = extract_appended(file_path, state_path)
+    except FileNotFoundError:
+        print(f"Error: File not found at {file_path}")
+        raise SystemExit(1)
+    print(f"Scanned bytes {start}-{stop} ({status})")
+    for kind, candidate, result, start, end in records:
+        print(f"[{kind}] {start}-{end} {candidate}: {result}")
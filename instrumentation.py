@@ -0,0 +1,207 @@
+import argparse
+import cProfile
+import io
+import json
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+from all_validations import validate_all, write_sections
+from extractors.cli import DEFAULT_INPUT
+
+##INSTRUMENTATION
+# Opt-in timing and counters for the extraction pipeline. Pass a Stats object as
+# `stats` to all_validations.extract_all() / validate_all() and it records:
+#   - wall time per stage: read, scan, dedup, validate, output (read and output only
+#     when the run goes through main() below)
+#   - per entity type: raw scanner matches, unique candidates, valid / invalid counts
+#     and validation time (scanning is one pass, so its time is not split by type)
+#   - bytes scanned
+# Without a Stats object the pipeline only pays a few `is None` checks per call.
+# See benchmarks/instrumentation.py.
+STAGES = ['read', 'scan', 'dedup', 'validate', 'output']
+
+class Stats:
+    def __init__(self):
+        self.stage_seconds = {}
+        self.stage_calls = {}
+        self.bytes_scanned = 0
+        self.matches = {}
+        self.entities = {}
+        self.memory = None
+
+    @contextmanager
+    def stage(self, name):
+        """Adds the wall time of the with-block to stage `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + time.perf_counter() - start
+            self.stage_calls[name] = self.stage_calls.get(name, 0) + 1
+
+    def entity(self, kind):
+        counts = self.entities.get(kind)
+        if counts is None:
+            counts = self.entities[kind] = {'candidates': 0, 'valid': 0, 'invalid': 0, 'validate_seconds': 0.0}
+        return counts
+
+    def add_text(self, text):
+        # str.isascii() is O(1), so only non-ASCII text is encoded to count its bytes
+        if isinstance(text, str) and not text.isascii():
+            self.bytes_scanned += len(text.encode('utf-8'))
+        else:
+            self.bytes_scanned += len(text)
+
+    def add_matches(self, found):
+        """found: extractor name -> list of raw scanner matches."""
+        for name, matches in found.items():
+            self.matches[name] = self.matches.get(name, 0) + len(matches)
+
+    def add_candidates(self, candidates):
+        """candidates: entity type -> list of unique candidates."""
+        for kind, values in candidates.items():
+            self.entity(kind)['candidates'] += len(values)
+
+    def add_results(self, kind, results, seconds):
+        """results: list of (candidate, message) pairs validated in `seconds`."""
+        counts = self.entity(kind)
+        valid = sum(1 for _, message in results if message.startswith('Valid'))
+        counts['valid'] += valid
+        counts['invalid'] += len(results) - valid
+        counts['validate_seconds'] += seconds
+
+    def as_dict(self):
+        stages = {
+            name: {'seconds': self.stage_seconds[name], 'calls': self.stage_calls[name]}
+            for name in STAGES + sorted(set(self.stage_seconds) - set(STAGES))
+            if name in self.stage_seconds
+        }
+        return {
+            'stages': stages,
+            'bytes_scanned': self.bytes_scanned,
+            'matches': dict(self.matches),
+            'entities': {kind: dict(counts) for kind, counts in self.entities.items()},
+            'memory': self.memory,
+        }
+
+    def to_json(self):
+        return json.dumps(self.as_dict(), indent=2)
+
+    def to_prometheus(self, prefix='extraction'):
+        """Prometheus text exposition format; every value is a counter except peak memory."""
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in samples:
+                label_text = ','.join(f'{key}="{val}"' for key, val in labels.items())
+                lines.append(f"{prefix}_{name}{{{label_text}}} {value}" if labels else f"{prefix}_{name} {value}")
+
+        data = self.as_dict()
+        metric('stage_seconds_total', 'counter', "Wall time spent in each pipeline stage.",
+               [({'stage': name}, s['seconds']) for name, s in data['stages'].items()])
+        metric('stage_calls_total', 'counter', "Times each pipeline stage ran.",
+               [({'stage': name}, s['calls']) for name, s in data['stages'].items()])
+        metric('bytes_scanned_total', 'counter', "Bytes of text scanned.", [({}, self.bytes_scanned)])
+        metric('matches_total', 'counter', "Raw scanner matches per extractor.",
+               [({'extractor': name}, count) for name, count in data['matches'].items()])
+        for field, help_text in [('candidates', "Unique candidates per entity type."),
+                                 ('valid', "Valid candidates per entity type."),
+                                 ('invalid', "Invalid candidates per entity type."),
+                                 ('validate_seconds', "Validation wall time per entity type.")]:
+            metric(f'{field}_total', 'counter', help_text,
+                   [({'entity': kind}, counts[field]) for kind, counts in data['entities'].items()])
+        if self.memory is not None:
+            metric('peak_traced_memory_bytes', 'gauge', "Peak memory traced by tracemalloc.",
+                   [({}, self.memory['peak_bytes'])])
+        return '\n'.join(lines) + '\n'
+
+##PROFILING WRAPPERS
+@contextmanager
+def profiled(output=None, sort='cumulative', limit=25):
+    """
+    Runs the with-block under cProfile. Writes the raw profile to `output` (for
+    snakeviz / pstats) when given, else prints the top `limit` functions to stderr.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if output:
+            profiler.dump_stats(output)
+        else:
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats(sort).print_stats(limit)
+            print(report.getvalue(), file=sys.stderr)
+
+@contextmanager
+def traced_memory(stats, limit=10):
+    """
+    Runs the with-block under tracemalloc and stores the peak and the `limit`
+    largest allocation sites in stats.memory. tracemalloc slows Python allocations
+    down several times, so the stage timings of a traced run are not representative.
+    """
+    tracemalloc.start()
+    try:
+        yield
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    stats.memory = {
+        'peak_bytes': peak,
+        'current_bytes': current,
+        'top': [{'site': str(stat.traceback), 'bytes': stat.size, 'blocks': stat.count}
+                for stat in snapshot.statistics('lineno')[:limit]],
+    }
+
+def run(file_path, stats, out=None):
+    """all_validations.main() with every stage timed into stats. Returns an exit status."""
+    with stats.stage('read'):
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except FileNotFoundError:
+            print(f"Error: File not found at {file_path}")
+            return 1
+    results = validate_all(text, stats)
+    with stats.stage('output'):
+        write_sections(results, out)
+    return 0
+
+def main(argv=None):
+    # Usage: python instrumentation.py [path] [--format json|prometheus] [--stats-file FILE]
+    #                                  [--profile [FILE]] [--tracemalloc] [--quiet]
+    parser = argparse.ArgumentParser(description="Run all extractors and report per-stage statistics.")
+    parser.add_argument('path', nargs='?', default=DEFAULT_INPUT)
+    parser.add_argument('--format', choices=['json', 'prometheus'], default='json')
+    parser.add_argument('--stats-file', help="write the statistics here instead of stderr")
+    parser.add_argument('--profile', nargs='?', const='', metavar='FILE',
+                        help="run under cProfile; dump to FILE, or print the top functions to stderr")
+    parser.add_argument('--tracemalloc', action='store_true', help="record peak memory and top allocation sites")
+    parser.add_argument('--quiet', action='store_true', help="don't print the results (the output stage still runs)")
+    args = parser.parse_args(argv)
+
+    stats = Stats()
+    out = io.StringIO() if args.quiet else sys.stdout
+    with profiled(args.profile or None) if args.profile is not None else nullcontext():
+        with traced_memory(stats) if args.tracemalloc else nullcontext():
+            status = run(args.path, stats, out)
+
+    report = stats.to_prometheus() if args.format == 'prometheus' else stats.to_json() + '\n'
+    if args.stats_file:
+        with open(args.stats_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+    else:
+        sys.stderr.write(report)
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
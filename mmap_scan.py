@@ -0,0 +1,63 @@
+import contextlib
+import mmap
+import os
+import re
+import sys
+
+from all_validations import combined_source, new_seen, scan, unique_candidates, VALIDATORS
+
+##MEMORY-MAPPED EXTRACTION
+# Maps the input file and runs a bytes-compiled copy of the combined extractor pattern
+# directly over the mapping, so the file is never decoded to str or copied into memory.
+# Only the matched candidates are decoded before validation.
+#
+# The pattern is the UTF-8 encoding of all_validations.combined_source: '£' and '€'
+# become their byte sequences (b'\xc2\xa3', b'\xe2\x82\xac') inside the currency
+# alternation. In bytes mode \w, \d and \b are ASCII-only, so letters outside ASCII
+# count as non-word characters; on ASCII text the matches are identical to str mode.
+combined_bytes_pattern = re.compile(combined_source.encode('utf-8'))
+
+@contextlib.contextmanager
+def mapped_file(file_path):
+    """Maps the file read-only; an empty file gives b'' (mmap can't map one)."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+def mmap_matches(file_path):
+    """
+    Yields (name, start, end, candidate) for every extractor match in the file,
+    with start/end as byte offsets and candidate as bytes.
+    """
+    with mapped_file(file_path) as mm:
+        yield from scan(mm, pattern=combined_bytes_pattern)
+
+def mmap_results(file_path, make_dedup=None, scorer=None):
+    """
+    Yields (entity type, candidate, result, start, end) for the first occurrence of each
+    candidate, with the same filters and deduplication as all_validations.extract_all().
+    start/end are byte offsets into the file.
+    make_dedup: dedup object factory (dedup.py) to bound memory on high-cardinality files
+    scorer: optional context_scoring.ContextScorer, scoring on the mapped bytes (its
+    windows count bytes, not characters)
+    """
+    with mapped_file(file_path) as mm:
+        decoded = (
+            (name, start, end, candidate.decode('utf-8'))
+            for name, start, end, candidate in scan(mm, pattern=combined_bytes_pattern)
+        )
+        for kind, start, end, candidate in unique_candidates(decoded, new_seen(make_dedup), scorer, mm):
+            yield kind, candidate, VALIDATORS[kind](candidate), start, end
+
+
+if __name__ == "__main__":
+    file_path = sys.argv[1] if len(sys.argv) > 1 else r"api_response.txt"
+    try:
+        for kind, candidate, result, start, end in mmap_results(file_path):
+            print(f"[{kind}] {start}-{end} {candidate}: {result}")
+    except FileNotFoundError:
+        print(f"Error: File not found at {file_path}")
+        raise SystemExit(1)
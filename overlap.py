@@ -0,0 +1,91 @@
+from bisect import bisect_left
+
+from all_validations import scan, unique_candidates, VALIDATORS, is_email_like
+
+##OVERLAP RESOLUTION
+# The extractors run independently, so they claim the same characters: a phone number
+# inside a card number, "example.com" inside "user@example.com", "USD19.99" as both
+# a currency amount and an email-like string. This stage keeps at most one match per
+# span. When matches overlap, the higher-priority extractor wins, then the longer match,
+# then the earlier one.
+#
+# Matches arrive sorted by start (scan() order) and are cut into clusters of
+# transitively overlapping spans in one sweep. Inside a cluster, candidates are taken
+# in priority order and accepted when they don't overlap an already accepted span;
+# the overlap test is a prefix-max Fenwick tree over the cluster's start offsets,
+# so the whole stage is O(n log n) in the number of matches.
+PRIORITY = {
+    'email_at': 6,
+    'credit_card': 5,
+    'currency': 4,
+    'phone': 3,
+    'time': 2,
+    'email_no_at': 1,
+}
+
+class SpanIndex:
+    """
+    Disjoint accepted spans, indexed by position in a sorted list of possible starts.
+    overlaps(start, end) is True when an accepted span intersects [start, end).
+    """
+    def __init__(self, starts):
+        self.starts = starts
+        self.tree = [0] * (len(starts) + 1)
+
+    def add(self, start, end):
+        i = bisect_left(self.starts, start) + 1
+        while i < len(self.tree):
+            if self.tree[i] < end:
+                self.tree[i] = end
+            i += i & -i
+
+    def overlaps(self, start, end):
+        # Largest end among accepted spans that start before `end`
+        i = bisect_left(self.starts, end)
+        max_end = 0
+        while i > 0:
+            if self.tree[i] > max_end:
+                max_end = self.tree[i]
+            i -= i & -i
+        return max_end > start
+
+def resolve_cluster(cluster):
+    ranked = sorted(cluster, key=lambda m: (-PRIORITY[m[0]], m[1] - m[2], m[1]))
+    index = SpanIndex(sorted({m[1] for m in cluster}))
+    kept = []
+    for match in ranked:
+        name, start, end, candidate = match
+        if not index.overlaps(start, end):
+            index.add(start, end)
+            kept.append(match)
+    kept.sort(key=lambda m: m[1])
+    return kept
+
+def resolve_overlaps(matches):
+    """
+    Takes (name, start, end, candidate) tuples sorted by start and yields the
+    non-overlapping winners, also sorted by start. Works on a stream: each cluster
+    is resolved and yielded as soon as the next match starts past its end.
+    """
+    cluster = []
+    cluster_end = -1
+    for match in matches:
+        if cluster and match[1] >= cluster_end:
+            yield from (cluster if len(cluster) == 1 else resolve_cluster(cluster))
+            cluster = []
+        cluster_end = max(cluster_end, match[2]) if cluster else match[2]
+        cluster.append(match)
+    if cluster:
+        yield from (cluster if len(cluster) == 1 else resolve_cluster(cluster))
+
+def resolved_matches(text):
+    """scan() matches with email-like filtering applied first, then overlaps resolved."""
+    matches = (m for m in scan(text) if m[0] != 'email_no_at' or is_email_like(m[3]))
+    return resolve_overlaps(matches)
+
+def validate_resolved(text):
+    """Like all_validations.validate_all(), but every character belongs to at most one entity."""
+    found = {kind: [] for kind in VALIDATORS}
+    for kind, start, end, candidate in unique_candidates(resolved_matches(text)):
+        found[kind].append((candidate, VALIDATORS[kind](candidate)))
+    return found
@@ -0,0 +1,45 @@
+import re
+
+##PRECOMPILED PATTERNS
+# Every regex the validators run on each candidate, compiled once per process.
+# Calling re.fullmatch/re.search/re.sub with a pattern string goes through re's
+# internal cache on every call, and that cache is flushed once more than a few
+# hundred distinct patterns have been used in the process.
+#
+# Patterns are compiled on first access (`from patterns import non_digit_re` compiles
+# only that one), so a worker that only validates phone numbers never pays for the
+# email or card regexes.
+
+# Currency markers are matched through currency_table.CurrencyTable.
+
+# name -> (pattern, flags)
+PATTERN_SOURCES = {
+    # Email
+    'email_username_re': (r'[\w\.-]+', 0),
+    'email_domain_part_re': (r'[\w-]+', 0),
+    'email_tld_re': (r'[a-zA-Z]{2,}', 0),
+    # All of the above in one: the address is valid iff this fullmatches
+    'valid_email_re': (r'[\w.-]+@(?:[\w-]+\.)+[a-zA-Z]{2,}', 0),
+    'numeric_dotted_re': (r'[\d\.]+', 0),
+    'letter_re': (r'[a-zA-Z]', 0),
+
+    # Credit card: spaces and dashes between digit groups
+    'card_separator_re': (r'[\s-]', 0),
+
+    # Phone
+    'non_digit_re': (r'\D', 0),
+    'phone_parentheses_re': (r'\(\d{3}\)[\s.-]?\d{3}[\s.-]?\d{4}', 0),
+    # International: one parenthesized group, right after the calling code
+    'phone_intl_parentheses_re': (r'\+\d{1,3}[\s.-]?\(\d{1,4}\)[^()]*', 0),
+}
+
+def __getattr__(name):
+    try:
+        pattern, flags = PATTERN_SOURCES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    compiled = globals()[name] = re.compile(pattern, flags)
+    return compiled
+
+def __dir__():
+    return sorted(set(globals()) | set(PATTERN_SOURCES))
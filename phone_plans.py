@@ -0,0 +1,167 @@
+import functools
+
+##PHONE NUMBERING PLANS
+# Country calling codes and how many digits follow them, parsed once from PLAN_DATA.
+# The codes are kept in a trie (one dict level per digit), so finding the code at the
+# start of an international number reads at most three digits, and E.164 codes being
+# prefix-free, the first code reached is the only possible one.
+#
+# Each plan gives the lengths of the national significant number (the digits after the
+# country code, without the trunk prefix) and the trunk prefix dialled before it inside
+# the country (0 in most of the world, 1 in NANP), which E.164 drops:
+#   +254 712 345 678, 0712 345 678 -> +254712345678
+#
+# Numbers without '+' are read in the plan of `national_code` (NANP by default): 10
+# digits, or 11 with the leading 1.
+#
+# A plan may also fix the first digits of the national significant number, written
+# in NANP notation: N is a digit 2-9, X any digit. NANP area codes and exchanges
+# can't start with 0 or 1 (NXX NXX XXXX), so 123-456-7890 is not a valid number.
+
+# code, region, national significant number lengths (n or min-max), trunk prefix (- for none),
+# leading digits (N = 2-9, X = any; - for no rule)
+PLAN_DATA = """
+1    NANP  10    1     NXXNXX
+7    RU    10    8     -
+20   EG    8-10  0     -
+27   ZA    9     0     -
+33   FR    9     0     -
+34   ES    9     -     -
+44   GB    9-10  0     -
+49   DE    6-13  0     -
+61   AU    9     0     -
+81   JP    9-10  0     -
+86   CN    10-11 0     -
+91   IN    10    0     -
+211  SS    9     0     -
+233  GH    9     0     -
+234  NG    8-10  0     -
+243  CD    9     0     -
+250  RW    9     0     -
+251  ET    9     0     -
+252  SO    7-9   0     -
+253  DJ    8     -     -
+254  KE    9     0     -
+255  TZ    9     0     -
+256  UG    9     0     -
+257  BI    8     -     -
+260  ZM    9     0     -
+263  ZW    9     0     -
+971  AE    8-9   0     -
+"""
+
+# Numbers without a '+': the original NANP-shaped pattern, 3-3-4 digits with an
+# optional area code in parentheses and an optional leading code
+NATIONAL_PATTERN = r'\b(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}\b'
+
+# Between two digits of an international number: a separator, or a parenthesis with
+# an optional separator on its outer side
+DIGIT_SEPARATOR = r'(?:[\s.-]?\(|\)[\s.-]?|[\s.-])?'
+
+class PhonePlan:
+    __slots__ = ('code', 'region', 'lengths', 'trunk', 'leading', 'restricted')
+
+    def __init__(self, code, region, lengths, trunk=None, leading=''):
+        self.code = code
+        self.region = region
+        self.lengths = tuple(lengths)
+        self.trunk = trunk
+        self.leading = leading
+        # Positions of the N digits, checked per number
+        self.restricted = tuple(i for i, digit in enumerate(leading) if digit == 'N')
+
+    def leading_ok(self, nsn):
+        """Whether the digit string nsn starts as the plan's leading digits allow."""
+        for i in self.restricted:
+            if nsn[i] < '2':
+                return False
+        return True
+
+    def length_rule(self):
+        """'exactly 10' or '9-10', for messages."""
+        low, high = min(self.lengths), max(self.lengths)
+        return f"exactly {low}" if low == high else f"{low}-{high}"
+
+    def __repr__(self):
+        return f"PhonePlan({self.code!r}, {self.region!r}, {self.lengths!r}, {self.trunk!r}, {self.leading!r})"
+
+def parse_plan_data(data):
+    """PLAN_DATA text -> list of PhonePlan."""
+    plans = []
+    for line in data.strip().splitlines():
+        code, region, lengths, trunk, leading = line.split()
+        low, _, high = lengths.partition('-')
+        plans.append(PhonePlan(code, region, range(int(low), int(high or low) + 1),
+                               None if trunk == '-' else trunk, '' if leading == '-' else leading))
+    return plans
+
+def digit_trie_pattern(codes):
+    """Regex source matching any of the digit strings codes, factored into a trie."""
+    trie = {}
+    for code in codes:
+        node = trie
+        for digit in code:
+            node = node.setdefault(digit, {})
+    return trie_node_pattern(trie)
+
+def trie_node_pattern(node):
+    leaves = ''.join(d for d, child in sorted(node.items()) if not child)
+    branches = [d + trie_node_pattern(child) for d, child in sorted(node.items()) if child]
+    if leaves:
+        branches.append(leaves if len(leaves) == 1 else f'[{leaves}]')
+    return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+
+class PhonePlans:
+    """
+    plans: PhonePlan list (default: PLAN_DATA)
+    national_code: calling code whose plan applies to numbers written without '+'
+    """
+    def __init__(self, plans=None, national_code='1'):
+        if plans is None:
+            plans = parse_plan_data(PLAN_DATA)
+        self.plans = {plan.code: plan for plan in plans}
+        self.trie = {}
+        for code, plan in sorted(self.plans.items()):
+            node = self.trie
+            for digit in code:
+                node = node.setdefault(digit, {})
+                if '' in node:
+                    raise ValueError(f"calling code {node[''].code} is a prefix of {code}")
+            if len(node) > 0:
+                raise ValueError(f"calling code {code} is a prefix of another code")
+            node[''] = plan
+        self.national = self.plans[national_code]
+        self.max_code_length = max(map(len, self.plans))
+
+    def split_code(self, digits):
+        """(plan, remaining digits) for the calling code digits start with, or (None, digits)."""
+        node = self.trie
+        for i in range(min(len(digits), self.max_code_length)):
+            node = node.get(digits[i])
+            if node is None:
+                break
+            plan = node.get('')
+            if plan is not None:
+                return plan, digits[i + 1:]
+        return None, digits
+
+    @functools.cached_property
+    def international_pattern(self):
+        """'+', a known calling code, then as many digits as its plan allows."""
+        # Codes sharing a tail (same lengths and trunk) go in one trie
+        by_tail = {}
+        for plan in self.plans.values():
+            low, high = min(plan.lengths), max(plan.lengths)
+            trunk = r'(?:[\s.-]?\(' + plan.trunk + r'\))?' if plan.trunk else ''
+            tail = f'{trunk}{DIGIT_SEPARATOR}\\d(?:{DIGIT_SEPARATOR}\\d){{{low - 1},{high - 1}}}(?!\\d)'
+            by_tail.setdefault(tail, []).append(plan.code)
+        return r'(?<![\w+])\+(?:' + '|'.join(
+            digit_trie_pattern(codes) + tail for tail, codes in by_tail.items()
+        ) + ')'
+
+    @functools.cached_property
+    def candidate_pattern(self):
+        """Extractor pattern: an international number, else a NANP-shaped national one."""
+        return self.international_pattern + '|' + NATIONAL_PATTERN
+
+DEFAULT_PLANS = PhonePlans()
@@ -0,0 +1,169 @@
+from decimal import Context, Decimal, MAX_PREC
+from enum import IntEnum
+
+##RESULT RECORDS
+# The compact record every check_* function returns (see results.py): entity type,
+# raw candidate, offsets, an ErrorCode and the normalized value. The validate_*
+# message is only rendered when Result.message (or str()) is asked for, and the
+# email and card validators are that message of their check_* record. The time and
+# amount renderers are imported where they are used, so that importing the email or
+# card validator doesn't load the currency table or the time scanner.
+
+class ErrorCode(IntEnum):
+    OK = 0
+    # Email
+    EMAIL_AT_COUNT = 1
+    EMAIL_USERNAME = 2
+    EMAIL_DOMAIN_DOT = 3
+    EMAIL_DOMAIN_PART = 4
+    EMAIL_TLD = 5
+    # Time
+    TIME_FORMAT = 10
+    TIME_MINUTE = 11
+    TIME_HOUR_12 = 12
+    TIME_HOUR_24 = 13
+    TIME_SECOND = 14
+    TIME_DATE = 15
+    # Credit card
+    CARD_NON_DIGIT = 20
+    CARD_LENGTH = 21
+    CARD_REPEATED = 22
+    CARD_LUHN = 23
+    # Currency
+    CURRENCY_MARKER = 30
+    CURRENCY_DECIMALS = 31
+    CURRENCY_NON_DIGIT = 32
+    CURRENCY_COMMAS = 33
+    CURRENCY_NO_DECIMALS = 35
+    # Phone
+    PHONE_DIGIT_COUNT = 40
+    PHONE_PARENTHESES = 41
+    PHONE_COUNTRY_CODE = 42
+    PHONE_LEADING_DIGITS = 43
+
+# The codes as module names too (from records import OK), like re.IGNORECASE:
+# ErrorCode.OK is an attribute lookup on the enum class, several times slower than
+# a global, and the checks build a record per candidate
+globals().update(ErrorCode.__members__)
+
+# Messages for each error; {detail} is filled from Result.detail
+ERROR_MESSAGES = {
+    ErrorCode.EMAIL_AT_COUNT: "Invalid: Missing or multiple @ symbols",
+    ErrorCode.EMAIL_USERNAME: "Invalid: Username contains illegal characters or spaces",
+    ErrorCode.EMAIL_DOMAIN_DOT: "Invalid: Domain missing '.'",
+    ErrorCode.EMAIL_DOMAIN_PART: "Invalid: Domain name part '{detail}' contains illegal characters",
+    ErrorCode.EMAIL_TLD: "Invalid: Top-level domain '{detail}' is invalid",
+    ErrorCode.TIME_FORMAT: "Invalid: Doesn't match H:MM or H:MM AM/PM pattern",
+    ErrorCode.TIME_MINUTE: "Invalid: Minute out of range (0-59)",
+    ErrorCode.TIME_HOUR_12: "Invalid: Hour out of range for 12-hour format (1-12)",
+    ErrorCode.TIME_HOUR_24: "Invalid: Hour out of range for 24-hour format (0-23)",
+    ErrorCode.TIME_SECOND: "Invalid: Second out of range (0-59)",
+    ErrorCode.TIME_DATE: "Invalid: Date out of range",
+    ErrorCode.CARD_NON_DIGIT: "Invalid: Contains nondigit characters",
+    ErrorCode.CARD_LENGTH: "Invalid: Must be 13–16 digits long",
+    ErrorCode.CARD_REPEATED: "Invalid: Repeated digit sequence (unlikely to be real card)",
+    ErrorCode.CARD_LUHN: "Invalid: Fails Luhn checksum",
+    ErrorCode.CURRENCY_MARKER: "Invalid: Missing currency marker",
+    ErrorCode.CURRENCY_DECIMALS: "Invalid: Decimal part must have exactly {detail} digits",
+    ErrorCode.CURRENCY_NON_DIGIT: "Invalid: Contains non-digit characters in integer part",
+    ErrorCode.CURRENCY_COMMAS: "Invalid: Incorrect comma placement in thousands",
+    ErrorCode.CURRENCY_NO_DECIMALS: "Invalid: Currency has no decimal part",
+    ErrorCode.PHONE_DIGIT_COUNT: "Invalid: Must have {detail} digits (excluding country code)",
+    ErrorCode.PHONE_PARENTHESES: "Invalid: Area code parentheses incorrect",
+    ErrorCode.PHONE_COUNTRY_CODE: "Invalid: Unknown country calling code",
+    ErrorCode.PHONE_LEADING_DIGITS: "Invalid: First digits must fit {detail} (N is 2-9, X any digit)",
+}
+
+def render_message(entity_type, error, value=None, detail=None, raw=''):
+    """
+    Result.message without building the Result, for validators that only return the
+    message (value, detail and raw as in Result; times need raw to keep seconds that
+    were written as :00).
+    """
+    if error:
+        message = ERROR_MESSAGES[error]
+        return message if detail is None else message.format(detail=detail)
+    if entity_type == 'email':
+        return "Valid email"
+    if entity_type == 'phone':
+        return f"Valid phone number (E.164: {value})"
+    if entity_type == 'currency':
+        return "Valid currency amount"
+    if entity_type == 'credit_card':
+        return f"Valid credit card number (Issuer: {value or 'Unknown but plausible'})"
+    from extractors.times import time_message, written_seconds
+    return time_message(value, detail, written_seconds(raw))
+
+class Result:
+    """
+    One validated candidate.
+    value holds the normalized form for valid results and detail qualifies it:
+      email       -> value None
+      phone       -> value the E.164 form ('+254712345678'), detail the plan's region
+      credit_card -> value issuer name or None
+      time        -> value datetime.time, a (start, end) pair of them for a range, or
+                     datetime.datetime for ISO 8601; detail 12 or 24 (the clock it
+                     was written in)
+      currency    -> value Decimal amount, detail ISO currency code (see AmountResult)
+    For EMAIL_DOMAIN_PART / EMAIL_TLD errors detail is the offending part, for
+    PHONE_DIGIT_COUNT the allowed lengths ('exactly 9', '9-10'), for
+    PHONE_LEADING_DIGITS the plan's leading digits ('NXXNXX'), for CURRENCY_DECIMALS
+    the currency's minor units (2, 3, 4); other errors have no detail.
+    """
+    __slots__ = ('entity_type', 'raw', 'start', 'end', 'error', 'value', 'detail')
+
+    def __init__(self, entity_type, raw, error, value=None, detail=None, start=-1, end=-1):
+        self.entity_type = entity_type
+        self.raw = raw
+        self.start = start
+        self.end = end
+        self.error = error
+        self.value = value
+        self.detail = detail
+
+    @property
+    def valid(self):
+        return self.error == OK
+
+    @property
+    def message(self):
+        """The string the matching validate_* function returns for this candidate."""
+        return render_message(self.entity_type, self.error, self.value, self.detail, self.raw)
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return (f"Result({self.entity_type!r}, {self.raw!r}, {self.error.name}, "
+                f"value={self.value!r}, detail={self.detail!r}, start={self.start}, end={self.end})")
+
+# Decimal.scaleb rounds to the context's precision; amounts must come back exact
+EXACT = Context(prec=MAX_PREC)
+
+class AmountResult(Result):
+    """
+    A valid currency Result. The amount is held as an integer number of minor units
+    ($1,234.56 -> 123456, 1.500 RWF -> 1500), which is a quarter of the size of a
+    Decimal and cheaper to build; value builds the Decimal when asked.
+    """
+    __slots__ = ()
+
+    # Result's value slot, holding the integer amount
+    amount_minor = Result.value
+
+    def __init__(self, raw, amount_minor, code, start=-1, end=-1):
+        self.entity_type = 'currency'
+        self.raw = raw
+        self.start = start
+        self.end = end
+        self.error = OK
+        self.amount_minor = amount_minor
+        self.detail = code
+
+    @property
+    def value(self):
+        from currency_table import minor_units
+        return Decimal(self.amount_minor).scaleb(-minor_units(self.detail), EXACT)
+
+    def __reduce__(self):
+        return AmountResult, (self.raw, self.amount_minor, self.detail, self.start, self.end)
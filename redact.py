@@ -0,0 +1,308 @@
+import argparse
+import hashlib
+import os
+import re
+import sys
+
+from all_validations import run_re, run_start
+from extractors.credit_cards import cc_pattern
+from extractors.emails import email_with_at_pattern
+from patterns import card_separator_re
+from phone_plans import DEFAULT_PLANS
+from results import check_credit_card, check_email, check_phone
+
+##REDACTION
+# Writes a copy of the input with emails, card numbers and phone numbers masked, in
+# one pass over fixed-size chunks, so memory stays around chunk_size + overlap
+# whatever the size of the input.
+#
+# The matches are those of redact_pattern, which tries the email (with '@'), card and
+# phone patterns in that order at each position; the first that matches wins and the
+# scan continues after it, so a phone number inside a card number is masked as part
+# of the card. Running that regex at every position is slow (about 2 MB/s), so
+# find_matches() gets the same matches from two cheaper searches:
+#   - emails from each '@' (str.find), matched from the start of its [\w.-] run
+#   - cards and phones only inside "digit zones", runs of digits and separators with
+#     at least MIN_DIGITS digits, which a regex starting with a character class finds
+#     without trying the full patterns at every position
+# and merges them leftmost-first. Each match is checked
+# with the structured validators (results.py) and, when valid, replaced by its
+# kind's policy:
+#   full   - every letter and digit becomes '*':       **** **** **** ****
+#   last4  - all but the last 4 letters/digits masked: ***-***-7890
+#   issuer - a token naming who issued it: card network, country calling code,
+#            mail domain:                              [card:Visa] [phone:+254] [email:@example.com]
+#   hash   - a token with a keyed BLAKE2b digest of the normalized value (card digits,
+#            E.164 number, lowercased email), so the same value always gets the same
+#            token for a given salt:                   [card#3f9a0c...]
+# Candidates that fail validation still get the full mask (there is no normalized
+# value to keep): a number that breaks a plan's rule or a checksum is still someone's
+# number. mask_invalid=False (--keep-invalid) leaves them as they are.
+#
+# Only matches starting more than `overlap` characters before the end of the buffer
+# are rewritten, the rest is carried over to the next chunk. When the buffer ends
+# inside a run an email can span (see all_validations.run_start), the cut moves back
+# to the start of that run, so an email longer than the overlap is carried over whole
+# and masked as redact_text() masks it. Files are read and written with newline='' and
+# surrogateescape, so everything outside the masked spans is copied byte for byte.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_OVERLAP = 4096
+
+# Characters kept in front of the carried-over text for the patterns' lookbehinds
+LOOKBEHIND_CONTEXT = 16
+
+MASK = '*'
+HASH_BYTES = 8
+
+# National numbers as in phone_plans.NATIONAL_PATTERN, which starts with \b and so
+# never matches "(123) 456-7890" after a space; here a number may also start at its '('
+REDACT_NATIONAL_PATTERN = r'(?:\b|(?<![\w)])(?=\())(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}\b'
+
+REDACT_PATTERNS = [
+    ('email', email_with_at_pattern),
+    ('credit_card', cc_pattern),
+    ('phone', DEFAULT_PLANS.international_pattern + '|' + REDACT_NATIONAL_PATTERN),
+]
+
+def named_alternation(patterns):
+    return re.compile('|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in patterns))
+
+redact_pattern = named_alternation(REDACT_PATTERNS)
+email_re = named_alternation(REDACT_PATTERNS[:1])
+number_re = named_alternation(REDACT_PATTERNS[1:])
+
+# Fewest digits in a card or phone match: an international number with the shortest
+# calling code + national number total (+49 and 6 digits)
+MIN_DIGITS = min(len(code) + min(plan.lengths) for code, plan in DEFAULT_PLANS.plans.items())
+# Every card or phone match lies inside one of these (its characters are digits,
+# [\s.-], parentheses and '+'), and starts with a digit, '(' or '+'
+digit_zone_re = re.compile(r'[\d(+][\s().+-]*+(?:\d[\s().+-]*+){%d,}' % (MIN_DIGITS - 1))
+
+def next_email(buf, pos):
+    """Leftmost email_re match starting at or after pos, or None."""
+    at = buf.find('@', pos)
+    while at != -1:
+        # An email starts where the [\w.-] run in front of its '@' starts (\w is
+        # alnum or '_'); runs starting before pos are the previous match's
+        start = at
+        while start > 0 and (buf[start - 1].isalnum() or buf[start - 1] in '_.-'):
+            start -= 1
+        if start >= pos:
+            m = email_re.match(buf, start)
+            if m:
+                return m
+        at = buf.find('@', at + 1)
+    return None
+
+def next_number(buf, pos):
+    """Leftmost number_re match starting at or after pos, or None."""
+    while True:
+        zone = digit_zone_re.search(buf, pos)
+        if zone is None:
+            return None
+        # One character past the zone for the patterns' trailing \b and (?!\d)
+        m = number_re.search(buf, max(pos, zone.start()), zone.end() + 1)
+        if m:
+            return m
+        pos = zone.end()
+
+def find_matches(buf, pos=0):
+    """Yields the matches of redact_pattern.finditer(buf, pos), from two cheaper searches."""
+    email = next_email(buf, pos)
+    number = next_number(buf, pos)
+    while email or number:
+        if number is None or (email is not None and email.start() <= number.start()):
+            m = email
+        else:
+            m = number
+        yield m
+        pos = m.end()
+        if email is not None and email.start() < pos:
+            email = next_email(buf, pos)
+        if number is not None and number.start() < pos:
+            number = next_number(buf, pos)
+
+CHECKS = {
+    'email': check_email,
+    'credit_card': check_credit_card,
+    'phone': check_phone,
+}
+
+POLICIES = ['full', 'last4', 'issuer', 'hash']
+
+DEFAULT_POLICIES = {
+    'email': 'full',
+    'credit_card': 'last4',
+    'phone': 'last4',
+}
+
+# Letters and digits, the characters a mask replaces
+alnum_re = re.compile(r'[^\W_]')
+
+def mask_all(raw):
+    return alnum_re.sub(MASK, raw)
+
+def mask_keep_last(raw, keep=4):
+    """Masks every letter and digit except the last `keep` of them."""
+    positions = [m.start() for m in alnum_re.finditer(raw)]
+    if len(positions) <= keep:
+        return raw
+    cut = positions[-keep]
+    return alnum_re.sub(MASK, raw[:cut]) + raw[cut:]
+
+def normalized(result):
+    """The value hashed for a valid result: card digits, E.164 number or lowercased email."""
+    if result.entity_type == 'credit_card':
+        return card_separator_re.sub('', result.raw)
+    if result.entity_type == 'phone':
+        return result.value
+    return result.raw.lower()
+
+def issuer_token(result):
+    if result.entity_type == 'credit_card':
+        return f"[card:{result.value or 'unknown'}]"
+    if result.entity_type == 'phone':
+        plan, _ = DEFAULT_PLANS.split_code(result.value[1:])
+        return f"[phone:+{plan.code}]"
+    return f"[email:@{result.raw.rpartition('@')[2]}]"
+
+TOKEN_KINDS = {'email': 'email', 'credit_card': 'card', 'phone': 'phone'}
+
+class Redactor:
+    """
+    policies: entity type -> policy name, for the types to override (see DEFAULT_POLICIES)
+    salt: key for the hash policy; default a random one per Redactor, so tokens are
+    only consistent within one run
+    mask_invalid: also mask candidates that fail validation (full mask); False leaves
+    them as they are
+    """
+    def __init__(self, policies=None, salt=None, mask_invalid=True):
+        self.policies = dict(DEFAULT_POLICIES, **(policies or {}))
+        for kind, policy in self.policies.items():
+            if kind not in CHECKS:
+                raise ValueError(f"unknown entity type {kind!r}")
+            if policy not in POLICIES:
+                raise ValueError(f"unknown policy {policy!r}")
+        if isinstance(salt, str):
+            salt = salt.encode('utf-8')
+        self.salt = salt if salt is not None else os.urandom(16)
+        if len(self.salt) > 64:
+            raise ValueError("salt must be at most 64 bytes")
+        self.mask_invalid = mask_invalid
+        self.counts = dict.fromkeys(CHECKS, 0)
+
+    def hash_token(self, result):
+        digest = hashlib.blake2b(normalized(result).encode('utf-8'), digest_size=HASH_BYTES, key=self.salt)
+        return f"[{TOKEN_KINDS[result.entity_type]}#{digest.hexdigest()}]"
+
+    def replacement(self, kind, raw):
+        """Masked form of one match, or raw when it is left alone."""
+        result = CHECKS[kind](raw)
+        if not result.valid:
+            if not self.mask_invalid:
+                return raw
+            self.counts[kind] += 1
+            return mask_all(raw)
+        self.counts[kind] += 1
+        policy = self.policies[kind]
+        if policy == 'full':
+            return mask_all(raw)
+        if policy == 'last4':
+            return mask_keep_last(raw)
+        if policy == 'issuer':
+            return issuer_token(result)
+        return self.hash_token(result)
+
+    def rewrite(self, buf, pos, stop=None):
+        """
+        Returns (masked buf[pos:end], end) for the matches starting before stop;
+        end is where the next call should resume (len(buf) when stop is None).
+        """
+        pieces = []
+        last = pos
+        for m in find_matches(buf, pos):
+            start = m.start()
+            if stop is not None and start >= stop:
+                break
+            pieces.append(buf[last:start])
+            pieces.append(self.replacement(m.lastgroup, m.group()))
+            last = m.end()
+        end = len(buf) if stop is None else max(stop, last)
+        pieces.append(buf[last:end])
+        return ''.join(pieces), end
+
+    def redact_text(self, text):
+        return self.rewrite(text, 0)[0]
+
+    def redact_chunks(self, chunks, overlap=DEFAULT_OVERLAP):
+        """Yields the masked text for an iterable of text chunks, as it becomes final."""
+        buf = ''
+        pos = 0
+        for chunk in chunks:
+            buf += chunk
+            stop = len(buf) - overlap
+            # The buffer ends inside a run that starts before stop: wait for the run to end
+            if stop > pos and run_re.fullmatch(buf, stop):
+                stop = run_start(buf, stop)
+            if stop <= pos:
+                continue
+            out, end = self.rewrite(buf, pos, stop)
+            yield out
+            keep = max(end - LOOKBEHIND_CONTEXT, 0)
+            buf = buf[keep:]
+            pos = end - keep
+        yield self.rewrite(buf, pos)[0]
+
+    def redact_file(self, source, target, chunk_size=DEFAULT_CHUNK_SIZE, overlap=DEFAULT_OVERLAP):
+        """Reads text stream source in chunks and writes the masked copy to text stream target."""
+        chunks = iter(lambda: source.read(chunk_size), '')
+        for out in self.redact_chunks(chunks, overlap):
+            target.write(out)
+
+def parse_policies(values):
+    """['last4', 'email=hash'] -> {'email': 'hash', 'credit_card': 'last4', 'phone': 'last4'}"""
+    policies = {}
+    for value in values or []:
+        kind, _, policy = value.rpartition('=')
+        if kind:
+            policies[kind] = policy
+        else:
+            policies.update(dict.fromkeys(CHECKS, policy))
+    return policies
+
+def open_text(path, mode):
+    if path in (None, '-'):
+        stream = sys.stdin if mode == 'r' else sys.stdout
+        return open(stream.fileno(), mode, encoding='utf-8', errors='surrogateescape', newline='', closefd=False)
+    return open(path, mode, encoding='utf-8', errors='surrogateescape', newline='')
+
+def main(argv=None):
+    # Usage: python redact.py [--policy POLICY | --policy TYPE=POLICY ...] [--salt S] [--output FILE] [file ...]
+    parser = argparse.ArgumentParser(description="Write a copy of the input with emails, cards and phone numbers masked.")
+    parser.add_argument('paths', nargs='*', default=['-'], help="input files (default stdin)")
+    parser.add_argument('--output', help="output file (default stdout)")
+    parser.add_argument('--policy', action='append', metavar='[TYPE=]POLICY',
+                        help=f"{', '.join(POLICIES)}; for all types or one of {', '.join(CHECKS)} (repeatable)")
+    parser.add_argument('--salt', help="key for the hash policy (default random per run)")
+    parser.add_argument('--keep-invalid', action='store_true',
+                        help="leave candidates that fail validation unmasked")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    try:
+        redactor = Redactor(parse_policies(args.policy), args.salt, not args.keep_invalid)
+    except ValueError as e:
+        parser.error(str(e))
+    with open_text(args.output, 'w') as target:
+        for path in args.paths:
+            try:
+                with open_text(path, 'r') as source:
+                    redactor.redact_file(source, target, args.chunk_size)
+            except FileNotFoundError:
+                print(f"Error: File not found at {path}", file=sys.stderr)
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,70 @@
+from all_validations import new_seen, scan, unique_candidates
+from extractors.credit_cards import check_credit_card
+from extractors.currencies import check_currency
+from extractors.emails import check_email
+from extractors.phones import check_phone
+from extractors.times import (
+    clock_value, compiled_clock_pattern, compiled_time_scanner, groups_time, TIME_STATUS_CODES
+)
+from records import ErrorCode, Result, OK, TIME_FORMAT
+
+##STRUCTURED RESULTS
+# One check_* function per entity type, each returning a compact Result record
+# (records.py): entity type, raw candidate, offsets, an ErrorCode and the normalized
+# value. The validate_* functions return the message of that record, rendered from
+# records.ERROR_MESSAGES only when Result.message (or str()) is asked for. The email,
+# card, currency and phone checks live with their validators; check_time is here, as
+# the time validators work from the scanner's groups instead.
+
+def check_time(candidate, start=-1, end=-1):
+    s = candidate.strip()
+    # A lone clock time first, as in validate_time()
+    m = compiled_clock_pattern().fullmatch(s)
+    if m is not None:
+        hour, minute, second, ampm = m.groups()
+        status, value = clock_value(hour, minute, second, ampm)
+        if value is None:
+            return Result('time', candidate, TIME_STATUS_CODES[status], None, None, start, end)
+        return Result('time', candidate, OK, value, 12 if ampm else 24, start, end)
+    m = compiled_time_scanner().fullmatch(s)
+    if not m:
+        return Result('time', candidate, TIME_FORMAT, None, None, start, end)
+    return time_result(candidate, m.groups(), start, end)
+
+def time_result(candidate, groups, start=-1, end=-1):
+    """check_time() for a time the scanner has already matched, from its groups (see scan()'s times)."""
+    status, value, clock = groups_time(groups)
+    if value is None:
+        return Result('time', candidate, TIME_STATUS_CODES[status], None, None, start, end)
+    return Result('time', candidate, OK, value, clock, start, end)
+
+CHECKS = {
+    'email': check_email,
+    'time': check_time,
+    'credit_card': check_credit_card,
+    'currency': check_currency,
+    'phone': check_phone,
+}
+
+def extract_results(text, make_dedup=None, scorer=None):
+    """
+    Yields a Result for the first occurrence of each candidate in text, in text order.
+    make_dedup: dedup object factory (dedup.py) to bound memory on high-cardinality text
+    scorer: optional context_scoring.ContextScorer (see all_validations.unique_candidates())
+    """
+    times = {}
+    matches = unique_candidates(scan(text, times=times), new_seen(make_dedup), scorer, text)
+    for kind, start, end, candidate in matches:
+        yield scanned_result(kind, candidate, start, end, times)
+
+def scanned_result(kind, candidate, start, end, times):
+    """
+    CHECKS[kind](candidate, start, end) for a candidate from scan(text, times=times);
+    a time is built from its captured groups. times is emptied after each time: the
+    records are built as the scan goes, so it only needs to hold the current one.
+    """
+    if kind != 'time':
+        return CHECKS[kind](candidate, start, end)
+    result = time_result(candidate, times[candidate], start, end)
+    times.clear()
+    return result
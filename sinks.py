@@ -0,0 +1,292 @@
+import argparse
+import array
+import json
+import sys
+from itertools import islice
+from json.encoder import encode_basestring
+
+from all_validations import SECTION_TITLES, VALIDATORS, byte_offsets, new_seen, scan, unique_candidates
+from context_scoring import ContextScorer
+from results import CHECKS, ErrorCode, scanned_result
+
+##OUTPUT SINKS
+# Writers for validated results that batch records into few large writes instead of
+# one print() per candidate. Every sink takes write(source, results) with Result
+# records (results.py) whose start/end are byte offsets into the source, and
+# close() (or a with-block) to flush.
+#
+#   TextSink     - the exact output of all_validations.py, one block per source
+#   JsonlSink    - one JSON object per line
+#   CsvSink      - header row, then one row per record
+#   ColumnarSink - binary file of array-backed columns, read back with read_columnar()
+#
+# Text-based sinks join BATCH_RECORDS lines per write() on the underlying stream; the
+# JSONL and CSV sinks format each batch of records in one list comprehension.
+BATCH_RECORDS = 8192
+
+FIELDS = ['source', 'type', 'start', 'end', 'candidate', 'valid', 'error', 'message']
+TYPES = list(CHECKS)
+TYPE_IDS = {kind: i for i, kind in enumerate(TYPES)}
+
+def file_results(text, make_dedup=None, scorer=None):
+    """
+    Yields a Result for the first occurrence of each candidate in text, like
+    results.extract_results(), but with start/end as UTF-8 byte offsets.
+    make_dedup: dedup object factory (dedup.py) to bound memory on high-cardinality text
+    scorer: optional context_scoring.ContextScorer (see all_validations.unique_candidates())
+    """
+    times = {}
+    matches = unique_candidates(scan(text, times=times), new_seen(make_dedup), scorer, text)
+    for kind, start, end, candidate in byte_offsets(text, matches):
+        yield scanned_result(kind, candidate, start, end, times)
+
+def batches(results):
+    """Lists of up to BATCH_RECORDS records from the iterable results."""
+    results = iter(results)
+    while True:
+        batch = list(islice(results, BATCH_RECORDS))
+        if not batch:
+            return
+        yield batch
+
+class LineSink:
+    """
+    Base for the text-based sinks: collects lines and writes them in batches.
+    close_stream: also close the stream on close() (for files the sink opened)
+    """
+    def __init__(self, stream, close_stream=False):
+        self.stream = stream
+        self.close_stream = close_stream
+        self.lines = []
+
+    def add(self, line):
+        self.lines.append(line)
+        if len(self.lines) >= BATCH_RECORDS:
+            self.flush()
+
+    def add_lines(self, lines):
+        self.lines += lines
+        if len(self.lines) >= BATCH_RECORDS:
+            self.flush()
+
+    def flush(self):
+        if self.lines:
+            self.stream.write(''.join(self.lines))
+            self.lines = []
+
+    def close(self):
+        self.flush()
+        if self.close_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class TextSink(LineSink):
+    """
+    Reproduces all_validations.py: a section per entity type, "candidate: message" lines.
+    Emails found with '@' are listed before those without, as extract_all() does
+    (the two kinds never overlap, so a stable partition restores its order).
+    """
+    def write(self, source, results):
+        sections = {kind: [] for kind in VALIDATORS}
+        for r in results:
+            sections[r.entity_type].append(r)
+        emails = sections['email']
+        sections['email'] = [r for r in emails if '@' in r.raw] + [r for r in emails if '@' not in r.raw]
+        for kind, records in sections.items():
+            self.add(SECTION_TITLES[kind] + '\n')
+            for r in records:
+                self.add(f"{r.raw}: {r.message}\n")
+
+# ErrorCode.name is a property lookup on every access, so the fixed part each error
+# code gives a line is built once
+JSON_ERRORS = {code: f'"valid": {"true" if code == ErrorCode.OK else "false"}, "error": "{code.name}"'
+               for code in ErrorCode}
+CSV_ERRORS = {code: f'{int(code == ErrorCode.OK)},{code.name}' for code in ErrorCode}
+
+# json.dumps() builds an encoder per call; strings are the only fields that need
+# escaping, so lines are assembled around the C string encoder JSONEncoder uses
+# with ensure_ascii=False
+encode_json = encode_basestring
+
+class JsonlSink(LineSink):
+    def write(self, source, results):
+        prefix = '{"source": ' + encode_json(source) + ', "type": "'
+        for batch in batches(results):
+            self.add_lines([
+                f'{prefix}{r.entity_type}", "start": {r.start}, "end": {r.end}, '
+                f'"candidate": {encode_json(r.raw)}, {JSON_ERRORS[r.error]}, '
+                f'"message": {encode_json(r.message)}}}\n'
+                for r in batch
+            ])
+
+def needs_quotes(value):
+    return ',' in value or '"' in value or '\n' in value or '\r' in value
+
+def csv_field(value):
+    """value as the csv module writes it with QUOTE_MINIMAL: quoted only when it has to be."""
+    if needs_quotes(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+class CsvSink(LineSink):
+    """
+    Header row, then one row per record, as csv.writer(lineterminator='\n') writes
+    them; rows are formatted directly, only the candidate and message can need quotes.
+    """
+    def __init__(self, stream, close_stream=False):
+        super().__init__(stream, close_stream)
+        self.add(','.join(FIELDS) + '\n')
+
+    def write(self, source, results):
+        prefix = csv_field(source) + ','
+        for batch in batches(results):
+            messages = [r.message for r in batch]
+            # Messages almost never need quotes: one check over the whole batch
+            if needs_quotes(' '.join(messages)):
+                messages = [csv_field(message) for message in messages]
+            self.add_lines([
+                f'{prefix}{r.entity_type},{r.start},{r.end},{csv_field(r.raw)},{CSV_ERRORS[r.error]},{message}\n'
+                for r, message in zip(batch, messages)
+            ])
+
+##COLUMNAR FORMAT
+# One file holding each column as a packed little-endian array:
+#   MAGIC, 8-byte header length, JSON header, then the column bytes in header order.
+# The header lists the row count, the entity type and source name tables, and each
+# column's name, array typecode and byte length. Candidates are stored as UTF-8 in
+# one blob plus an offsets column (row i is blob[offsets[i]:offsets[i + 1]]).
+# Columns are kept in memory until close(): about 30 bytes per record plus the text.
+COLUMNAR_MAGIC = b'RXCOLS1\n'
+COLUMNS = [
+    ('source', 'I'),
+    ('type', 'B'),
+    ('start', 'q'),
+    ('end', 'q'),
+    ('valid', 'B'),
+    ('error', 'H'),
+    ('candidate_offsets', 'Q'),
+]
+
+class ColumnarSink:
+    def __init__(self, path):
+        self.path = path
+        self.columns = {name: array.array(code) for name, code in COLUMNS}
+        self.columns['candidate_offsets'].append(0)
+        self.blob = bytearray()
+        self.sources = []
+        self.source_ids = {}
+
+    def write(self, source, results):
+        source_id = self.source_ids.get(source)
+        if source_id is None:
+            source_id = self.source_ids[source] = len(self.sources)
+            self.sources.append(source)
+        c = self.columns
+        for r in results:
+            c['source'].append(source_id)
+            c['type'].append(TYPE_IDS[r.entity_type])
+            c['start'].append(r.start)
+            c['end'].append(r.end)
+            c['valid'].append(r.error == ErrorCode.OK)
+            c['error'].append(r.error)
+            self.blob += r.raw.encode('utf-8')
+            c['candidate_offsets'].append(len(self.blob))
+
+    def close(self):
+        columns = []
+        for name, code in COLUMNS:
+            data = self.columns[name]
+            if sys.byteorder == 'big':
+                data = array.array(code, data)
+                data.byteswap()
+            columns.append((name, code, data.tobytes()))
+        columns.append(('candidate', 'B', bytes(self.blob)))
+        header = json.dumps({
+            'rows': len(self.columns['type']),
+            'types': TYPES,
+            'sources': self.sources,
+            'columns': [{'name': name, 'typecode': code, 'bytes': len(data)} for name, code, data in columns],
+        }).encode('utf-8')
+        with open(self.path, 'wb') as f:
+            f.write(COLUMNAR_MAGIC)
+            f.write(len(header).to_bytes(8, 'little'))
+            f.write(header)
+            for _, _, data in columns:
+                f.write(data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_columnar(path):
+    """
+    Loads a ColumnarSink file. Returns (header, columns): columns maps each name to
+    an array.array, except 'candidate', a list of str.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"{path} is not a columnar results file")
+        header = json.loads(f.read(int.from_bytes(f.read(8), 'little')))
+        columns = {}
+        for column in header['columns']:
+            data = array.array(column['typecode'])
+            data.frombytes(f.read(column['bytes']))
+            if sys.byteorder == 'big':
+                data.byteswap()
+            columns[column['name']] = data
+    blob, offsets = columns.pop('candidate').tobytes(), columns['candidate_offsets']
+    columns['candidate'] = [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(header['rows'])]
+    return header, columns
+
+SINKS = {
+    'text': TextSink,
+    'jsonl': JsonlSink,
+    'csv': CsvSink,
+}
+
+def open_sink(fmt, output=None):
+    """Returns a sink writing fmt to the file `output` (stdout when None; required for columnar)."""
+    if fmt == 'columnar':
+        if not output:
+            raise ValueError("the columnar format needs an output file")
+        return ColumnarSink(output)
+    if output:
+        # newline='': every sink writes '\n' itself, which must not become '\r\n' on Windows
+        return SINKS[fmt](open(output, 'w', encoding='utf-8', newline=''), close_stream=True)
+    return SINKS[fmt](sys.stdout)
+
+def main(argv=None):
+    # Usage: python sinks.py [--format text|jsonl|csv|columnar] [--output FILE] [--min-score N] [file ...]
+    parser = argparse.ArgumentParser(description="Extract and validate files into a structured output format.")
+    parser.add_argument('paths', nargs='*', default=['api_response.txt'])
+    parser.add_argument('--format', choices=list(SINKS) + ['columnar'], default='text')
+    parser.add_argument('--output', help="output file (default stdout)")
+    parser.add_argument('--min-score', type=int, metavar='N',
+                        help="drop candidates whose context score is below N (context_scoring.py)")
+    args = parser.parse_args(argv)
+
+    scorer = None if args.min_score is None else ContextScorer(threshold=args.min_score)
+
+    with open_sink(args.format, args.output) as sink:
+        for path in args.paths:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+            except FileNotFoundError:
+                print(f"Error: File not found at {path}", file=sys.stderr)
+                return 1
+            sink.write(path, file_results(text, scorer=scorer))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
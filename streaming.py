@@ -0,0 +1,106 @@
+import sys
+
+from all_validations import new_seen, run_re, run_start, scan, unique_candidates, VALIDATORS
+
+##STREAMING EXTRACTION
+# Reads the input in fixed-size chunks instead of file.read(), so peak memory stays
+# around chunk_size + overlap no matter how large the file is.
+#
+# Boundary handling: each chunk is appended to the unscanned tail of the previous one,
+# and only matches starting more than `overlap` characters before the end of the buffer
+# are reported. The rest is carried over and scanned again once more text has arrived,
+# so a card or email split across two reads is still found exactly once.
+# A run that an email or amount could still be growing over is carried over whole,
+# however long (see all_validations.run_start), so the matches are the same as a
+# whole-file scan's.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_OVERLAP = 4096
+
+# Characters kept in front of the carried-over text so \b and the currency code
+# lookbehind see the same context they would in the whole file
+LOOKBEHIND_CONTEXT = 16
+
+class ChunkScanner:
+    """
+    Incremental form of stream_matches() for text that arrives in pieces:
+    feed() returns the matches that can no longer change, close() the remaining ones.
+    Offsets are character offsets from the start of the stream.
+    scorer: optional context_scoring.ContextScorer; matches it scores below its
+    threshold are dropped (the buffer keeps its window before the next match)
+    """
+    def __init__(self, overlap=DEFAULT_OVERLAP, scorer=None):
+        self.overlap = overlap
+        self.scorer = scorer
+        self.context = LOOKBEHIND_CONTEXT if scorer is None else max(LOOKBEHIND_CONTEXT, scorer.before)
+        self.buf = ''
+        self.base = 0       # stream offset of buf[0]
+        self.pos = 0        # where scanning resumes inside buf
+        self.resume = {}    # extractor name -> stream offset it may match from
+
+    def feed(self, chunk):
+        self.buf += chunk
+        stop = len(self.buf) - self.overlap
+        # The buffer ends inside a run that starts before stop: wait for the run to end
+        if stop > self.pos and run_re.fullmatch(self.buf, stop):
+            stop = run_start(self.buf, stop)
+        return self.scan(stop)
+
+    def close(self):
+        return self.scan(None)
+
+    def scan(self, stop):
+        if stop is not None and stop <= self.pos:
+            return []
+        base = self.base
+        local_resume = {name: offset - base for name, offset in self.resume.items()}
+        local_matches = scan(self.buf, self.pos, stop, local_resume)
+        if self.scorer is not None:
+            local_matches = self.scorer.keep(self.buf, local_matches)
+        matches = [(name, base + start, base + end, candidate) for name, start, end, candidate in local_matches]
+        self.resume = {name: base + offset for name, offset in local_resume.items()}
+
+        if stop is not None:
+            keep = max(stop - self.context, 0)
+            self.buf = self.buf[keep:]
+            self.base += keep
+            self.pos = stop - keep
+        return matches
+
+def stream_matches(file_path, chunk_size=DEFAULT_CHUNK_SIZE, overlap=DEFAULT_OVERLAP, scorer=None):
+    """
+    Yields (name, start, end, candidate) for every extractor match in the file, with
+    start/end as character offsets into the whole file. Same matches as
+    all_validations.scan() over the full text.
+    scorer: see ChunkScanner
+    """
+    scanner = ChunkScanner(overlap, scorer)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield from scanner.feed(chunk)
+    yield from scanner.close()
+
+def stream_results(file_path, chunk_size=DEFAULT_CHUNK_SIZE, overlap=DEFAULT_OVERLAP, make_dedup=None,
+                   scorer=None):
+    """
+    Yields (entity type, candidate, result) as soon as each new candidate is found.
+    Applies the same filters and deduplication as all_validations.extract_all(),
+    in file order.
+    make_dedup: dedup object factory (dedup.py) to bound memory on high-cardinality files
+    scorer: see ChunkScanner
+    """
+    matches = stream_matches(file_path, chunk_size, overlap, scorer)
+    for kind, start, end, candidate in unique_candidates(matches, new_seen(make_dedup)):
+        yield kind, candidate, VALIDATORS[kind](candidate)
+
+
+if __name__ == "__main__":
+    file_path = sys.argv[1] if len(sys.argv) > 1 else r"api_response.txt"
+    try:
+        for kind, candidate, result in stream_results(file_path):
+            print(f"[{kind}] {candidate}: {result}")
+    except FileNotFoundError:
+        print(f"Error: File not found at {file_path}")
+        raise SystemExit(1)
@@ -0,0 +1,123 @@
+"""
+Generated inputs shared by the tests and the benchmarks (python -m benchmarks.X):
+the tests check behavior on them, the benchmarks time the same inputs at scale.
+Also the previous time validator, which both compare against.
+"""
+import random
+import re
+
+import all_validations as av
+from extractors.credit_cards import passes_luhn
+
+
+def luhn_complete(prefix, length, rng):
+    body = prefix + ''.join(rng.choice('0123456789') for _ in range(length - len(prefix) - 1))
+    for check in '0123456789':
+        if passes_luhn(body + check):
+            return body + check
+
+
+def make_cards(n, seed=0):
+    """n card numbers: Luhn-valid ones per issuer prefix, random digit runs and edge cases."""
+    rng = random.Random(seed)
+    pool = []
+    for prefix, length in (('4', 16), ('4', 13), ('34', 15), ('37', 15), ('51', 16),
+                           ('2221', 16), ('6011', 16), ('65', 16), ('645', 16), ('9', 16)):
+        pool += [luhn_complete(prefix, length, rng) for _ in range(50)]
+    pool += [''.join(rng.choice('0123456789') for _ in range(rng.randint(11, 18))) for _ in range(300)]
+    pool += ['0000000000000000', '4444444444444', '12345678901234x', '', '1234567890123456789']
+    return [rng.choice(pool) for _ in range(n)]
+
+
+def dense_digits(size, seed):
+    """size characters of digit runs, digit groups, times, amounts and phones packed together."""
+    rng = random.Random(seed)
+    pieces = []
+    total = 0
+    while total < size:
+        piece = rng.choice([
+            ''.join(rng.choice('0123456789') for _ in range(rng.randint(3, 40))),
+            rng.choice(' -.') .join(''.join(rng.choice('0123456789') for _ in range(4)) for _ in range(rng.randint(2, 6))),
+            f'{rng.randint(0, 29)}:{rng.randint(0, 69):02d}',
+            rng.choice(['$', 'USD', '€', '']) + f'{rng.randint(0, 99999):,}.{rng.randint(0, 99):02d}',
+            f'({rng.randint(100, 999)}) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}',
+            'a.b', 'x@y.com', ' ', ' ', '\n',
+        ])
+        pieces.append(piece)
+        total += len(piece)
+    return ''.join(pieces)
+
+
+def digit_chain(size, seed):
+    # One unbroken run of 3- and 4-digit groups: card and phone matches overlap
+    # each other all the way through
+    rng = random.Random(seed)
+    groups = []
+    total = 0
+    while total < size:
+        group = ''.join(rng.choice('0123456789') for _ in range(rng.choice((3, 4, 4))))
+        groups.append(group)
+        total += len(group) + 1
+    return ' '.join(groups)
+
+
+def filtered_matches(text):
+    """scan() matches with the email filter applied, as overlap.resolve_overlaps() takes them."""
+    return [m for m in av.scan(text) if m[0] != 'email_no_at' or av.is_email_like(m[3])]
+
+
+def gen_time(rng):
+    """A clock time in the H:MM or H:MM AM/PM form, valid or out of range."""
+    return rng.choice([
+        f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+        f"{rng.randint(1, 12)}:{rng.randint(0, 59):02d} {rng.choice(['AM', 'PM', 'am', 'pm'])}",
+        f"{rng.randint(24, 99)}:{rng.randint(0, 99):02d}",
+        f"{rng.randint(1, 12)}:{rng.randint(60, 99)} PM",
+    ])
+
+
+def gen_new_time(rng):
+    """Times in the forms the previous pattern missed or cut short."""
+    hh, mm, ss = rng.randint(0, 23), rng.randint(0, 59), rng.randint(0, 59)
+    return rng.choice([
+        f"{hh:02d}:{mm:02d}:{ss:02d}",
+        f"{hh:02d}:{mm:02d}{rng.choice(['-', '–', ' - '])}{rng.randint(0, 23):02d}:{mm:02d}",
+        f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{hh:02d}:{mm:02d}:{ss:02d}Z",
+        f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{hh:02d}:{mm:02d}:{ss:02d}.{rng.randint(0, 999):03d}+02:00",
+    ])
+
+
+LOG_WORDS = "request processed by gateway returned status ok retry later order shipment pending".split()
+
+
+def time_log(lines, new_forms=0.5, seed=0):
+    """Log-like lines, half with a time; new_forms: share of those in the new forms."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(lines):
+        parts = [' '.join(rng.choice(LOG_WORDS) for _ in range(rng.randint(2, 6))),
+                 rng.choice([f"id={rng.getrandbits(48):x}", f"v{rng.randint(0, 9)}.{rng.randint(0, 20)}",
+                             f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                             f"{rng.randint(1, 500)} items"])]
+        if rng.random() < 0.5:
+            parts.insert(1, gen_new_time(rng) if rng.random() < new_forms else gen_time(rng))
+        out.append(' '.join(parts))
+    return '\n'.join(out) + '\n'
+
+
+def old_validate_time(candidate):
+    """The time validator before the single scanner (extractors/times.py)."""
+    s = candidate.strip()
+    m = re.fullmatch(r'(\d{1,2}):(\d{2})(?:\s*([AaPp][Mm]))?', s)
+    if not m:
+        return "Invalid: Doesn't match H:MM or H:MM AM/PM pattern"
+    hour, minute, ampm = int(m.group(1)), int(m.group(2)), m.group(3)
+    if not (0 <= minute <= 59):
+        return "Invalid: Minute out of range (0-59)"
+    if ampm:
+        if not (1 <= hour <= 12):
+            return "Invalid: Hour out of range for 12-hour format (1-12)"
+        return f"Valid 12-hour time (normalized: {hour:02d}:{minute:02d} {ampm.upper()})"
+    if not (0 <= hour <= 23):
+        return "Invalid: Hour out of range for 24-hour format (0-23)"
+    return f"Valid 24-hour time (normalized: {hour:02d}:{minute:02d})"
@@ -0,0 +1,91 @@
+"""asyncio extraction service (async_service.py) against a whole-text scan."""
+import asyncio
+import concurrent.futures
+
+import pytest
+
+import all_validations as av
+from async_service import ExtractionService, latency_summary, replay
+
+SAMPLE = 'api_response.txt'
+
+# Multi-byte characters, so reads and batches split them
+NON_ASCII = "Prix €1.234,56 — écrire à contact@example.fr à 14:30, carte 4111 1111 1111 1111\n"
+
+
+def sample_bytes():
+    with open(SAMPLE, 'rb') as f:
+        return f.read()
+
+
+def reference(data):
+    """The service's records for one response, from one scan of the decoded body."""
+    text = data.decode('utf-8')
+    return [
+        (kind, candidate, av.VALIDATORS[kind](candidate), start, end)
+        for kind, start, end, candidate in av.unique_candidates(av.scan(text))
+    ]
+
+
+def serve(data, responses=1, read_size=7, **options):
+    async def run():
+        async with ExtractionService(**options) as service:
+            futures = [await service.submit(replay(data, read_size=read_size)) for _ in range(responses)]
+            return await asyncio.gather(*futures)
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize('batch_size', [1, 13, 64, 1 << 16])
+def test_records_match_whole_text(batch_size):
+    data = NON_ASCII.encode('utf-8') + sample_bytes() * 3
+    assert serve(data, batch_size=batch_size, overlap=64) == [reference(data)]
+
+
+def test_concurrent_responses_keep_their_own_state():
+    bodies = [sample_bytes(), NON_ASCII.encode('utf-8'), b'', sample_bytes()[::-1]]
+
+    async def run():
+        async with ExtractionService(concurrency=2, queue_size=1, batch_size=16) as service:
+            return await asyncio.gather(*(service.extract(replay(body, read_size=5)) for body in bodies))
+
+    assert asyncio.run(run()) == [reference(body) for body in bodies]
+
+
+def test_stream_reader_source():
+    data = sample_bytes()
+
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        async with ExtractionService(batch_size=100) as service:
+            return await service.extract(reader)
+
+    assert asyncio.run(run()) == reference(data)
+
+
+def test_process_pool_executor():
+    data = sample_bytes()
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        assert serve(data, responses=3, read_size=64, executor=executor, batch_size=128) == [reference(data)] * 3
+
+
+def test_source_errors_reach_the_caller():
+    async def failing():
+        yield b'contact user@example.com '
+        raise ConnectionResetError("peer went away")
+
+    async def run():
+        async with ExtractionService(concurrency=1) as service:
+            with pytest.raises(ConnectionResetError):
+                await service.extract(failing())
+            # The worker carries on with the next response
+            return await service.extract(replay(sample_bytes()))
+
+    assert asyncio.run(run()) == reference(sample_bytes())
+
+
+def test_latency_summary():
+    assert latency_summary([0.5]) == {'p50': 500.0, 'p99': 500.0, 'max': 500.0}
+    summary = latency_summary([i / 1000 for i in range(1, 101)])
+    assert summary['max'] == 100.0 and summary['p50'] == pytest.approx(50.5)
@@ -0,0 +1,27 @@
+"""Byte-range batch extraction (batch.py) against an unsplit mmap scan."""
+import pytest
+
+import batch
+import mmap_scan
+from tests.test_streaming import long_run_text
+
+
+def reference(path):
+    return {str(path): list(mmap_scan.mmap_results(str(path)))}
+
+
+@pytest.mark.parametrize('split_size', [97, 1024, 10**9])
+def test_sample_ranges_match_whole_file(tmp_path, split_size):
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        sample = f.read()
+    path = tmp_path / 'sample.txt'
+    path.write_text(sample * 20, encoding='utf-8')
+    assert batch.run_batch([str(path)], workers=1, split_size=split_size, overlap=256) == reference(path)
+
+
+# Range boundaries inside the 10,000-character run and inside the digit run
+@pytest.mark.parametrize('split_size', [5000, 8000, 11000, 12000, 20000])
+def test_runs_longer_than_the_overlap(tmp_path, split_size):
+    path = tmp_path / 'long_run.txt'
+    path.write_text(long_run_text(), encoding='utf-8')
+    assert batch.run_batch([str(path)], workers=1, split_size=split_size) == reference(path)
@@ -0,0 +1,28 @@
+"""Batch card checks (card_batch.py) against the per-card validate_credit_card loop."""
+import pytest
+
+import card_batch
+from extractors.credit_cards import validate_credit_card
+from tests.inputs import make_cards
+
+
+@pytest.mark.parametrize('luhn', [False, True])
+def test_batch_matches_per_card_loop(luhn):
+    # The NumPy path where numpy is installed, the per-card fallback otherwise
+    cards = make_cards(20_000, seed=1)
+    assert card_batch.validate_cards_batch(cards, luhn) == [validate_credit_card(c, luhn) for c in cards]
+
+
+@pytest.mark.parametrize('luhn', [False, True])
+def test_numpy_path_matches_per_card_loop(luhn):
+    pytest.importorskip('numpy')
+    cards = make_cards(20_000, seed=2)
+    assert card_batch.np is not None
+    assert card_batch.validate_cards_batch(cards, luhn) == [validate_credit_card(c, luhn) for c in cards]
+
+
+def test_default_is_without_luhn():
+    # A bad check digit is only rejected when asked, as in validate_credit_card
+    card = '4111111111111112'
+    assert card_batch.validate_cards_batch([card]) == [validate_credit_card(card)]
+    assert card_batch.validate_cards_batch([card], luhn=True) == ["Invalid: Fails Luhn checksum"]
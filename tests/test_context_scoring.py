@@ -0,0 +1,134 @@
+"""Context scoring (context_scoring.py) against a direct computation of each score."""
+import random
+
+import pytest
+
+import all_validations as av
+import batch
+import context_scoring as cs
+import mmap_scan
+import streaming
+from context_scoring import ContextScorer
+
+SAMPLE = 'api_response.txt'
+
+# Entities after context phrases, and decoys next to negative keywords, digit runs,
+# ids and hostnames
+LINES = [
+    "Please call 212-555-0134 or email support@example.com about the meeting at 2:30 PM",
+    "order id 123-456-7890 ref 555-0100, sha 4111 1111 1111 1111 trace 9:15",
+    "Paid with card 4111 1111 1111 1111, total $1,234.56, refund of €12.00",
+    "version 1.2.3 build 14:30 on host api.example.com, see http www.example.org",
+    "947937 8798-848-3951 77 12 99 81 64 2025 1024 4096 00:15 31 77",
+    "Contact Admin@Example.COM, reply to alice.smith@example.org, PHONE +254 712 345 678",
+    "Deadline 17:30, balance KES 1,500.00, fee USD 3.50 and 12.50 RWF",
+]
+
+
+def sample_text():
+    with open(SAMPLE, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def scored_text():
+    rng = random.Random(0)
+    lines = LINES + sample_text().splitlines()
+    return '\n'.join(rng.choice(lines) for _ in range(400))
+
+
+def reference_score(scorer, text, name, start, end, candidate):
+    """A match's full score: every keyword in its windows and every penalty."""
+    lo, hi = start - scorer.before, end + scorer.after
+    kind = cs.KINDS.get(name, name)
+    words = scorer.keywords.get(kind, {})
+    score = scorer.priors.get(name, 0)
+    # Keywords are far shorter than the 40 characters searched past the window
+    for m in scorer.keyword_re.finditer(text, max(lo, 0), hi + 40):
+        if m.start() < hi and not start <= m.start() < end:
+            score += words.get(m.group().lower(), 0)
+    before, after = text[start - 1:start], text[end:end + 2]
+    if before.isdigit() or (after[:1] in cs.SEPARATORS and after[1:].isdigit()):
+        score -= cs.GLUED_PENALTY
+    if name == 'email_no_at':
+        if before == '@' or after[:1] == '@':
+            score -= cs.EMAIL_PART_PENALTY
+        if not candidate.rpartition('.')[2].isalpha():
+            score -= cs.NUMERIC_SUFFIX_PENALTY
+    around = text[max(lo, 0):start] + text[end:hi]
+    if sum(ch in '0123456789' for ch in around) > cs.DENSE_DIGITS * len(around):
+        score -= cs.DENSE_DIGITS_PENALTY
+    return score
+
+
+@pytest.mark.parametrize('threshold', [-1, 0, 1, 2, 3])
+def test_keeps_match_reference_scores(threshold):
+    text = scored_text()
+    scorer = ContextScorer(threshold=threshold)
+    keeps = scorer.keeper(text)
+    for match in av.scan(text):
+        assert keeps(*match) == (reference_score(scorer, text, *match) >= threshold), match
+
+
+def test_skipping_matches_keeps_the_same_decisions():
+    # unique_candidates() only scores what it has not seen: the keeper must not depend
+    # on having seen every earlier match
+    text = scored_text()
+    scorer = ContextScorer()
+    keeps = scorer.keeper(text)
+    for i, match in enumerate(av.scan(text)):
+        if i % 3 == 0:
+            assert keeps(*match) == (reference_score(scorer, text, *match) >= scorer.threshold), match
+
+
+def test_context_decides():
+    text = '\n'.join(LINES)
+    kept = {(name, candidate) for name, _, _, candidate in ContextScorer().keep(text, av.scan(text))}
+    assert ('phone', '212-555-0134') in kept
+    assert ('email_at', 'support@example.com') in kept
+    assert ('credit_card', '4111 1111 1111 1111') in kept
+    assert ('currency', '$1,234.56') in kept
+    assert ('phone', '123-456-7890') not in kept
+    assert ('email_no_at', 'example.com') not in kept
+    assert ('email_no_at', '1.2.3') not in kept
+    assert ('time', '14:30') not in kept
+
+
+def test_keywords_inside_the_match_do_not_count():
+    scorer = ContextScorer(priors={'time': 0}, keywords={'time': {'pm': 5}})
+    text = "xx 2:30 PM yy"
+    name, start, end, candidate = next(m for m in av.scan(text) if m[0] == 'time')
+    assert not scorer.keeper(text)(name, start, end, candidate)
+    assert scorer.keeper("pm " + text)(name, start + 3, end + 3, candidate)
+
+
+@pytest.mark.parametrize('threshold', [0, 1, 2])
+def test_scored_paths_agree(tmp_path, threshold):
+    text = scored_text()
+    scorer = ContextScorer(threshold=threshold)
+    expected = list(av.unique_candidates(scorer.keep(text, av.scan(text))))
+    assert list(av.unique_candidates(av.scan(text), scorer=scorer, text=text)) == expected
+    found = {name: [] for name in av.ENTITY_NAMES}
+    for name, start, end, candidate in scorer.keep(text, av.scan(text)):
+        found[name].append(candidate)
+    assert av.extract_all(text, scorer=scorer) == av.filter_candidates(found)
+
+    # On bytes the windows count bytes, so the other paths are compared on ASCII text
+    ascii_text = ''.join(line for line in text.splitlines(True) if line.isascii())
+    pairs = [(kind, candidate) for kind, _, _, candidate
+             in av.unique_candidates(av.scan(ascii_text), scorer=scorer, text=ascii_text)]
+    path = tmp_path / 'input.txt'
+    path.write_text(ascii_text, encoding='utf-8')
+    streamed = streaming.stream_results(str(path), chunk_size=512, overlap=128, scorer=scorer)
+    assert [(kind, candidate) for kind, candidate, _ in streamed] == pairs
+    mapped = list(mmap_scan.mmap_results(str(path), scorer=scorer))
+    assert [(kind, candidate) for kind, candidate, *_ in mapped] == pairs
+    assert batch.run_batch([str(path)], workers=1, split_size=2048, scorer=scorer)[str(path)] == mapped
+
+
+def test_scoring_only_removes_candidates():
+    text = scored_text()
+    everything = av.validate_all(text)
+    scored = av.validate_all(text, scorer=ContextScorer())
+    for kind, pairs in scored.items():
+        assert set(pairs) <= set(everything[kind]), kind
+    assert sum(map(len, scored.values())) < sum(map(len, everything.values()))
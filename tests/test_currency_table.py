@@ -0,0 +1,103 @@
+"""Currency marker tables and trie patterns (currency_table.py)."""
+import random
+import re
+
+import pytest
+
+import all_validations as av
+from currency_table import CurrencyTable, DEFAULT_MARKERS, DEFAULT_TABLE, ISO_4217_CODES, LOCAL_SYMBOLS, trie_pattern
+from extractors.currencies import extract_currencies, validate_currency
+
+# Each default marker, in front of the amount and (for codes) after it
+DEFAULT_AMOUNTS = {
+    '$': ['$12.50'],
+    '£': ['£12.50'],
+    '€': ['€12.50', '12,50 €'],
+    'RWF': ['RWF 1,500', '1,500 RWF'],
+    'UGX': ['UGX 1,500', '1,500 UGX'],
+    'USD': ['USD 12.50', '12.50 USD'],
+    'EUR': ['EUR 12.50', '12.50 EUR'],
+    'GBP': ['GBP 12.50', '12.50 GBP'],
+    'KSH': ['KSH 12.50', '12.50 KSH'],
+    'KES': ['KES 12.50', '12.50 KES'],
+}
+
+# Markers the default table doesn't read
+OTHER_AMOUNTS = ['₦500', 'TZS 5,000', 'R$12.00', '₹1,234.56', 'CHF 12.00']
+
+EXTENDED_MARKERS = {**{code: code for code in ISO_4217_CODES}, **LOCAL_SYMBOLS, **DEFAULT_MARKERS}
+
+LINES = [
+    "Paid KSh 1,200 and ₦500 plus R$12.00, refund 100 TZS, fee usd 3.50",
+    "Totals: ₹1,234.56 / 12 CHF / A$20 / TSh 5,000 / 7.50 fRw",
+    "all 5 items, top 3 results, call 555 0100, mop 12 floors",
+]
+
+
+def test_default_markers():
+    assert DEFAULT_TABLE.codes == {marker.upper(): code for marker, code in DEFAULT_MARKERS.items()}
+    assert set(DEFAULT_AMOUNTS) == set(DEFAULT_MARKERS)
+
+
+@pytest.mark.parametrize('marker, amounts', DEFAULT_AMOUNTS.items())
+def test_default_markers_are_found_and_valid(marker, amounts):
+    for amount in amounts:
+        assert extract_currencies(f"total {amount} due") == [amount]
+        assert validate_currency(amount) == "Valid currency amount", amount
+        # Markers are matched in any case by default
+        assert validate_currency(amount.lower()) == "Valid currency amount", amount
+
+
+@pytest.mark.parametrize('amount', OTHER_AMOUNTS)
+def test_other_markers_need_a_larger_table(amount):
+    assert validate_currency(amount) == "Invalid: Missing currency marker"
+    table = CurrencyTable(EXTENDED_MARKERS, ignore_case=False)
+    assert validate_currency(amount, table) == "Valid currency amount"
+
+
+def test_case_sensitive_table():
+    table = CurrencyTable({'KSh': 'KES', 'USD': 'USD'}, ignore_case=False)
+    assert validate_currency('KSh 1,200', table) == "Valid currency amount"
+    assert validate_currency('ksh 1,200', table) == "Invalid: Missing currency marker"
+    assert validate_currency('usd 1.00', table) == "Invalid: Missing currency marker"
+
+
+def test_longest_marker_wins():
+    table = CurrencyTable({'R': 'ZAR', 'R$': 'BRL', 'RF': 'RWF', 'RWF': 'RWF'}, ignore_case=False)
+    marker, rest = table.split_markers('R$12.00')
+    assert (table.code_for(marker), rest) == ('BRL', '12.00')
+    marker, rest = table.split_markers('RWF 500')
+    assert (marker, rest) == ('RWF', ' 500')
+
+
+@pytest.mark.parametrize('marker', ['', 'US D', '1USD'])
+def test_invalid_markers(marker):
+    with pytest.raises(ValueError):
+        CurrencyTable({marker: 'USD'})
+
+
+def test_trie_matches_flat_alternation():
+    words = sorted(EXTENDED_MARKERS)
+    trie = re.compile(trie_pattern(words))
+    flat = re.compile('|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True)))
+    rng = random.Random(0)
+    letters = ''.join(sorted(set(''.join(words))))
+    probes = words + [''.join(rng.choice(letters) for _ in range(rng.randint(1, 4))) for _ in range(5000)]
+    for probe in probes:
+        assert bool(trie.fullmatch(probe)) == bool(flat.fullmatch(probe)), probe
+        m, n = trie.match(probe), flat.match(probe)
+        assert (m and m.group()) == (n and n.group()), probe
+    assert trie_pattern(['KES', 'KSH', 'USD']) == '(?:K(?:ES|SH)|USD)'
+
+
+@pytest.mark.parametrize('markers, ignore_case', [(DEFAULT_MARKERS, True), (EXTENDED_MARKERS, False)])
+def test_scan_with_table_matches_findall(markers, ignore_case):
+    table = CurrencyTable(markers, ignore_case)
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        text = f.read() + '\n'.join(LINES)
+    pattern = re.compile(av.build_combined_source(table))
+    found = {name: [] for name in av.ENTITY_NAMES}
+    for name, start, end, candidate in av.scan(text, pattern=pattern):
+        found[name].append(candidate)
+    for name, entity_pattern in av.entity_patterns(table):
+        assert found[name] == re.findall(entity_pattern, text), name
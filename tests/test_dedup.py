@@ -0,0 +1,103 @@
+"""Order-preserving deduplication (dedup.py) and deterministic email order."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import all_validations as av
+import results
+import sinks
+import streaming
+from dedup import BloomDedup, ExactDedup, HashedDedup, dedup_factory, unique
+from extractors.emails import extract_emails
+
+SAMPLE = 'api_response.txt'
+
+# Emails with and without '@', repeated in a different order
+EMAIL_TEXT = (
+    "zed@example.com then alpha.beta.example.org, then b@example.net and zed@example.com,\n"
+    "later alpha.beta.example.org again, a@example.com, then www.example.co.uk and b@example.net\n"
+)
+# The no-'@' pattern also reads the domains of the '@' emails
+EMAIL_ORDER = ['zed@example.com', 'b@example.net', 'a@example.com',
+               'example.com', 'alpha.beta.example.org', 'example.net', 'www.example.co.uk']
+
+FACTORIES = {
+    'exact': dedup_factory('exact'),
+    'hashed': dedup_factory('hashed', initial_size=2),
+    'bloom': dedup_factory('bloom', capacity=10_000, false_positive_rate=1e-9),
+}
+
+
+def sample_text():
+    with open(SAMPLE, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_emails_in_first_seen_order():
+    # Emails found with '@' come first, each group in first-seen order
+    assert extract_emails(EMAIL_TEXT) == EMAIL_ORDER
+    assert av.extract_all(EMAIL_TEXT)['email'] == EMAIL_ORDER
+
+
+def test_email_order_does_not_depend_on_the_hash_seed():
+    # A set-based dedup would order the emails differently under each hash seed
+    script = ("import all_validations as av, sys; "
+              "print(av.extract_all(sys.stdin.read())['email'])")
+    outputs = set()
+    for seed in ['0', '1', '2', '12345']:
+        env = {**os.environ, 'PYTHONHASHSEED': seed}
+        done = subprocess.run([sys.executable, '-c', script], input=EMAIL_TEXT + sample_text(),
+                              capture_output=True, text=True, env=env, check=True)
+        outputs.add(done.stdout)
+    assert len(outputs) == 1
+    assert outputs.pop().strip() == repr(av.extract_all(EMAIL_TEXT + sample_text())['email'])
+
+
+@pytest.mark.parametrize('cls', [ExactDedup, HashedDedup, BloomDedup])
+def test_first_seen(cls):
+    dedup = cls()
+    values = [f'user{i % 300}@example.com' for i in range(1000)]
+    assert [v for v in values if dedup.first_seen(v)] == list(dict.fromkeys(values))
+    assert len(dedup) == 300
+    assert 'user5@example.com' in dedup and 'nobody@example.com' not in dedup
+    dedup.add('nobody@example.com')
+    assert 'nobody@example.com' in dedup
+
+
+def test_hashed_dedup_grows():
+    dedup = HashedDedup(initial_size=2)
+    values = [str(i) for i in range(10_000)]
+    assert all(dedup.first_seen(v) for v in values)
+    assert not any(dedup.first_seen(v) for v in values)
+    assert len(dedup.table) >= 2 * len(values)
+
+
+def test_unique_shares_state_across_calls():
+    dedup = ExactDedup()
+    assert unique(['a', 'b', 'a'], dedup) == ['a', 'b']
+    assert unique(['c', 'b'], dedup) == ['c']
+    assert unique(['b', 'a', 'b']) == ['b', 'a']
+
+
+@pytest.mark.parametrize('mode', list(FACTORIES))
+def test_pipelines_match_exact_dedup(tmp_path, mode):
+    make_dedup = FACTORIES[mode]
+    text = EMAIL_TEXT + sample_text()
+    path = tmp_path / 'input.txt'
+    path.write_text(text, encoding='utf-8')
+    assert av.extract_all(text, make_dedup=make_dedup) == av.extract_all(text)
+    assert av.validate_all(text, make_dedup=make_dedup) == av.validate_all(text)
+    assert [r.raw for r in results.extract_results(text, make_dedup)] == \
+           [r.raw for r in results.extract_results(text)]
+    assert list(streaming.stream_results(str(path), 64, 32, make_dedup)) == \
+           list(streaming.stream_results(str(path), 64, 32))
+    assert [(r.raw, r.start) for r in sinks.file_results(text, make_dedup)] == \
+           [(r.raw, r.start) for r in sinks.file_results(text)]
+
+
+@pytest.mark.parametrize('options', [{'capacity': 0}, {'false_positive_rate': 0}, {'false_positive_rate': 1}])
+def test_bloom_options(options):
+    with pytest.raises(ValueError):
+        BloomDedup(**options)
@@ -0,0 +1,85 @@
+"""Linear-time email candidate patterns (extractors/emails.py) on adversarial input."""
+import random
+import re
+import time
+
+import pytest
+
+import all_validations as av
+from extractors.emails import email_with_at_pattern, email_without_at_pattern, MAX_LEADING_SEPARATORS
+
+# The patterns before they were made linear-time
+OLD_WITH_AT = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+OLD_WITHOUT_AT = re.compile(r'\b[\w\.-]+\.[\w\.-]+\b')
+NEW_WITH_AT = re.compile(email_with_at_pattern)
+NEW_WITHOUT_AT = re.compile(email_without_at_pattern)
+
+# Tokens the old patterns retried from every position and backtracked over
+TOKENS = {
+    'hyphenated': lambda n: ('a-' * n)[:n],
+    'dotted': lambda n: ('a.' * n)[:n] + '-',
+    'dot-dash': lambda n: 'x' + ('.-' * n)[:n],
+    'word run': lambda n: 'a' * n,
+    'base64': lambda n: ''.join(random.Random(n).choice('ABCDEFGHabcdefgh0123456789+/') for _ in range(n)),
+    'local part': lambda n: 'a' * n + '@b',
+    'many ats': lambda n: ('a@' * n)[:n] + '.',
+}
+SMALL, LARGE = 10_000, 50_000
+# Linear time grows LARGE / SMALL = 5x; quadratic would be 25x
+MAX_GROWTH = 12
+
+
+def spans(pattern, text):
+    return [m.span() for m in pattern.finditer(text)]
+
+
+def leading_separators(text, start):
+    return len(re.search(r'[.-]*\Z', text[:start]).group())
+
+
+def best_time(fn, text, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def scan_all(text):
+    NEW_WITH_AT.findall(text)
+    NEW_WITHOUT_AT.findall(text)
+    for _ in av.scan(text):
+        pass
+
+
+def test_sample_matches_old_patterns():
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        text = f.read()
+    assert NEW_WITH_AT.findall(text) == OLD_WITH_AT.findall(text)
+    assert NEW_WITHOUT_AT.findall(text) == OLD_WITHOUT_AT.findall(text)
+
+
+def test_random_strings_differ_only_as_documented():
+    rng = random.Random(0)
+    alphabet = ['a', 'b', '1', '_', 'é', '.', '-', '..', '--', '@', ' ', 'x.y', 'ab@c.d']
+    for _ in range(10_000):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 16)))
+        old, new = spans(OLD_WITH_AT, text), spans(NEW_WITH_AT, text)
+        # Up to an old match starting where the previous one ended, inside the same run
+        # (after it the '@' pattern may pair the next '@' differently)
+        cut = next((i for i in range(1, len(old))
+                    if old[i][0] == old[i - 1][1] and text[old[i][0]] in '.-'), len(old))
+        assert new[:cut] == old[:cut] and (cut < len(old) or new == old), text
+        # Old matches after more than MAX_LEADING_SEPARATORS separators are dropped
+        old, new = spans(OLD_WITHOUT_AT, text), spans(NEW_WITHOUT_AT, text)
+        assert new == [s for s in old if leading_separators(text, s[0]) <= MAX_LEADING_SEPARATORS], text
+
+
+@pytest.mark.parametrize('label', list(TOKENS))
+def test_time_grows_linearly(label):
+    av.compiled_combined_pattern()
+    make = TOKENS[label]
+    small = best_time(scan_all, f' {make(SMALL)} ')
+    large = best_time(scan_all, f' {make(LARGE)} ')
+    assert large < small * MAX_GROWTH, (label, small, large)
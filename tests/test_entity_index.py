@@ -0,0 +1,150 @@
+"""Entity index (entity_index.py): building, exact and range lookups, reopening a saved index."""
+import datetime
+from decimal import Decimal
+
+import pytest
+
+import entity_index as ei
+from results import CHECKS
+
+SAMPLE = 'api_response.txt'
+
+# Different spellings of the same values, and non-ASCII text so that byte offsets
+# differ from character offsets
+TEXTS = {
+    'orders.txt': (
+        "Prix 12,00 € — contact Bob@Example.com at 2:30 PM, card 4111-1111-1111-1111\n"
+        "Rappel: bob@example.com, 14:30, carte 4111 1111 1111 1111, total $1,234.56\n"
+    ),
+    'support.txt': (
+        "Call (212) 555-0134 between 9:00 AM to 5:30 PM; refund $12 or $99.99\n"
+        "Émail alice@example.org, meeting 2025-09-26 14:30Z, fee Ksh 1,200\n"
+    ),
+}
+
+
+def reference_postings(texts):
+    """{(type, term): [(source, byte offset)]} from validating every occurrence directly."""
+    postings = {}
+    for source, text in texts.items():
+        for kind, offset, candidate in ei.occurrences(text):
+            result = CHECKS[kind](candidate)
+            if result.valid:
+                term, _ = ei.normalized_term(result)
+                postings.setdefault((kind, term), []).append((source, offset))
+    return postings
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    paths = []
+    for name, text in TEXTS.items():
+        path = tmp_path / name
+        path.write_text(text, encoding='utf-8')
+        paths.append(str(path))
+    with open(SAMPLE, 'r', encoding='utf-8') as f:
+        (tmp_path / 'sample.txt').write_text(f.read(), encoding='utf-8')
+    paths.append(str(tmp_path / 'sample.txt'))
+    ei.build_index(paths, tmp_path / 'corpus.idx')
+    return tmp_path / 'corpus.idx'
+
+
+def texts_by_source(index):
+    texts = {}
+    for source in index.sources:
+        with open(source, 'r', encoding='utf-8') as f:
+            texts[source] = f.read()
+    return texts
+
+
+def test_occurrences_use_byte_offsets():
+    text = TEXTS['orders.txt']
+    data = text.encode('utf-8')
+    found = list(ei.occurrences(text))
+    assert ('email', data.index(b'Bob@'), 'Bob@Example.com') in found
+    for kind, offset, candidate in found:
+        assert data[offset:offset + len(candidate.encode('utf-8'))] == candidate.encode('utf-8')
+
+
+def test_every_term_matches_reference(index_path):
+    with ei.EntityIndex(index_path) as index:
+        postings = reference_postings(texts_by_source(index))
+        assert len(index) == len(postings)
+        for kind in ei.TYPES:
+            assert index.terms(kind) == sorted(term for k, term in postings if k == kind)
+        for (kind, term), expected in postings.items():
+            assert index.find(kind, term) == expected
+
+
+def test_spellings_share_a_term(index_path):
+    with ei.EntityIndex(index_path) as index:
+        orders = str(index_path.parent / 'orders.txt')
+        data = TEXTS['orders.txt'].encode('utf-8')
+        emails = index.find('email', 'BOB@example.COM')
+        assert emails == [(orders, data.index(b'Bob@')), (orders, data.index(b'bob@'))]
+        assert index.find('credit_card', '4111111111111111') == index.find('credit_card', '4111 1111 1111 1111')
+        assert len(index.find('credit_card', '4111111111111111')) == 2
+        assert index.find('time', '2:30 PM') == index.find('time', '14:30')
+        # Seconds written as :00 make a term of their own
+        assert index.find('time', '14:30:00') == []
+        assert index.files('email', 'bob@example.com') == [orders]
+
+
+def test_missing_terms(index_path):
+    with ei.EntityIndex(index_path) as index:
+        assert index.find('email', 'nobody@nowhere.invalid') == []
+        assert index.files('email', 'nobody@nowhere.invalid') == []
+        # Invalid spellings are never looked up
+        assert index.find('credit_card', '4111 1111 1111 1112') == []
+
+
+def test_range_queries(index_path):
+    with ei.EntityIndex(index_path) as index:
+        postings = reference_postings(texts_by_source(index))
+
+        def expected(kind, in_range):
+            return sorted(
+                ((key, term, source, offset)
+                 for (k, term), occurrences in postings.items() if k == kind
+                 for source, offset in occurrences
+                 for key in [ei.normalized_term(CHECKS[kind](term))[1]] if in_range(key)),
+                key=lambda item: item[0],
+            )
+
+        low, high = datetime.time(9, 0), datetime.time(17, 30)
+        got = list(index.times_between(low, high))
+        want = expected('time', lambda key: ei.seconds_of_day(low) <= key <= ei.seconds_of_day(high))
+        assert got == [item[1:] for item in want]
+        assert ('09:00-17:30', str(index_path.parent / 'support.txt')) in [(t, s) for t, s, _ in got]
+
+        got = list(index.amounts_between(10, 100, code='USD'))
+        want = expected('currency', lambda key: key[0] == 'USD' and 1000 <= key[1] <= 10000)
+        assert got == [item[1:] for item in want]
+        support = str(index_path.parent / 'support.txt')
+        assert [term for term, source, _ in got if source == support] == ['USD 12.00', 'USD 99.99']
+        # Bounds between minor units round inwards
+        inner = index.amounts_between(Decimal('12.005'), '99.995', code='USD')
+        assert [term for term, source, _ in inner if source == support] == ['USD 99.99']
+        assert 'KES 1200.00' in [term for term, _, _ in index.amounts_between(0, 10 ** 6)]
+
+
+def test_reopened_index_matches_builder(tmp_path, index_path):
+    builder = ei.IndexBuilder()
+    for name, text in TEXTS.items():
+        builder.add(name, text)
+    builder.write(tmp_path / 'again.idx')
+    with ei.EntityIndex(tmp_path / 'again.idx') as index:
+        assert index.sources == list(TEXTS)
+        assert len(index) == len(reference_postings(TEXTS))
+        first = {kind: index.terms(kind) for kind in ei.TYPES}
+    # A second open reads the same file back
+    with ei.EntityIndex(tmp_path / 'again.idx') as index:
+        assert {kind: index.terms(kind) for kind in ei.TYPES} == first
+        assert index.find('email', 'alice@example.org') == reference_postings(TEXTS)['email', 'alice@example.org']
+
+
+def test_not_an_index(tmp_path):
+    path = tmp_path / 'plain.txt'
+    path.write_text('not an index', encoding='utf-8')
+    with pytest.raises(ValueError):
+        ei.EntityIndex(path)
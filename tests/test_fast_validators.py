@@ -0,0 +1,50 @@
+"""Regex-free card and phone validators (fast_validators.py) against the regex ones."""
+import random
+
+import pytest
+
+import all_validations as av
+import fast_validators as fv
+
+DIFF_CASES = 200_000
+# Separators, stray letters, and a no-break space, Arabic-Indic digit and em space
+ALPHABET = '0123456789' * 6 + ' -.()+x\t\u00a0\u0663\u2003'
+
+
+def random_input(rng):
+    if rng.random() < 0.5:
+        # Realistic shapes: digit groups joined by a separator, optional prefix/parentheses
+        groups = [''.join(rng.choice('0123456789') for _ in range(rng.choice((2, 3, 4, 4, 4))))
+                  for _ in range(rng.randint(1, 5))]
+        text = rng.choice([' ', '-', '.', '', ' - ']).join(groups)
+        if rng.random() < 0.3:
+            text = '(' + text[:3] + ')' + rng.choice(['', ' ', '-']) + text[3:]
+        if rng.random() < 0.2:
+            text = '+' + text
+        return text
+    return ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 22)))
+
+
+@pytest.fixture(scope='module')
+def random_inputs():
+    rng = random.Random(42)
+    return [random_input(rng) for _ in range(DIFF_CASES)]
+
+
+def test_phone_matches_regex_validator(random_inputs):
+    for number in random_inputs:
+        assert fv.validate_phone_fast(number) == av.validate_phone(number), number
+
+
+def test_card_matches_regex_validator(random_inputs):
+    for number in random_inputs:
+        assert fv.validate_credit_card_fast(number) == av.validate_credit_card(number), number
+        assert fv.validate_credit_card_fast(number, luhn=True) == av.validate_credit_card(number, luhn=True), number
+
+
+@pytest.mark.parametrize('length', range(13, 17))
+def test_every_issuer_prefix(length):
+    # One card per (length, 4-digit prefix) so every table entry is compared
+    for prefix in range(10000):
+        card = f'{prefix:04d}' + '1' * (length - 4)
+        assert fv.validate_credit_card_fast(card) == av.validate_credit_card(card), card
@@ -0,0 +1,109 @@
+"""Incremental extraction of an append-only log (incremental.py)."""
+import os
+import random
+
+import incremental
+import mmap_scan
+
+SAMPLE = 'api_response.txt'
+
+
+def full_matches(path):
+    return [(n, s, e, c.decode('utf-8')) for n, s, e, c in mmap_scan.mmap_matches(path)]
+
+
+def test_appends_match_one_full_scan(tmp_path):
+    # Appended in pieces cut mid-line and mid-token
+    with open(SAMPLE, 'r', encoding='utf-8') as f:
+        data = (f.read() * 20).encode('utf-8')
+    path = str(tmp_path / 'appends.log')
+    state = path + '.state'
+    rng = random.Random(1)
+    cuts = sorted(rng.sample(range(1, len(data)), 40)) + [len(data)]
+    open(path, 'wb').close()
+    collected = []
+    written = 0
+    for cut in cuts:
+        with open(path, 'ab') as f:
+            f.write(data[written:cut])
+        written = cut
+        found, status, start, stop = incremental.appended_matches(path, state)
+        assert status in ('new', 'appended'), status
+        # Nothing past the last complete line is reported yet
+        last_newline = data.rfind(b'\n', 0, cut) + 1
+        assert all(match_start < last_newline for _, match_start, _, _ in found)
+        collected += found
+    assert collected == full_matches(path)
+
+
+def test_partial_line_waits_for_its_newline(tmp_path):
+    path = str(tmp_path / 'partial.log')
+    state = path + '.state'
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("paid $12.50 at 10:30\nmail bob@exa")
+    first = [r[1] for r in incremental.extract_appended(path, state)[0]]
+    assert first == ['$12.50', '10:30']
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write("mple.com now\n")
+    records, status, start, stop = incremental.extract_appended(path, state)
+    assert status == 'appended' and start == len("paid $12.50 at 10:30\n")
+    assert 'bob@example.com' in [r[1] for r in records]
+
+
+def test_unfinished_match_is_held_back(tmp_path):
+    path = str(tmp_path / 'unfinished.log')
+    state = path + '.state'
+    # '555 123\n4567' matches as a phone until the line goes on
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("hello\ncall 555 123\n4567")
+    matches, status, start, stop = incremental.appended_matches(path, state)
+    assert matches == [] and stop == len("hello\ncall 555 123\n")
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write("8 more\n")
+    matches, status, start, stop = incremental.appended_matches(path, state)
+    assert status == 'appended' and start == len("hello\n")
+    assert matches == full_matches(path) == []
+
+    # Still a match once the line is finished: reported by the run that sees it finished
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write("dial 555 123\n4567")
+    assert incremental.appended_matches(path, state)[0] == []
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(" now\n")
+    matches = incremental.appended_matches(path, state)[0]
+    assert [m[3] for m in matches] == ['555 123\n4567'] and matches == full_matches(path)
+
+
+def test_rotation_truncation_and_rewrite_restart_from_zero(tmp_path):
+    path = str(tmp_path / 'rotate.log')
+    state = path + '.state'
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("first $10.00\n" * 500)
+    incremental.extract_appended(path, state)
+
+    # Rotation: renamed away, new file in its place
+    os.rename(path, path + '.1')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("second €20.00\n")
+    records, status, start, stop = incremental.extract_appended(path, state)
+    assert status == 'rotated' and start == 0 and [r[1] for r in records] == ['€20.00']
+
+    # Truncation: same file, now shorter than the checkpoint offset
+    with open(path, 'r+', encoding='utf-8') as f:
+        f.truncate(0)
+        f.write("third\n")
+    records, status, start, stop = incremental.extract_appended(path, state)
+    assert status == 'truncated' and start == 0 and stop == len("third\n")
+
+    # Copy-truncate then regrowth past the old offset: the bytes before it changed
+    with open(path, 'r+', encoding='utf-8') as f:
+        f.truncate(0)
+        f.write("fourth £30.00\n" * 10)
+    records, status, start, stop = incremental.extract_appended(path, state)
+    assert status == 'rewritten' and start == 0 and [r[1] for r in records] == ['£30.00']
+
+    # A pure append after that is incremental again
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write("fifth $40.00\n")
+    records, status, start, stop = incremental.extract_appended(path, state)
+    assert status == 'appended' and [r[1] for r in records] == ['$40.00']
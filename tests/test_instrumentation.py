@@ -0,0 +1,95 @@
+"""Per-stage instrumentation (instrumentation.py)."""
+import io
+import json
+
+import pytest
+
+import all_validations as av
+import instrumentation
+from instrumentation import Stats
+
+SAMPLE = 'api_response.txt'
+NON_ASCII = "Prix €1.234,56 — écrire à contact@example.fr à 14:30\n"
+
+
+def sample_text():
+    with open(SAMPLE, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('text', [sample_text(), NON_ASCII + sample_text(), ''])
+def test_counts_add_up(text):
+    stats = Stats()
+    results = av.validate_all(text, stats)
+    assert results == av.validate_all(text)
+    data = stats.as_dict()
+    assert data['bytes_scanned'] == len(text.encode('utf-8'))
+    assert sum(data['matches'].values()) == sum(1 for _ in av.scan(text))
+    for kind, pairs in results.items():
+        counts = data['entities'][kind]
+        assert counts['candidates'] == len(pairs) == counts['valid'] + counts['invalid'], kind
+        assert counts['valid'] == sum(1 for _, message in pairs if message.startswith('Valid')), kind
+    assert list(data['stages']) == ['scan', 'dedup', 'validate']
+    assert all(stage['calls'] == 1 for stage in data['stages'].values())
+
+
+def test_stats_accumulate_over_calls():
+    stats = Stats()
+    text = sample_text()
+    av.validate_all(text, stats)
+    once = stats.as_dict()
+    av.validate_all(text, stats)
+    twice = stats.as_dict()
+    assert twice['bytes_scanned'] == 2 * once['bytes_scanned']
+    assert twice['matches'] == {name: 2 * count for name, count in once['matches'].items()}
+    assert all(stage['calls'] == 2 for stage in twice['stages'].values())
+    assert twice['entities']['email']['candidates'] == 2 * once['entities']['email']['candidates']
+
+
+def test_run_times_every_stage_and_prints_the_script_output(capsys):
+    stats = Stats()
+    out = io.StringIO()
+    assert instrumentation.run(SAMPLE, stats, out) == 0
+    assert list(stats.as_dict()['stages']) == instrumentation.STAGES
+
+    av.main([SAMPLE])
+    assert out.getvalue() == capsys.readouterr().out
+
+
+def test_run_missing_file():
+    stats = Stats()
+    assert instrumentation.run('no/such/file.txt', stats, io.StringIO()) == 1
+    assert list(stats.as_dict()['stages']) == ['read']
+
+
+def test_main_writes_json_stats(tmp_path, capsys):
+    stats_file = tmp_path / 'stats.json'
+    assert instrumentation.main([SAMPLE, '--quiet', '--stats-file', str(stats_file)]) == 0
+    assert capsys.readouterr().out == ''
+    data = json.loads(stats_file.read_text(encoding='utf-8'))
+    assert list(data['stages']) == instrumentation.STAGES
+    assert data['bytes_scanned'] == len(sample_text().encode('utf-8'))
+
+
+def test_prometheus_format():
+    stats = Stats()
+    av.validate_all(sample_text(), stats)
+    lines = stats.to_prometheus().splitlines()
+    assert '# TYPE extraction_stage_seconds_total counter' in lines
+    assert f'extraction_bytes_scanned_total {stats.bytes_scanned}' in lines
+    valid = stats.entities['email']['valid']
+    assert f'extraction_valid_total{{entity="email"}} {valid}' in lines
+    # Every sample line is a known metric name followed by one value
+    for line in lines:
+        if not line.startswith('#'):
+            name, value = line.rsplit(' ', 1)
+            assert name.startswith('extraction_') and float(value) >= 0
+
+
+def test_traced_memory():
+    stats = Stats()
+    with instrumentation.traced_memory(stats, limit=3):
+        av.validate_all(sample_text(), stats)
+    assert stats.memory['peak_bytes'] >= stats.memory['current_bytes'] >= 0
+    assert len(stats.memory['top']) <= 3
+    assert 'extraction_peak_traced_memory_bytes' in stats.to_prometheus()
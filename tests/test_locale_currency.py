@@ -0,0 +1,137 @@
+"""Multi-locale currency amounts (currency_table.py, extractors/currencies.py)."""
+import re
+from decimal import Decimal
+
+import pytest
+
+import all_validations as av
+from currency_table import CurrencyTable, DEFAULT_MARKERS, DEFAULT_TABLE
+from extractors.currencies import check_currency, extract_currencies, parse_currency
+
+NBSP = '\u00a0'
+NNBSP = '\u202f'
+
+# locale -> [(candidate, ISO code, amount)] that must parse
+VALID = {
+    'en': [
+        ('$1,234.56', 'USD', '1234.56'),
+        ('$1234.56', 'USD', '1234.56'),
+        ('£12', 'GBP', '12.00'),
+        ('Ksh 1,200', 'KES', '1200.00'),
+        ('1,500.50 KES', 'KES', '1500.50'),
+        ('€1,234.56', 'EUR', '1234.56'),
+    ],
+    'de': [
+        ('1.234,56 €', 'EUR', '1234.56'),
+        ('€1.234,56', 'EUR', '1234.56'),
+        ('€1.234', 'EUR', '1234.00'),
+        ('EUR 12,50', 'EUR', '12.50'),
+    ],
+    'fr': [
+        ('1 234,56 €', 'EUR', '1234.56'),
+        (f'1{NBSP}234,56 €', 'EUR', '1234.56'),
+        (f'€1{NNBSP}234{NNBSP}567,00', 'EUR', '1234567.00'),
+        ('12 345 678 EUR', 'EUR', '12345678.00'),
+    ],
+    'in': [
+        ('₹12,34,567.00', 'INR', '1234567.00'),
+        ('INR 1,00,000', 'INR', '100000.00'),
+        ('₹1,234.50', 'INR', '1234.50'),
+    ],
+    'zero minor units': [
+        ('RWF 1.500', 'RWF', '1500'),
+        ('1,500 RWF', 'RWF', '1500'),
+        ('1 000 000 UGX', 'UGX', '1000000'),
+        ('2500 ugx', 'UGX', '2500'),
+    ],
+}
+
+# (candidate, message) that must be rejected
+INVALID = [
+    ('$12.3', "Invalid: Decimal part must have exactly 2 digits"),
+    ('$1,23,456.78', "Invalid: Incorrect comma placement in thousands"),
+    ('$1.234,56', "Invalid: Decimal part must have exactly 2 digits"),
+    ('€1.23.456,00', "Invalid: Incorrect comma placement in thousands"),
+    ('1 23,45 €', "Invalid: Incorrect comma placement in thousands"),
+    ('₹1,2,34,567.00', "Invalid: Incorrect comma placement in thousands"),
+    ('12.50 RWF', "Invalid: Currency has no decimal part"),
+    ('UGX 1,50', "Invalid: Currency has no decimal part"),
+    ('$12a', "Invalid: Contains non-digit characters in integer part"),
+    ('19.99', "Invalid: Missing currency marker"),
+]
+
+# The default markers plus the rupee, which the default table doesn't read
+LOCALE_TABLE = CurrencyTable({**DEFAULT_MARKERS, '₹': 'INR', 'INR': 'INR'})
+
+# Table with a three-decimal currency and an overridden format
+KWD_TABLE = CurrencyTable({'KWD': 'KWD', 'CHF': 'CHF'}, formats={'CHF': ('en', 'de')})
+KWD_CASES = [
+    (KWD_TABLE, 'KWD 1,234.567', 'Valid currency amount', '1234.567'),
+    (KWD_TABLE, 'KWD 12.50', "Invalid: Decimal part must have exactly 3 digits", None),
+    (KWD_TABLE, '1.234,50 CHF', 'Valid currency amount', '1234.50'),
+]
+
+# ISO 4217 currencies with four minor units
+FOUR_DECIMAL_TABLE = CurrencyTable({'CLF': 'CLF', 'UYW': 'UYW'})
+FOUR_DECIMAL_CASES = [
+    (FOUR_DECIMAL_TABLE, 'CLF 12.3456', 'Valid currency amount', '12.3456'),
+    (FOUR_DECIMAL_TABLE, '1,234.5000 UYW', 'Valid currency amount', '1234.5000'),
+    (FOUR_DECIMAL_TABLE, 'CLF 12', 'Valid currency amount', '12.0000'),
+    (FOUR_DECIMAL_TABLE, 'CLF 12.34', "Invalid: Decimal part must have exactly 4 digits", None),
+]
+
+LINES = [
+    "Invoice total 1.234,56 € due, deposit €250,00 received",
+    "Paris: 1 234,56 € incl. TVA; Lyon: 12 345 678 EUR budget",
+    "Mumbai order ₹12,34,567.00, shipping INR 1,00,000",
+    "Kigali fee RWF 1.500 and 1,500 RWF, Kampala 1 000 000 UGX",
+    "US price $1,234.56, UK £12, Nairobi Ksh 1,200",
+    "bad: $12.3, $1,23,456.78, 12.50 RWF, see page 12 345 and 5 items",
+]
+
+VALID_CASES = [(locale, *case) for locale, cases in VALID.items() for case in cases]
+
+
+@pytest.mark.parametrize('locale, candidate, code, amount', VALID_CASES)
+def test_valid_amounts(locale, candidate, code, amount):
+    got = parse_currency(candidate, LOCALE_TABLE)
+    assert got == ("Valid currency amount", code, Decimal(amount))
+    # Amounts keep the currency's minor units
+    assert str(got[2]) == amount
+
+
+@pytest.mark.parametrize('candidate, message', INVALID)
+def test_invalid_amounts(candidate, message):
+    assert parse_currency(candidate, LOCALE_TABLE) == (message, None, None)
+
+
+@pytest.mark.parametrize('table, candidate, message, amount', KWD_CASES + FOUR_DECIMAL_CASES)
+def test_table_minor_units_and_formats(table, candidate, message, amount):
+    got = parse_currency(candidate, table)
+    assert got[0] == message == check_currency(candidate, table=table).message
+    assert amount is None or str(got[2]) == amount
+
+
+def test_default_table_has_no_rupee():
+    assert parse_currency('₹1,234.50') == ("Invalid: Missing currency marker", None, None)
+
+
+def test_extraction():
+    text = '\n'.join(LINES)
+    found = extract_currencies(text)
+    for locale, candidate, code, amount in VALID_CASES:
+        if code in DEFAULT_TABLE.rules and any(candidate in line for line in LINES):
+            assert candidate in found
+    # A plain space groups digits only before a trailing marker
+    assert not any(c.startswith('12 345') and 'EUR' not in c for c in found)
+
+
+def test_scan_matches_findall():
+    text = '\n'.join(LINES)
+    found = {name: [] for name in av.ENTITY_NAMES}
+    for name, start, end, candidate in av.scan(text):
+        found[name].append(candidate)
+    for name, entity_pattern in av.ENTITY_PATTERNS:
+        assert found[name] == re.findall(entity_pattern, text), name
+    # The combined pattern still compiles for the bytes scanner
+    re.compile(av.combined_source.encode('utf-8'))
@@ -0,0 +1,64 @@
+"""Memory-mapped bytes scanning (mmap_scan.py) against the str scan of the decoded file."""
+import pytest
+
+import all_validations as av
+import mmap_scan
+
+SAMPLE = 'api_response.txt'
+
+# '£' and '€' are several bytes each in the bytes pattern; the accented words are
+# non-word characters to it, which must not change the matches around them
+NON_ASCII_LINES = [
+    "Invoice total £1,234.56 or €10.00 after discount",
+    "Refund of €0.99 sent, balance £12.30 remaining, 1.234,56 € pending",
+    "Café fermé à 14:30, écrire à contact@example.fr ou appeler +33 1 23 45 67 89",
+]
+
+
+def write_input(tmp_path, text):
+    path = tmp_path / 'input.txt'
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture(params=['sample', 'non-ascii'])
+def path(request, tmp_path):
+    with open(SAMPLE, 'r', encoding='utf-8') as f:
+        sample = f.read()
+    if request.param == 'sample':
+        return write_input(tmp_path, sample)
+    return write_input(tmp_path, '\n'.join(NON_ASCII_LINES) + '\n' + sample)
+
+
+def test_bytes_scan_matches_str_scan(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    str_matches = [(name, candidate) for name, _, _, candidate in av.scan(text)]
+    byte_matches = list(mmap_scan.mmap_matches(path))
+    assert [(name, candidate.decode('utf-8')) for name, _, _, candidate in byte_matches] == str_matches
+
+
+def test_offsets_slice_back_to_candidates(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    for name, start, end, candidate in mmap_scan.mmap_matches(path):
+        assert raw[start:end] == candidate
+    for kind, candidate, result, start, end in mmap_scan.mmap_results(path):
+        assert raw[start:end].decode('utf-8').strip() == candidate
+
+
+def test_results_match_validate_all(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    found = {}
+    for kind, candidate, result, start, end in mmap_scan.mmap_results(path):
+        found.setdefault(kind, []).append((candidate, result))
+    # Results come in text order; validate_all() lists emails with '@' first
+    found['email'].sort(key=lambda pair: '@' not in pair[0])
+    assert found == {kind: pairs for kind, pairs in av.validate_all(text).items() if pairs}
+
+
+def test_empty_file(tmp_path):
+    path = write_input(tmp_path, '')
+    assert list(mmap_scan.mmap_matches(path)) == []
+    assert list(mmap_scan.mmap_results(path)) == []
@@ -0,0 +1,39 @@
+"""Span-based overlap resolution (overlap.py) against a brute-force reference."""
+import pytest
+
+import overlap
+from tests.inputs import dense_digits, digit_chain, filtered_matches
+
+
+def brute_force(matches):
+    # O(n^2) greedy: best-ranked first, kept unless it overlaps one already kept
+    ranked = sorted(matches, key=lambda m: (-overlap.PRIORITY[m[0]], m[1] - m[2], m[1]))
+    kept = []
+    for m in ranked:
+        if all(m[2] <= k[1] or k[2] <= m[1] for k in kept):
+            kept.append(m)
+    return sorted(kept, key=lambda m: m[1])
+
+
+def check_no_overlap(winners):
+    for a, b in zip(winners, winners[1:]):
+        assert a[2] <= b[1], (a, b)
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_dense_digits_match_brute_force(seed):
+    matches = filtered_matches(dense_digits(300, seed))
+    winners = list(overlap.resolve_overlaps(matches))
+    check_no_overlap(winners)
+    assert winners == brute_force(matches)
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_digit_chains_match_brute_force(seed):
+    matches = filtered_matches(digit_chain(400, seed))
+    assert list(overlap.resolve_overlaps(matches)) == brute_force(matches)
+
+
+def test_large_inputs_never_overlap():
+    for generate in (dense_digits, digit_chain):
+        check_no_overlap(list(overlap.resolve_overlaps(filtered_matches(generate(100_000, 1)))))
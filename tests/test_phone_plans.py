@@ -0,0 +1,110 @@
+"""Phone validation with country calling code plans (phone_plans.py, extractors/phones.py)."""
+import pytest
+
+import all_validations as av
+import fast_validators as fv
+from extractors.phones import extract_phones, parse_phone, validate_phone
+from phone_plans import PhonePlan, PhonePlans
+from results import ErrorCode, check_phone
+
+LENGTH_9 = "Invalid: Must have exactly 9 digits (excluding country code)"
+LENGTH_10 = "Invalid: Must have exactly 10 digits (excluding country code)"
+NANP_LEADING = "Invalid: First digits must fit NXXNXX (N is 2-9, X any digit)"
+
+# number -> E.164 form, or the error message
+PARSE_CASES = {
+    # East Africa
+    '+254 712 345 678': '+254712345678',
+    '+254712345678': '+254712345678',
+    '+254 (0)712 345 678': '+254712345678',
+    '+254 712 345 6789': LENGTH_9,
+    '+256 772 123456': '+256772123456',
+    '+255 754 123 456': '+255754123456',
+    '+250 788 123 456': '+250788123456',
+    '+257 22 12 34 56': '+25722123456',
+    '+257 22 12 34 5': "Invalid: Must have exactly 8 digits (excluding country code)",
+    '+251 91 123 4567': '+251911234567',
+    '+211 912 345 678': '+211912345678',
+    '+252 61 234 5678': '+252612345678',
+    # UK
+    '+44 20 7946 0958': '+442079460958',
+    '+44 (0)20 7946 0958': '+442079460958',
+    '+44 7700 900123': '+447700900123',
+    '+44 1632 96012': '+44163296012',
+    '+44 20 7946': "Invalid: Must have 9-10 digits (excluding country code)",
+    # NANP, with and without '+'
+    '+1 (212) 456-7890': '+12124567890',
+    '+1 415 555 2671': '+14155552671',
+    '+1 212 456 789': LENGTH_10,
+    '212-456-7890': '+12124567890',
+    '(555)2345678': '+15552345678',
+    '555.234.5678': '+15552345678',
+    '1 555 234 5678': '+15552345678',
+    '(55) 123-4567': LENGTH_10,
+    '44 123 456 7890': LENGTH_10,
+    '1 (212) 456-7890': "Invalid: Area code parentheses incorrect",
+    # NANP area codes and exchanges start with 2-9
+    '123-456-7890': NANP_LEADING,
+    '(023) 456-7890': NANP_LEADING,
+    '555-012-3456': NANP_LEADING,
+    '555.123.4567': NANP_LEADING,
+    '+1 (123) 456-7890': NANP_LEADING,
+    '1 555 123 4567': NANP_LEADING,
+    # Unknown calling codes
+    '+999 123 4567': "Invalid: Unknown country calling code",
+    '+0 123 456 7890': "Invalid: Unknown country calling code",
+}
+
+EXTRACT_CASES = {
+    "Call +254 712 345 678 or +256 772 123456 today": ['+254 712 345 678', '+256 772 123456'],
+    "London office: +44 (0)20 7946 0958.": ['+44 (0)20 7946 0958'],
+    "US support +1 (123) 456-7890, fax 123.456.7890": ['+1 (123) 456-7890', '123.456.7890'],
+    "Kigali +250788123456, Bujumbura +257 22 12 34 56": ['+250788123456', '+257 22 12 34 56'],
+    "ref +2547123456789012": [],
+}
+
+
+@pytest.mark.parametrize('number, expected', PARSE_CASES.items())
+def test_parse_phone(number, expected):
+    message, e164 = parse_phone(number)
+    if expected.startswith('+'):
+        assert e164 == expected
+        assert message == f"Valid phone number (E.164: {expected})"
+    else:
+        assert e164 is None
+        assert message == expected
+
+
+@pytest.mark.parametrize('number', PARSE_CASES)
+def test_check_phone_agrees_with_validate_phone(number):
+    result = check_phone(number)
+    assert result.message == validate_phone(number)
+    assert result.value == parse_phone(number)[1]
+    assert fv.validate_phone_fast(number) == validate_phone(number)
+
+
+def test_check_phone_codes():
+    assert check_phone('+254 712 345 678').detail == 'KE'
+    assert check_phone('+44 20 7946').error == ErrorCode.PHONE_DIGIT_COUNT
+    assert check_phone('+999 123 4567').error == ErrorCode.PHONE_COUNTRY_CODE
+    result = check_phone('123-456-7890')
+    assert result.error == ErrorCode.PHONE_LEADING_DIGITS
+    assert result.detail == 'NXXNXX'
+
+
+@pytest.mark.parametrize('text, expected', EXTRACT_CASES.items())
+def test_extract_phones(text, expected):
+    assert extract_phones(text) == expected
+    assert av.extract_all(text)['phone'] == expected
+
+
+def test_overlapping_calling_codes_rejected():
+    with pytest.raises(ValueError):
+        PhonePlans([PhonePlan('25', 'XX', [9]), PhonePlan('254', 'KE', [9], '0')])
+
+
+def test_leading_digit_rules_only_for_their_plan():
+    # Kenyan national numbers have no leading digit rule
+    national = PhonePlans(national_code='254')
+    assert parse_phone('0712 345 678', national)[1] == '+254712345678'
+    assert parse_phone('0112 345 678', national)[1] == '+254112345678'
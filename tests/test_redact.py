@@ -0,0 +1,87 @@
+"""Redaction (redact.py): chunked against whole-text output, policies and the salted hash."""
+import pytest
+
+import redact
+
+SAMPLE = 'api_response.txt'
+OVERLAP = 128
+
+
+def sample():
+    with open(SAMPLE, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def redact_in_chunks(redactor, text, chunk_size, overlap=OVERLAP):
+    chunks = (text[i:i + chunk_size] for i in range(0, len(text), chunk_size))
+    return ''.join(redactor.redact_chunks(chunks, overlap))
+
+
+def test_find_matches_equals_redact_pattern():
+    text = sample()
+    expected = [(m.lastgroup, m.span()) for m in redact.redact_pattern.finditer(text)]
+    assert [(m.lastgroup, m.span()) for m in redact.find_matches(text)] == expected
+
+
+@pytest.mark.parametrize('policy', ['default'] + redact.POLICIES)
+@pytest.mark.parametrize('chunk_size', [7, 64, 1024])
+def test_chunks_match_whole_text(policy, chunk_size):
+    text = sample()
+    policies = redact.parse_policies([] if policy == 'default' else [policy])
+    whole = redact.Redactor(policies, salt='test').redact_text(text)
+    assert redact_in_chunks(redact.Redactor(policies, salt='test'), text, chunk_size) == whole
+
+
+def test_email_longer_than_the_overlap():
+    # The local part runs across several chunk boundaries and past the default overlap
+    text = 'x ' * 3000 + 'ab1Cd2eF3g' * 600 + '@example.com and more'
+    whole = redact.Redactor().redact_text(text)
+    assert 'ab1C' not in whole
+    assert redact_in_chunks(redact.Redactor(), text, 1000, redact.DEFAULT_OVERLAP) == whole
+
+
+def test_nothing_valid_left_after_full_mask():
+    masked = redact.Redactor(redact.parse_policies(['full'])).redact_text(sample())
+    for m in redact.find_matches(masked):
+        assert not redact.CHECKS[m.lastgroup](m.group()).valid, m.group()
+
+
+@pytest.mark.parametrize('policy, expected', [
+    ('full', "card **** **** **** **** and call +***-***-***-***"),
+    ('last4', "card **** **** **** 1111 and call +***-***-**5-678"),
+    ('issuer', "card [card:Visa] and call [phone:+254]"),
+])
+def test_policies(policy, expected):
+    text = "card 4111 1111 1111 1111 and call +254-712-345-678"
+    assert redact.Redactor(redact.parse_policies([policy])).redact_text(text) == expected
+
+
+def test_email_policies():
+    text = "mail Jane.Doe@Example.com now"
+    assert redact.Redactor().redact_text(text) == "mail ****.***@*******.*** now"
+    assert redact.Redactor({'email': 'issuer'}).redact_text(text) == "mail [email:@Example.com] now"
+
+
+def test_salted_hash():
+    text = "4111 1111 1111 1111 or 4111-1111-1111-1111, Jane@example.com or jane@EXAMPLE.com"
+    tokens = redact.Redactor(redact.parse_policies(['hash']), salt='s1').redact_text(text)
+    card_a, card_b, email_a, email_b = [w.strip(',') for w in tokens.split() if w.startswith('[')]
+    # The same normalized value gets the same token, whatever its formatting
+    assert card_a == card_b and card_a.startswith('[card#')
+    assert email_a == email_b and email_a.startswith('[email#')
+    assert redact.Redactor(redact.parse_policies(['hash']), salt='s1').redact_text(text) == tokens
+    assert redact.Redactor(redact.parse_policies(['hash']), salt='s2').redact_text(text) != tokens
+
+
+def test_invalid_candidates_are_masked_by_default():
+    # Fails the NANP rule (area code starting with 1) and the card's Luhn-free rules
+    text = "call (123) 456-7890, card 0000 0000 0000 0000"
+    assert redact.Redactor().redact_text(text) == "call (***) ***-****, card **** **** **** ****"
+    assert redact.Redactor(mask_invalid=False).redact_text(text) == text
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        redact.Redactor({'phone': 'blur'})
+    with pytest.raises(ValueError):
+        redact.Redactor({'address': 'full'})
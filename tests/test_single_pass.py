@@ -0,0 +1,91 @@
+"""Single-pass extraction (all_validations.py) against one findall pass per extractor."""
+import io
+import re
+
+import pytest
+
+import all_validations as av
+from extractors.currencies import currency_pattern
+
+SAMPLE = 'api_response.txt'
+
+# Lines the skip pattern must not swallow: words right before '@', '.', '-' or a
+# digit, currency codes and symbols in front of amounts, an email without '@'
+TRICKY_LINES = [
+    "Reach averyveryverylongname@example.com or support.team@example.org today",
+    "Balance USD 12.50 and EUR12 due, KES 1,500.00 or Ksh 300 paid, R$ 10 noted",
+    "Shift 9:00 AM to 5:30 PM then 2025-09-26T14:30:00Z, phone +254 712 345 678",
+    "admin at example dot com is not an email, but name.surname.example.com may be",
+    "Card 4111 1111 1111 1111 and 4111-1111-1111-1111, then plain words only here",
+]
+
+
+def sample_text():
+    with open(SAMPLE, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def multipass_extract(text):
+    """One re.findall pass per extractor, deduplicated as extract_all() does."""
+    emails = re.findall(av.email_with_at_pattern, text)
+    emails += [e for e in re.findall(av.email_without_at_pattern, text) if av.is_email_like(e)]
+    currency = (c.strip() for c in re.findall(currency_pattern, text, flags=re.IGNORECASE))
+    phones = dict.fromkeys(m.group(0) for m in re.finditer(av.phone_pattern, text))
+    return {
+        'email': list(dict.fromkeys(emails)),
+        'time': list(dict.fromkeys(c.strip() for c in re.findall(av.time_candidate_pattern, text))),
+        'credit_card': list(dict.fromkeys(c.strip() for c in re.findall(av.cc_pattern, text))),
+        'currency': list(dict.fromkeys(c for c in currency if c)),
+        'phone': [p for p in phones if not av.is_credit_card_like(p)],
+    }
+
+
+@pytest.mark.parametrize('text', [
+    sample_text(),
+    '\n'.join(TRICKY_LINES),
+    ('filler words only on this line\n' * 7 + sample_text()) * 3,
+    '',
+])
+def test_extract_all_matches_multipass(text):
+    assert av.extract_all(text) == multipass_extract(text)
+
+
+def test_scan_matches_findall_per_pattern():
+    text = sample_text() + '\n'.join(TRICKY_LINES)
+    found = {name: [] for name in av.ENTITY_NAMES}
+    for name, start, end, candidate in av.scan(text):
+        assert text[start:end] == candidate
+        found[name].append(candidate)
+    for name, entity_pattern in av.ENTITY_PATTERNS:
+        assert found[name] == re.findall(entity_pattern, text), name
+
+
+def test_scan_stop_and_resume():
+    text = sample_text()
+    whole = list(av.scan(text))
+    cut = len(text) // 2
+    resume = {}
+    first = list(av.scan(text, stop=cut, resume=resume))
+    assert all(start < cut for _, start, _, _ in first)
+    # A second scan with the same resume offsets skips what the first one yielded
+    assert first + list(av.scan(text, resume=resume)) == whole
+
+
+def test_validate_all_matches_validators():
+    text = sample_text() + '\n'.join(TRICKY_LINES)
+    candidates = av.extract_all(text)
+    assert av.validate_all(text) == {
+        kind: [(c, av.VALIDATORS[kind](c)) for c in values] for kind, values in candidates.items()
+    }
+
+
+def test_sections_match_per_candidate_prints():
+    results = av.validate_all(sample_text())
+    out = io.StringIO()
+    av.write_sections(results, out)
+    expected = io.StringIO()
+    for kind, pairs in results.items():
+        print(av.SECTION_TITLES[kind], file=expected)
+        for candidate, result in pairs:
+            print(f"{candidate}: {result}", file=expected)
+    assert out.getvalue() == expected.getvalue()
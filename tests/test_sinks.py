@@ -0,0 +1,128 @@
+"""Output sinks (sinks.py): text output, structured formats and the columnar file."""
+import csv
+import io
+import json
+
+import pytest
+
+import all_validations as av
+import sinks
+from results import CHECKS, ErrorCode
+from sinks import FIELDS, ColumnarSink, CsvSink, JsonlSink, TextSink, file_results, read_columnar
+
+SAMPLE = 'api_response.txt'
+NON_ASCII = "Prix €1.234,56 — écrire à contact@example.fr à 14:30, carte 4111 1111 1111 1111\n"
+
+# Candidates the CSV and JSON writers have to quote or escape
+AWKWARD = ['a,b@x.com', 'say "hi"@x.com', 'a\nb@x.com\r', 'café@exämple.com']
+
+
+def sample_text():
+    with open(SAMPLE, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def records():
+    text = NON_ASCII + sample_text()
+    return list(file_results(text)) + [CHECKS['email'](raw, 0, len(raw)) for raw in AWKWARD]
+
+
+def fields(r):
+    return r.entity_type, r.start, r.end, r.raw, r.valid, r.error.name
+
+
+@pytest.fixture(autouse=True)
+def small_batches(monkeypatch):
+    # Several batches per write, so flushing between batches is exercised
+    monkeypatch.setattr(sinks, 'BATCH_RECORDS', 5)
+
+
+@pytest.mark.parametrize('text', [sample_text(), NON_ASCII + sample_text(), ''])
+def test_text_sink_matches_script_output(tmp_path, capsys, text):
+    path = tmp_path / 'input.txt'
+    path.write_text(text, encoding='utf-8')
+    av.main([str(path)])
+    out = io.StringIO()
+    with TextSink(out) as sink:
+        sink.write(str(path), file_results(text))
+    assert out.getvalue() == capsys.readouterr().out
+
+
+def test_offsets_are_bytes():
+    text = NON_ASCII + sample_text()
+    data = text.encode('utf-8')
+    for r in file_results(text):
+        assert data[r.start:r.end].decode('utf-8').strip() == r.raw
+
+
+def test_jsonl_round_trip():
+    rs = records()
+    out = io.StringIO()
+    with JsonlSink(out) as sink:
+        sink.write('src "1"', rs)
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [(d['type'], d['start'], d['end'], d['candidate'], d['valid'], d['error']) for d in rows] == \
+           [fields(r) for r in rs]
+    assert [d['message'] for d in rows] == [r.message for r in rs]
+    assert {d['source'] for d in rows} == {'src "1"'}
+    assert list(rows[0]) == FIELDS
+
+
+def test_csv_matches_csv_writer():
+    rs = records()
+    out = io.StringIO()
+    with CsvSink(out) as sink:
+        sink.write('src,1', rs)
+    expected = io.StringIO()
+    csv.writer(expected, lineterminator='\n').writerows(
+        [FIELDS] + [('src,1', r.entity_type, r.start, r.end, r.raw, int(r.valid), r.error.name, r.message)
+                    for r in rs])
+    assert out.getvalue() == expected.getvalue()
+    rows = list(csv.DictReader(io.StringIO(out.getvalue(), newline='')))
+    assert [(d['type'], int(d['start']), int(d['end']), d['candidate'], d['valid'] == '1', d['error'])
+            for d in rows] == [fields(r) for r in rs]
+
+
+def test_columnar_round_trip(tmp_path):
+    rs = records()
+    path = tmp_path / 'out.cols'
+    with ColumnarSink(path) as sink:
+        sink.write('first', rs[:10])
+        sink.write('second', rs[10:])
+        sink.write('first', rs[:1])
+    header, cols = read_columnar(path)
+    assert header['rows'] == len(rs) + 1 and header['sources'] == ['first', 'second']
+    got = [(header['types'][cols['type'][i]], cols['start'][i], cols['end'][i], cols['candidate'][i],
+            bool(cols['valid'][i]), ErrorCode(cols['error'][i]).name)
+           for i in range(header['rows'])]
+    assert got == [fields(r) for r in rs + rs[:1]]
+    assert list(cols['source']) == [0] * 10 + [1] * (len(rs) - 10) + [0]
+
+
+def test_read_columnar_rejects_other_files(tmp_path):
+    path = tmp_path / 'not.cols'
+    path.write_bytes(b'plain text')
+    with pytest.raises(ValueError):
+        read_columnar(path)
+
+
+@pytest.mark.parametrize('fmt', ['text', 'jsonl', 'csv', 'columnar'])
+def test_main_writes_every_format(tmp_path, fmt):
+    output = tmp_path / f'out.{fmt}'
+    assert sinks.main([SAMPLE, '--format', fmt, '--output', str(output)]) == 0
+    count = len(list(file_results(sample_text())))
+    if fmt == 'columnar':
+        assert read_columnar(output)[0]['rows'] == count
+        return
+    written = output.read_bytes()
+    # Lines end in '\n' on every platform
+    assert b'\r\n' not in written
+    if fmt == 'jsonl':
+        assert len(written.splitlines()) == count
+    elif fmt == 'csv':
+        assert len(list(csv.reader(io.StringIO(written.decode('utf-8'), newline='')))) == count + 1
+
+
+def test_columnar_needs_an_output_file():
+    with pytest.raises(ValueError):
+        sinks.open_sink('columnar')
@@ -0,0 +1,53 @@
+"""Chunked streaming extraction (streaming.py) against a whole-file scan."""
+import pytest
+
+import all_validations as av
+import streaming
+
+SAMPLE = 'api_response.txt'
+
+
+def check_equivalence(path, chunk_size, overlap):
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    assert list(streaming.stream_matches(path, chunk_size, overlap)) == list(av.scan(text))
+
+    streamed = {}
+    for kind, candidate, result in streaming.stream_results(path, chunk_size, overlap):
+        streamed.setdefault(kind, set()).add((candidate, result))
+    for kind, pairs in av.validate_all(text).items():
+        assert streamed.get(kind, set()) == set(pairs), kind
+
+
+# Tiny chunks so that entities straddle chunk boundaries
+@pytest.mark.parametrize('chunk_size', [1, 7, 13, 31, 64, 1024])
+def test_sample_matches_whole_file(chunk_size):
+    check_equivalence(SAMPLE, chunk_size, overlap=64)
+
+
+@pytest.mark.parametrize('chunk_size', [4099, 65536])
+def test_larger_input_matches_whole_file(tmp_path, chunk_size):
+    with open(SAMPLE, 'r', encoding='utf-8') as f:
+        sample = f.read()
+    path = tmp_path / 'prose.txt'
+    path.write_text(('Nothing to see on this line.\n' * 19 + sample) * 40, encoding='utf-8')
+    check_equivalence(path, chunk_size, overlap=256)
+
+
+def long_run_text():
+    # A base64-like run of 10,000 characters with an '@' in the middle, longer than
+    # DEFAULT_OVERLAP, then a digit run the card pattern splits into 16-digit pieces
+    run = ''.join('ab1Cd2eF3g'[i % 10] for i in range(10_000))
+    digits = ''.join(str(i * 7 % 10) for i in range(9_001))
+    return ('x ' * 3000 + run[:5000] + '@' + run[5000:] + '.com at 14:30 for $5.00\n'
+            + 'y ' * 3000 + digits + ' end\nmail user@example.com\n')
+
+
+@pytest.mark.parametrize('chunk_size', [1000, 4096, 7000, streaming.DEFAULT_CHUNK_SIZE])
+def test_runs_longer_than_the_overlap(tmp_path, chunk_size):
+    path = tmp_path / 'long_run.txt'
+    path.write_text(long_run_text(), encoding='utf-8')
+    check_equivalence(path, chunk_size, streaming.DEFAULT_OVERLAP)
+    emails = [candidate for kind, candidate, result in streaming.stream_results(path, chunk_size)
+              if kind == 'email']
+    assert len(emails[0]) == 10_005
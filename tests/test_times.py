@@ -0,0 +1,132 @@
+"""The time scanner (extractors/times.py) and the records built from its groups."""
+import datetime
+import random
+
+import pytest
+
+import all_validations as av
+import results
+from entity_index import KeepAll
+from extractors.times import (
+    compiled_time_scanner, extract_times, groups_message, groups_time, parse_time, time_message,
+    time_messages, time_results, TIME_MESSAGES, TIME_STATUS_CODES, validate_time, written_seconds
+)
+from records import ERROR_MESSAGES
+from results import ErrorCode, check_time
+from tests.inputs import gen_time, old_validate_time, time_log
+
+UTC = datetime.timezone.utc
+
+# candidate -> value, or the error message
+PARSE_CASES = {
+    '14:30': datetime.time(14, 30),
+    '2:30 PM': datetime.time(14, 30),
+    '12:59am': datetime.time(0, 59),
+    '14:30:15': datetime.time(14, 30, 15),
+    '2:30:15 pm': datetime.time(14, 30, 15),
+    '14:30:60': "Invalid: Second out of range (0-59)",
+    '25:00': "Invalid: Hour out of range for 24-hour format (0-23)",
+    '0:15 AM': "Invalid: Hour out of range for 12-hour format (1-12)",
+    '09:00-17:30': (datetime.time(9), datetime.time(17, 30)),
+    '09:00–17:30': (datetime.time(9), datetime.time(17, 30)),
+    '9:00 AM to 5:30 PM': (datetime.time(9), datetime.time(17, 30)),
+    '22:00 - 06:00': (datetime.time(22), datetime.time(6)),
+    '10:00-24:00': "Invalid: Hour out of range for 24-hour format (0-23)",
+    '2025-09-26T14:30:00Z': datetime.datetime(2025, 9, 26, 14, 30, tzinfo=UTC),
+    '2025-09-26T14:30Z': datetime.datetime(2025, 9, 26, 14, 30, tzinfo=UTC),
+    '2025-09-26 14:30:05.25': datetime.datetime(2025, 9, 26, 14, 30, 5, 250000),
+    '2025-09-26T14:30:00-0330': datetime.datetime(
+        2025, 9, 26, 14, 30, tzinfo=datetime.timezone(-datetime.timedelta(hours=3, minutes=30))),
+    '2025-02-30T10:00:00Z': "Invalid: Date out of range",
+    '2025-09-26T24:00:00Z': "Invalid: Hour out of range for 24-hour format (0-23)",
+    '14.30': "Invalid: Doesn't match H:MM or H:MM AM/PM pattern",
+}
+
+EXTRACT_CASES = {
+    "Meeting at 14:30:15, or maybe 25:00": ['14:30:15', '25:00'],
+    "Open 09:00–17:30 weekdays, 9:00 AM to 1:00 PM Saturday": ['09:00–17:30', '9:00 AM to 1:00 PM'],
+    "deployed 2025-09-26T14:30:00Z by ci": ['2025-09-26T14:30:00Z'],
+    "ts=2025-09-26T14:30:00.123+02:00 level=info at 2:30 PM": ['2025-09-26T14:30:00.123+02:00', '2:30 PM'],
+    "build 2025-09-26 without a time, v1:2 and 1:2:3": [],
+}
+
+
+@pytest.mark.parametrize('candidate, expected', PARSE_CASES.items())
+def test_parse(candidate, expected):
+    message, value = parse_time(candidate)
+    if isinstance(expected, str):
+        assert value is None and message == expected
+    else:
+        assert value == expected and message.startswith("Valid")
+    result = check_time(candidate)
+    assert result.message == validate_time(candidate)
+    assert result.value == value
+
+
+@pytest.mark.parametrize('candidate', [c for c in PARSE_CASES if c != '14.30'])
+def test_groups_message_matches_groups_time(candidate):
+    groups = compiled_time_scanner().fullmatch(candidate).groups()
+    status, value, clock = groups_time(groups)
+    expected = time_message(value, clock, written_seconds(candidate)) if value is not None else TIME_MESSAGES[status]
+    assert groups_message(groups) == expected
+
+
+def test_messages_are_the_records():
+    for status, code in TIME_STATUS_CODES.items():
+        assert TIME_MESSAGES[status] == ERROR_MESSAGES[code]
+
+
+def test_check_time_records():
+    assert check_time('2:30 PM').detail == 12
+    assert check_time('14:30:60').error == ErrorCode.TIME_SECOND
+    assert check_time('2025-02-30T10:00:00Z').error == ErrorCode.TIME_DATE
+    assert validate_time('2025-09-26T14:30:00Z') == "Valid ISO 8601 date-time (normalized: 2025-09-26T14:30:00+00:00)"
+    assert validate_time('9:00 AM to 5:30 PM') == "Valid time range (normalized: 09:00-17:30)"
+
+
+# Seconds written as :00 are part of the normalized form
+ZERO_SECONDS = {
+    '14:30:00': "Valid 24-hour time (normalized: 14:30:00)",
+    '2:30:00 PM': "Valid 12-hour time (normalized: 02:30:00 PM)",
+    '09:00:00-17:30': "Valid time range (normalized: 09:00:00-17:30:00)",
+    '14:30': "Valid 24-hour time (normalized: 14:30)",
+}
+
+
+@pytest.mark.parametrize('candidate, message', ZERO_SECONDS.items())
+def test_zero_seconds_are_kept(candidate, message):
+    groups = compiled_time_scanner().fullmatch(candidate).groups()
+    assert validate_time(candidate) == parse_time(candidate)[0] == groups_message(groups) == message
+    assert check_time(candidate).message == message
+    assert time_results(candidate) == [(candidate, message, parse_time(candidate)[1])]
+
+
+@pytest.mark.parametrize('text, expected', EXTRACT_CASES.items())
+def test_extract(text, expected):
+    assert extract_times(text) == expected
+    assert av.extract_all(text)['time'] == expected
+
+
+def test_scan_paths_agree_with_validate_time():
+    text = time_log(5_000) + '\n'.join(PARSE_CASES) + '\n' + '\n'.join(EXTRACT_CASES)
+    assert av.validate_all(text)['time'] == [(c, validate_time(c)) for c in av.extract_all(text)['time']]
+    for result in results.extract_results(text):
+        if result.entity_type == 'time':
+            expected = check_time(result.raw, result.start, result.end)
+            assert (result.error, result.value, result.detail) == (expected.error, expected.value, expected.detail)
+
+
+@pytest.mark.parametrize('every', [False, True])
+def test_single_scanner_matches_scan_then_parse(every):
+    text = time_log(5_000)
+    dedup = KeepAll if every else lambda: None
+    expected = [(c, validate_time(c)) for c in extract_times(text, dedup())]
+    assert [(c, message) for c, message, _ in time_results(text, dedup())] == expected
+    assert time_messages(text, dedup()) == expected
+
+
+def test_clock_times_match_previous_validator():
+    rng = random.Random(0)
+    for _ in range(20_000):
+        candidate = gen_time(rng)
+        assert validate_time(candidate) == old_validate_time(candidate), candidate
@@ -0,0 +1,112 @@
+"""Bounded LRU validation cache (validation_cache.py)."""
+import pytest
+
+import all_validations as av
+import batch
+from validation_cache import ValidationCache
+
+CANDIDATES = [
+    ('email', 'user@example.com'),
+    ('email', 'hello@@world.com'),
+    ('phone', '(123) 456-7890'),
+    ('phone', '+254 712 345 678'),
+    ('credit_card', '4111 1111 1111 1111'),
+    ('credit_card', '0000 1111 2222 3333'),
+    ('currency', '$1,234.56'),
+    ('currency', '$12.3'),
+    ('time', '2:30 PM'),
+    ('time', '25:00'),
+]
+
+
+class CountingValidators(dict):
+    """VALIDATORS that count how often each candidate is really validated."""
+    def __init__(self):
+        super().__init__({kind: self.counted(kind, validate) for kind, validate in av.VALIDATORS.items()})
+        self.calls = {}
+
+    def counted(self, kind, validate):
+        def wrapper(candidate):
+            self.calls[kind, candidate] = self.calls.get((kind, candidate), 0) + 1
+            return validate(candidate)
+        return wrapper
+
+
+@pytest.mark.parametrize('hash_cards', [False, True])
+def test_results_match_validators(hash_cards):
+    cache = ValidationCache(capacity=4, hash_cards=hash_cards)
+    for _ in range(3):
+        for kind, candidate in CANDIDATES:
+            assert cache.validate(kind, candidate) == av.VALIDATORS[kind](candidate)
+
+
+def test_hits_validate_once():
+    validators = CountingValidators()
+    cache = ValidationCache(capacity=len(CANDIDATES), validators=validators)
+    for _ in range(3):
+        for kind, candidate in CANDIDATES:
+            cache.validate(kind, candidate)
+    assert set(validators.calls.values()) == {1}
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (20, 10, 0)
+    assert stats['size'] == 10 and stats['hit_rate'] == pytest.approx(2 / 3)
+
+
+def test_types_are_cached_apart():
+    cache = ValidationCache()
+    # '12:30' is a valid time and not a phone: the two results must not share an entry
+    assert cache.validate('time', '12:30') == av.validate_time('12:30')
+    assert cache.validate('phone', '12:30') == av.validate_phone('12:30')
+    assert cache.stats()['misses'] == 2
+
+
+def test_least_recently_used_is_evicted():
+    validators = CountingValidators()
+    cache = ValidationCache(capacity=2, validators=validators)
+    cache.validate('email', 'a@example.com')
+    cache.validate('email', 'b@example.com')
+    # Using a makes b the least recently used
+    cache.validate('email', 'a@example.com')
+    cache.validate('email', 'c@example.com')
+    assert cache.stats()['evictions'] == 1
+    cache.validate('email', 'a@example.com')
+    assert validators.calls['email', 'a@example.com'] == 1
+    cache.validate('email', 'b@example.com')
+    assert validators.calls['email', 'b@example.com'] == 2
+    assert len(cache.entries) == 2
+
+
+def test_clear_invalidates_entries():
+    validators = CountingValidators()
+    cache = ValidationCache(validators=validators)
+    cache.validate('currency', '$1,234.56')
+    cache.clear()
+    assert cache.stats() == {'size': 0, 'capacity': cache.capacity, 'hits': 0, 'misses': 0,
+                             'evictions': 0, 'hit_rate': 0.0}
+    cache.validate('currency', '$1,234.56')
+    assert validators.calls['currency', '$1,234.56'] == 2
+
+
+def test_hashed_card_keys():
+    cache = ValidationCache(hash_cards=True)
+    card = '4111 1111 1111 1111'
+    cache.validate('credit_card', card)
+    cache.validate('credit_card', card)
+    assert cache.stats()['hits'] == 1
+    (kind, key), = cache.entries
+    assert kind == 'credit_card' and isinstance(key, bytes) and card.encode() not in key
+    # Keys are secret per cache: another cache digests the same card differently
+    assert ValidationCache(hash_cards=True).key('credit_card', card) != (kind, key)
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        ValidationCache(capacity=0)
+
+
+def test_batch_output_does_not_depend_on_the_cache(tmp_path):
+    path = tmp_path / 'repeated.txt'
+    with open('api_response.txt', 'r', encoding='utf-8') as f:
+        path.write_text(f.read() * 5, encoding='utf-8')
+    cached = batch.run_batch([str(path)], workers=1, cache_size=3)
+    assert cached == batch.run_batch([str(path)], workers=1, cache_size=0)
@@ -0,0 +1,67 @@
+import hashlib
+import os
+from collections import OrderedDict
+
+from all_validations import VALIDATORS
+
+##VALIDATION CACHE
+# API responses repeat the same values a lot (support emails, merchant phone numbers,
+# standard prices), and the scripts only deduplicate within one file. ValidationCache
+# keeps the most recently used (entity type, candidate) -> result pairs across files,
+# up to `capacity` entries, so a repeated value is validated once per process.
+#
+# With hash_cards=True card numbers are never stored: their key is a keyed BLAKE2b
+# digest with a random per-cache secret, and the cached message only names the issuer.
+DEFAULT_CAPACITY = 100_000
+
+class ValidationCache:
+    def __init__(self, capacity=DEFAULT_CAPACITY, hash_cards=False, validators=None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.hash_cards = hash_cards
+        self.validators = validators or VALIDATORS
+        self.entries = OrderedDict()
+        self.secret = os.urandom(16)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, kind, candidate):
+        if self.hash_cards and kind == 'credit_card':
+            digest = hashlib.blake2b(candidate.encode('utf-8'), digest_size=16, key=self.secret).digest()
+            return kind, digest
+        return kind, candidate
+
+    def validate(self, kind, candidate):
+        """Returns VALIDATORS[kind](candidate), from the cache when possible."""
+        key = self.key(kind, candidate)
+        entries = self.entries
+        result = entries.get(key)
+        if result is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return result
+
+        self.misses += 1
+        result = self.validators[kind](candidate)
+        entries[key] = result
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.entries),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0